@@ -1,3 +1,25 @@
-from .pdf_reader import PDFExtraction, PageContent, extract_pdf, parse_page_spec
+from .pdf_reader import (
+    CompactionStats,
+    PDFExtraction,
+    PageContent,
+    Section,
+    compact_extraction,
+    count_tokens,
+    extract_pdf,
+    extract_pdf_bytes,
+    iter_extraction,
+    parse_page_spec,
+)
 
-__all__ = ["extract_pdf", "parse_page_spec", "PDFExtraction", "PageContent"]
+__all__ = [
+    "compact_extraction",
+    "count_tokens",
+    "extract_pdf",
+    "extract_pdf_bytes",
+    "iter_extraction",
+    "parse_page_spec",
+    "CompactionStats",
+    "PDFExtraction",
+    "PageContent",
+    "Section",
+]
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import fitz  # PyMuPDF
+
+# Support both package import (PDF_Reader.benchmark) and Docker (flat module)
+try:
+    from PDF_Reader.pdf_reader import extract_pdf
+except ModuleNotFoundError:
+    from pdf_reader import extract_pdf
+
+
+def synthesize_pdf(path: Path, pages: int, images_per_page: int = 2) -> Path:
+    """Write a portfolio-like PDF: a heading, body text, and a few raster images per page."""
+    doc = fitz.open()
+    for number in range(1, pages + 1):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Project {number}", fontsize=18)
+        body = " ".join(f"Line {line}: implemented feature {number}-{line} with tests." for line in range(20))
+        page.insert_textbox(fitz.Rect(72, 100, 540, 400), body, fontsize=10)
+        for image_index in range(images_per_page):
+            pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 400, 300), False)
+            pix.set_rect(pix.irect, ((number * 40) % 255, (image_index * 90) % 255, 128))
+            top = 420 + image_index * 160
+            page.insert_image(fitz.Rect(72, top, 312, top + 150), pixmap=pix)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def run_benchmark(pdf_path: Path, worker_counts: Sequence[int], repeat: int = 3) -> Dict[str, Any]:
+    """Time extract_pdf for each worker count; the threshold is disabled so every count is exercised."""
+    results: List[Dict[str, Any]] = []
+    baseline: Optional[float] = None
+    for workers in worker_counts:
+        # Warm-up run spawns the pool so process startup isn't counted.
+        extraction = extract_pdf(pdf_path, workers=workers, parallel_threshold=0)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            extract_pdf(pdf_path, workers=workers, parallel_threshold=0)
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        if baseline is None:
+            baseline = best
+        results.append(
+            {
+                "workers": workers,
+                "best_seconds": round(best, 4),
+                "mean_seconds": round(sum(timings) / len(timings), 4),
+                "pages_per_second": round(len(extraction.pages) / best, 2) if best else None,
+                "speedup": round(baseline / best, 3) if best else None,
+            }
+        )
+    return {
+        "pdf_path": str(pdf_path),
+        "page_count": extraction.page_count,
+        "cpu_count": os.cpu_count(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark 1->N worker scaling of extract_pdf.")
+    parser.add_argument("--pdf", help="PDF to benchmark (default: synthesize one).")
+    parser.add_argument("--pages", type=int, default=80, help="Pages in the synthesized PDF (default: 80).")
+    parser.add_argument(
+        "--workers",
+        default="1,2,4,8",
+        help="Comma-separated worker counts to compare (default: 1,2,4,8).",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per worker count (default: 3).")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    worker_counts = [int(part) for part in args.workers.split(",") if part.strip()]
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(args.pdf) if args.pdf else synthesize_pdf(Path(tmp) / "synthetic.pdf", args.pages)
+        report = run_benchmark(pdf_path, worker_counts, repeat=args.repeat)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
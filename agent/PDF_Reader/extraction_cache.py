@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+# Support both package import (PDF_Reader.extraction_cache) and Docker (flat module)
+try:
+    from PDF_Reader.pdf_reader import (
+        PDFExtraction,
+        PageContent,
+        _normalize_path,
+        _resolve_page_indices,
+        extract_pdf,
+        extract_pdf_bytes,
+    )
+except ModuleNotFoundError:
+    from pdf_reader import (
+        PDFExtraction,
+        PageContent,
+        _normalize_path,
+        _resolve_page_indices,
+        extract_pdf,
+        extract_pdf_bytes,
+    )
+
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_key TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    options TEXT NOT NULL,
+    page_count INTEGER NOT NULL,
+    metadata TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    last_access REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    doc_key TEXT NOT NULL,
+    page_number INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (doc_key, page_number)
+);
+CREATE INDEX IF NOT EXISTS idx_documents_last_access ON documents (last_access);
+"""
+
+
+def hash_file(path: Union[str, Path]) -> str:
+    """Return the sha256 hex digest of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    SQLite-backed cache of extracted page text, keyed by PDF content hash and options.
+
+    Pages are stored individually, so a request for a subset of pages is served
+    from whatever is already cached and only the missing pages are extracted.
+    Documents are evicted least-recently-used first once the stored text
+    exceeds `max_bytes`.
+    """
+
+    def __init__(self, db_path: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            # WAL lets several server workers read while one writes.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _doc_key(content_hash: str, options: Dict[str, Any]) -> str:
+        payload = json.dumps({"content": content_hash, "options": options}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def extract(
+        self,
+        file_path: Union[str, Path],
+        page_numbers: Optional[Sequence[int]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        **extract_kwargs: Any,
+    ) -> Tuple[PDFExtraction, str]:
+        """
+        Extract pages of a PDF file through the cache.
+
+        Returns:
+            (extraction, status) where status is "hit", "partial", or "miss".
+        """
+        path = _normalize_path(file_path)
+        return self._extract_cached(
+            content_hash=hash_file(path),
+            display_path=path,
+            page_numbers=page_numbers,
+            options=options or {},
+            extract_fn=lambda numbers: extract_pdf(path, page_numbers=numbers, **extract_kwargs),
+        )
+
+    def extract_bytes(
+        self,
+        data: bytes,
+        page_numbers: Optional[Sequence[int]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        name: str = "upload.pdf",
+        **extract_kwargs: Any,
+    ) -> Tuple[PDFExtraction, str]:
+        """Same as extract(), for in-memory PDF bytes."""
+        return self._extract_cached(
+            content_hash=hashlib.sha256(data).hexdigest(),
+            display_path=Path(name),
+            page_numbers=page_numbers,
+            options=options or {},
+            extract_fn=lambda numbers: extract_pdf_bytes(
+                data, page_numbers=numbers, name=name, **extract_kwargs
+            ),
+        )
+
+    def _extract_cached(
+        self,
+        content_hash: str,
+        display_path: Path,
+        page_numbers: Optional[Sequence[int]],
+        options: Dict[str, Any],
+        extract_fn: Callable[[Optional[Sequence[int]]], PDFExtraction],
+    ) -> Tuple[PDFExtraction, str]:
+        doc_key = self._doc_key(content_hash, options)
+
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT page_count, metadata FROM documents WHERE doc_key = ?", (doc_key,)
+            ).fetchone()
+
+        if row is None:
+            extraction = extract_fn(page_numbers)
+            self._store(doc_key, content_hash, options, extraction)
+            with self._lock:
+                self.misses += 1
+            return extraction, "miss"
+
+        page_count, metadata_json = row
+        wanted = [idx + 1 for idx in _resolve_page_indices(page_numbers, page_count)]
+        cached = self._load_pages(doc_key, wanted)
+        missing = [number for number in wanted if number not in cached]
+
+        if missing:
+            fresh = extract_fn(missing)
+            self._store(doc_key, content_hash, options, fresh)
+            cached.update({page.page_number: page.text for page in fresh.pages})
+
+        with self._lock:
+            if missing:
+                self.partial_hits += 1
+            else:
+                self.hits += 1
+            self._connect().execute(
+                "UPDATE documents SET last_access = ? WHERE doc_key = ?", (time.time(), doc_key)
+            )
+            self._conn.commit()
+
+        extraction = PDFExtraction(
+            path=display_path,
+            page_count=page_count,
+            pages=[PageContent(page_number=number, text=cached[number]) for number in wanted],
+            metadata=json.loads(metadata_json),
+        )
+        return extraction, "partial" if missing else "hit"
+
+    def _load_pages(self, doc_key: str, page_numbers: List[int]) -> Dict[int, str]:
+        if not page_numbers:
+            return {}
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT page_number, text FROM pages WHERE doc_key = ?", (doc_key,)
+            ).fetchall()
+        wanted = set(page_numbers)
+        return {number: text for number, text in rows if number in wanted}
+
+    def _store(
+        self,
+        doc_key: str,
+        content_hash: str,
+        options: Dict[str, Any],
+        extraction: PDFExtraction,
+    ) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT INTO documents (doc_key, content_hash, options, page_count, metadata, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(doc_key) DO UPDATE SET last_access = excluded.last_access",
+                    (
+                        doc_key,
+                        content_hash,
+                        json.dumps(options, sort_keys=True),
+                        extraction.page_count,
+                        json.dumps(extraction.metadata, ensure_ascii=False),
+                        now,
+                    ),
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO pages (doc_key, page_number, text) VALUES (?, ?, ?)",
+                    [(doc_key, page.page_number, page.text) for page in extraction.pages],
+                )
+                conn.execute(
+                    "UPDATE documents SET size_bytes = "
+                    "(SELECT COALESCE(SUM(LENGTH(CAST(text AS BLOB))), 0) FROM pages WHERE doc_key = ?) "
+                    "WHERE doc_key = ?",
+                    (doc_key, doc_key),
+                )
+                self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (total,) = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM documents").fetchone()
+        if total <= self.max_bytes:
+            return
+        for doc_key, size in conn.execute(
+            "SELECT doc_key, size_bytes FROM documents ORDER BY last_access ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM pages WHERE doc_key = ?", (doc_key,))
+            conn.execute("DELETE FROM documents WHERE doc_key = ?", (doc_key,))
+            total -= size
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters (this process) and current cache size."""
+        with self._lock:
+            documents, size = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM documents"
+            ).fetchone()
+        return {
+            "db_path": str(self.db_path),
+            "documents": documents,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "partial_hits": self.partial_hits,
+            "misses": self.misses,
+        }
@@ -1,18 +1,108 @@
 from __future__ import annotations
 
 import argparse
+import glob
+import hashlib
 import json
-from dataclasses import dataclass
+import multiprocessing
+import os
+import re
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import List, Optional, Sequence, Union
+from typing import Dict, Iterator, List, Optional, Sequence, Set, TextIO, Tuple, Union
 
 import fitz  # PyMuPDF
 
+# Below this many pages, process startup/IPC costs more than extracting in-process.
+PARALLEL_PAGE_THRESHOLD = 24
+# Don't hand a worker fewer pages than this; tiny ranges are dominated by fitz.open().
+MIN_PAGES_PER_WORKER = 4
+
+# A PDF is read either from a file path or from in-memory bytes.
+PDFSource = Union[str, Path, bytes]
+
+# Compaction: a line found on at least this share of pages (and on at least
+# MIN_REPEAT_PAGES pages) is treated as a running header/footer and dropped.
+REPEATED_LINE_RATIO = 0.5
+MIN_REPEAT_PAGES = 3
+# Only this many non-empty lines at the top and bottom of a page are header/footer candidates.
+EDGE_LINES = 2
+
+# "7", "- 7 -", "Page 7", "p. 7", "7 / 12", "7 of 12". Not list markers like "1)" or "(2)"; a bare
+# number only counts at a page edge and when it follows the page sequence (see _is_page_number).
+_PAGE_NUMBER_RE = re.compile(
+    r"^(?:(?P<dash>[-–—])\s*)?(?:(?:page|p\.)\s*)?(?P<number>\d{1,4})"
+    r"(?:\s*(?:/|of)\s*(?P<total>\d{1,4}))?(?(dash)\s*[-–—])$",
+    re.IGNORECASE,
+)
+_BULLET_RE = re.compile(r"^(?:[•◦▪▫●○■□◆◇▶►▷✓✔*·-]|(?:\d{1,2}|[A-Za-z])[.)]\s)")
+_SENTENCE_END = tuple('.!?:;。…)]"\'”’')
+
+# Layout mode: a short block this much larger than the page's body font (or bold) is a heading.
+HEADING_SIZE_RATIO = 1.15
+HEADING_MAX_CHARS = 80
+_PROJECT_RE = re.compile(
+    r"project|프로젝트|\b(?:19|20)\d{2}\s*[.\-/년]\s*\d{1,2}\s*월?\s*[~–-]",
+    re.IGNORECASE,
+)
+
+# One extraction pool per process, sized to the CPU count; a job uses as many workers as it has page ranges.
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+@dataclass
+class Section:
+    kind: str  # "heading", "project", or "bullets"
+    title: str
+    page_number: int  # 1-based
+    start: int  # character offsets into the page text
+    end: int
+    level: int = 0  # 1 for the largest headings, 2 otherwise; 0 for bullet blocks
+    font_size: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "kind": self.kind,
+            "title": self.title,
+            "page_number": self.page_number,
+            "start": self.start,
+            "end": self.end,
+            "level": self.level,
+            "font_size": self.font_size,
+        }
+
 
 @dataclass
 class PageContent:
     page_number: int  # 1-based
     text: str
+    sections: Optional[List[Section]] = None  # only set by layout extraction
+
+
+@dataclass
+class CompactionStats:
+    chars_before: int
+    chars_after: int
+    tokens_before: int
+    tokens_after: int
+    removed_lines: int
+    token_method: str  # "tiktoken" or "estimate"
+
+    def as_dict(self) -> dict:
+        return {
+            "chars_before": self.chars_before,
+            "chars_after": self.chars_after,
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+            "removed_lines": self.removed_lines,
+            "token_method": self.token_method,
+        }
 
 
 @dataclass
@@ -21,9 +111,10 @@ class PDFExtraction:
     page_count: int
     pages: List[PageContent]
     metadata: dict
+    compaction: Optional[CompactionStats] = None
 
     def as_dict(self) -> dict:
-        return {
+        data = {
             "path": str(self.path),
             "page_count": self.page_count,
             "metadata": self.metadata,
@@ -31,6 +122,30 @@ class PDFExtraction:
                 {"page_number": page.page_number, "text": page.text} for page in self.pages
             ],
         }
+        if self.compaction is not None:
+            data["compaction"] = self.compaction.as_dict()
+        sections = self.sections
+        if sections is not None:
+            data["sections"] = [section.as_dict() for section in sections]
+        return data
+
+    @property
+    def sections(self) -> Optional[List[Section]]:
+        """Section index across all pages in page order, or None if not extracted with layout."""
+        if all(page.sections is None for page in self.pages):
+            return None
+        return [section for page in self.pages for section in page.sections or []]
+
+    def section_text(self, section: Section) -> str:
+        """Return the text a section covers."""
+        for page in self.pages:
+            if page.page_number == section.page_number:
+                return page.text[section.start : section.end]
+        raise ValueError(f"Page {section.page_number} is not part of this extraction.")
+
+    def full_text(self, separator: str = "\n\n") -> str:
+        """Join the non-empty page texts in page order."""
+        return separator.join(page.text for page in self.pages if page.text)
 
     @classmethod
     def from_dict(cls, data: dict) -> "PDFExtraction":
@@ -39,24 +154,412 @@ class PDFExtraction:
             PageContent(page_number=p["page_number"], text=p["text"])
             for p in data.get("pages", [])
         ]
+        if "sections" in data:
+            by_page: Dict[int, List[Section]] = {page.page_number: [] for page in pages}
+            for section in data["sections"]:
+                by_page.setdefault(section["page_number"], []).append(Section(**section))
+            for page in pages:
+                page.sections = by_page[page.page_number]
+        compaction = data.get("compaction")
         return cls(
             path=Path(data["path"]),
             page_count=data["page_count"],
             pages=pages,
             metadata=data.get("metadata", {}),
+            compaction=CompactionStats(**compaction) if compaction else None,
         )
 
 
 def extract_pdf(
-    file_path: Union[str, Path], page_numbers: Optional[Sequence[int]] = None
+    file_path: Union[str, Path],
+    page_numbers: Optional[Sequence[int]] = None,
+    workers: Optional[int] = None,
+    parallel_threshold: int = PARALLEL_PAGE_THRESHOLD,
+    layout: bool = False,
 ) -> PDFExtraction:
-    """Extract text and metadata from a PDF."""
+    """
+    Extract text and metadata from a PDF.
+
+    When at least `parallel_threshold` pages are requested, the pages are split
+    into contiguous ranges and extracted by worker processes (each opening its
+    own document). `workers=None` picks a count from the CPU count; `workers=1`
+    forces in-process extraction.
+
+    `layout=True` rebuilds page text from PyMuPDF text blocks and attaches a
+    section index (headings, project entries, bullet blocks) using font size
+    and weight; see `PDFExtraction.sections`.
+    """
     path = _normalize_path(file_path)
-    with fitz.open(path) as doc:
+    return _extract_source(path, path, page_numbers, workers, parallel_threshold, layout)
+
+
+def extract_pdf_bytes(
+    data: bytes,
+    page_numbers: Optional[Sequence[int]] = None,
+    name: str = "upload.pdf",
+    workers: Optional[int] = None,
+    parallel_threshold: int = PARALLEL_PAGE_THRESHOLD,
+    layout: bool = False,
+) -> PDFExtraction:
+    """
+    Extract text and metadata from in-memory PDF bytes (no file or temp file needed).
+
+    `name` is only used as the `path` of the returned PDFExtraction.
+    """
+    return _extract_source(bytes(data), Path(name), page_numbers, workers, parallel_threshold, layout)
+
+
+def _extract_source(
+    source: PDFSource,
+    display_path: Path,
+    page_numbers: Optional[Sequence[int]],
+    workers: Optional[int],
+    parallel_threshold: int,
+    layout: bool = False,
+) -> PDFExtraction:
+    with _open_source(source) as doc:
         page_indices = _resolve_page_indices(page_numbers, doc.page_count)
-        pages = [_read_page(doc, idx) for idx in page_indices]
         metadata = doc.metadata or {}
-        return PDFExtraction(path=path, page_count=doc.page_count, pages=pages, metadata=metadata)
+        page_count = doc.page_count
+        n_workers = _plan_workers(workers, len(page_indices), parallel_threshold)
+        if n_workers <= 1:
+            pages = [_read_page(doc, idx, layout) for idx in page_indices]
+
+    if n_workers > 1:
+        pages = _extract_pages_parallel(source, page_indices, n_workers, layout)
+    return PDFExtraction(path=display_path, page_count=page_count, pages=pages, metadata=metadata)
+
+
+def iter_extraction(
+    file_path: Union[str, Path],
+    page_numbers: Optional[Sequence[int]] = None,
+    layout: bool = False,
+) -> Iterator[dict]:
+    """
+    Yield a document record, then one record per page as soon as it is read.
+
+    Only the current page is held in memory, so this suits very large PDFs and
+    NDJSON streaming. Records: {"type": "document", ...}, {"type": "page", ...}.
+    """
+    path = _normalize_path(file_path)
+    with fitz.open(path) as doc:
+        page_indices = _resolve_page_indices(page_numbers, doc.page_count)
+        yield {
+            "type": "document",
+            "path": str(path),
+            "page_count": doc.page_count,
+            "metadata": doc.metadata or {},
+            "extracted_pages": [idx + 1 for idx in page_indices],
+        }
+        for idx in page_indices:
+            page = _read_page(doc, idx, layout)
+            record = {"type": "page", "page_number": page.page_number, "text": page.text}
+            if page.sections is not None:
+                record["sections"] = [section.as_dict() for section in page.sections]
+            yield record
+
+
+def compact_extraction(
+    extraction: PDFExtraction,
+    repeated_line_ratio: float = REPEATED_LINE_RATIO,
+    min_repeat_pages: int = MIN_REPEAT_PAGES,
+) -> PDFExtraction:
+    """
+    Return a copy of the extraction with text normalized for LLM prompts.
+
+    Drops running headers/footers (lines repeated across pages) and bare page
+    numbers, rejoins hyphenated and wrapped lines into paragraphs, and collapses
+    whitespace. Before/after character and token counts are attached as
+    `compaction`. Offsets no longer apply to the rewritten text, so any
+    section index is dropped.
+    """
+    page_lines = [
+        [" ".join(line.split()) for line in page.text.splitlines()] for page in extraction.pages
+    ]
+    repeated = _repeated_lines(page_lines, repeated_line_ratio, min_repeat_pages)
+    page_edges = [_edge_line_positions(lines) for lines in page_lines]
+    offset = _page_number_offset(extraction.pages, page_lines, page_edges)
+
+    removed = 0
+    pages: List[PageContent] = []
+    for page, lines, edges in zip(extraction.pages, page_lines, page_edges):
+        kept = []
+        for position, line in enumerate(lines):
+            if (
+                line
+                and position in edges
+                and (line in repeated or _is_page_number(line, page.page_number, offset))
+            ):
+                removed += 1
+                continue
+            kept.append(line)
+        pages.append(PageContent(page_number=page.page_number, text=_join_wrapped_lines(kept)))
+
+    before = "\n\n".join(page.text for page in extraction.pages)
+    after = "\n\n".join(page.text for page in pages)
+    tokens_before, method = count_tokens(before)
+    tokens_after, _ = count_tokens(after)
+    stats = CompactionStats(
+        chars_before=len(before),
+        chars_after=len(after),
+        tokens_before=tokens_before,
+        tokens_after=tokens_after,
+        removed_lines=removed,
+        token_method=method,
+    )
+    return replace(extraction, pages=pages, compaction=stats)
+
+
+def count_tokens(text: str) -> Tuple[int, str]:
+    """
+    Count prompt tokens with tiktoken when it is installed, else estimate.
+
+    The estimate assumes ~4 ASCII characters per token and one token per
+    non-ASCII character (Hangul syllables mostly encode to 1-2 tokens).
+
+    Returns:
+        (token count, "tiktoken" or "estimate")
+    """
+    encoding = _tiktoken_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=())), "tiktoken"
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars), "estimate"
+
+
+_TIKTOKEN_ENCODING: Optional[object] = None
+_TIKTOKEN_LOADED = False
+
+
+def _tiktoken_encoding():
+    global _TIKTOKEN_ENCODING, _TIKTOKEN_LOADED
+    if not _TIKTOKEN_LOADED:
+        _TIKTOKEN_LOADED = True
+        try:
+            import tiktoken
+
+            _TIKTOKEN_ENCODING = tiktoken.get_encoding("cl100k_base")
+        except Exception:  # not installed, or the encoding can't be downloaded
+            _TIKTOKEN_ENCODING = None
+    return _TIKTOKEN_ENCODING
+
+
+def _edge_line_positions(lines: List[str]) -> set:
+    """Positions of the first and last EDGE_LINES text lines, plus any page-number-like lines among them."""
+    filled = [position for position, line in enumerate(lines) if line]
+    return set(_edge_run(filled, lines) + _edge_run(filled[::-1], lines))
+
+
+def _edge_run(positions: List[int], lines: List[str]) -> List[int]:
+    # A page number above or below the header/footer doesn't use up one of its EDGE_LINES.
+    run: List[int] = []
+    text_lines = 0
+    for position in positions:
+        if text_lines >= EDGE_LINES:
+            break
+        run.append(position)
+        if not _PAGE_NUMBER_RE.match(lines[position]):
+            text_lines += 1
+    return run
+
+
+def _page_number_offset(pages: List[PageContent], page_lines: List[List[str]], page_edges: List[set]) -> Optional[int]:
+    """
+    Most common (printed number - page number) among edge lines, if seen on at least two pages.
+
+    Covers documents whose printed numbering doesn't start at the first page
+    (e.g., an unnumbered cover).
+    """
+    counts: Dict[int, int] = {}
+    for page, lines, edges in zip(pages, page_lines, page_edges):
+        offsets = set()
+        for position in edges:
+            match = _PAGE_NUMBER_RE.match(lines[position])
+            if match:
+                offsets.add(int(match.group("number")) - page.page_number)
+        for offset in offsets:
+            counts[offset] = counts.get(offset, 0) + 1
+    if not counts:
+        return None
+    offset, count = max(counts.items(), key=lambda item: item[1])
+    return offset if count >= 2 else None
+
+
+def _is_page_number(line: str, page_number: int, offset: Optional[int]) -> bool:
+    # A score or count on a page edge ("950") is kept: it has to match this page's number.
+    match = _PAGE_NUMBER_RE.match(line)
+    if not match:
+        return False
+    number = int(match.group("number"))
+    total = match.group("total")
+    if total is not None and int(total) < number:
+        return False
+    return number - page_number in {0, offset}
+
+
+def _repeated_lines(page_lines: List[List[str]], ratio: float, min_pages: int) -> set:
+    if len(page_lines) < min_pages:
+        return set()
+    counts: Dict[str, int] = {}
+    for lines in page_lines:
+        for line in {lines[position] for position in _edge_line_positions(lines)}:
+            counts[line] = counts.get(line, 0) + 1
+    threshold = max(min_pages, int(ratio * len(page_lines) + 0.5))
+    return {line for line, count in counts.items() if count >= threshold}
+
+
+def _join_wrapped_lines(lines: List[str]) -> str:
+    """Merge wrapped lines into paragraphs; blank lines and bullets start a new one."""
+    lengths = [len(line) for line in lines if line]
+    if not lengths:
+        return ""
+    # Lines much shorter than the page's typical width end a paragraph or are headings.
+    full_width = 0.6 * max(30, statistics.median(lengths))
+
+    paragraphs: List[str] = []
+    current = ""
+    previous = ""
+    for line in lines:
+        if not line:
+            if current:
+                paragraphs.append(current)
+                current = ""
+        elif not current:
+            current = line
+        elif previous.endswith("-") and previous[-2:-1].isalpha() and line[0].islower():
+            current = current[:-1] + line
+        elif (
+            len(previous) >= full_width
+            and not previous.endswith(_SENTENCE_END)
+            and not _BULLET_RE.match(line)
+        ):
+            current = f"{current} {line}"
+        else:
+            current = f"{current}\n{line}"
+        previous = line
+    if current:
+        paragraphs.append(current)
+    return "\n\n".join(paragraphs)
+
+
+def run_batch(
+    inputs: Sequence[Union[str, Path]],
+    out: TextIO,
+    workers: Optional[int] = None,
+    page_numbers: Optional[Sequence[int]] = None,
+    layout: bool = False,
+    compact: bool = False,
+    skip_hashes: Optional[Set[str]] = None,
+) -> dict:
+    """
+    Extract many PDFs across a process pool, writing one compact JSON line per document.
+
+    `inputs` are directories (searched recursively for *.pdf), glob patterns, or
+    files. Lines are written as documents finish, so the order follows
+    completion, not input. Files whose content hash is in `skip_hashes`, or
+    repeats of an earlier file in this run, are skipped. Each worker extracts
+    its document in-process.
+
+    Returns:
+        Throughput summary (documents, pages, seconds, docs/sec, pages/sec, ...).
+    """
+    seen = set(skip_hashes or ())
+    jobs: List[Tuple[str, str]] = []
+    skipped = 0
+    for path in _expand_batch_inputs(inputs):
+        content_hash = _hash_file(path)
+        if content_hash in seen:
+            skipped += 1
+            continue
+        seen.add(content_hash)
+        jobs.append((str(path), content_hash))
+
+    start = time.perf_counter()
+    documents = pages = failed = 0
+    if jobs:
+        n_workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = [
+                pool.submit(_batch_job, path, content_hash, page_numbers, layout, compact)
+                for path, content_hash in jobs
+            ]
+            for future in as_completed(futures):
+                record = future.result()
+                out.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+                out.flush()
+                if record["status"] == "completed":
+                    documents += 1
+                    pages += len(record["pages"])
+                else:
+                    failed += 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        "documents": documents,
+        "pages": pages,
+        "failed": failed,
+        "skipped": skipped,
+        "workers": n_workers if jobs else 0,
+        "seconds": round(elapsed, 3),
+        "docs_per_second": round(documents / elapsed, 2) if elapsed else None,
+        "pages_per_second": round(pages / elapsed, 2) if elapsed else None,
+    }
+
+
+def _expand_batch_inputs(inputs: Sequence[Union[str, Path]]) -> List[Path]:
+    paths: List[Path] = []
+    for item in inputs:
+        item_path = Path(item).expanduser()
+        if item_path.is_dir():
+            matches = sorted(item_path.rglob("*"))
+        elif item_path.is_file():
+            matches = [item_path]
+        else:
+            matches = sorted(Path(match) for match in glob.glob(str(item_path), recursive=True))
+        paths.extend(match.resolve() for match in matches if match.is_file() and match.suffix.lower() == ".pdf")
+    return list(dict.fromkeys(paths))
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _batch_job(
+    path: str,
+    content_hash: str,
+    page_numbers: Optional[Sequence[int]],
+    layout: bool,
+    compact: bool,
+) -> dict:
+    try:
+        extraction = extract_pdf(path, page_numbers=page_numbers, workers=1, layout=layout)
+        if compact:
+            extraction = compact_extraction(extraction)
+    except Exception as exc:
+        return {"path": path, "content_hash": content_hash, "status": "error", "error": str(exc)}
+    return {"path": path, "content_hash": content_hash, "status": "completed", **extraction.as_dict()}
+
+
+def _read_processed_hashes(path: Path) -> Set[str]:
+    """Content hashes of successfully extracted documents in an existing JSONL output."""
+    hashes: Set[str] = set()
+    if not path.is_file():
+        return hashes
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a partial last line from an interrupted run
+            if record.get("status") == "completed" and record.get("content_hash"):
+                hashes.add(record["content_hash"])
+    return hashes
 
 
 def parse_page_spec(spec: str) -> List[int]:
@@ -109,12 +612,163 @@ def _resolve_page_indices(page_numbers: Optional[Sequence[int]], total_pages: in
     return indices
 
 
-def _read_page(doc: fitz.Document, page_index: int) -> PageContent:
+def _plan_workers(workers: Optional[int], n_pages: int, parallel_threshold: int) -> int:
+    if workers is not None and workers <= 1:
+        return 1
+    if n_pages < parallel_threshold:
+        return 1
+    cpus = os.cpu_count() or 1
+    if workers is None:
+        workers = cpus
+    return max(1, min(workers, cpus, n_pages // MIN_PAGES_PER_WORKER))
+
+
+def _split_ranges(page_indices: Sequence[int], n_parts: int) -> List[List[int]]:
+    """Split indices into n_parts contiguous slices of near-equal size, keeping order."""
+    size, extra = divmod(len(page_indices), n_parts)
+    ranges = []
+    start = 0
+    for part in range(n_parts):
+        end = start + size + (1 if part < extra else 0)
+        if end > start:
+            ranges.append(list(page_indices[start:end]))
+        start = end
+    return ranges
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            # spawn: the server process is multi-threaded, so forking it is unsafe.
+            _POOL = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _POOL
+
+
+def shutdown_pool() -> None:
+    """Stop the page-extraction worker processes (e.g., at server shutdown)."""
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _open_source(source: PDFSource) -> fitz.Document:
+    if isinstance(source, bytes):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source)
+
+
+def _extract_page_range(source: PDFSource, page_indices: List[int], layout: bool = False) -> List[PageContent]:
+    with _open_source(source) as doc:
+        return [_read_page(doc, idx, layout) for idx in page_indices]
+
+
+def _extract_pages_parallel(
+    source: PDFSource, page_indices: Sequence[int], workers: int, layout: bool = False
+) -> List[PageContent]:
+    pool = _get_pool()
+    if isinstance(source, Path):
+        source = str(source)
+    futures = [
+        pool.submit(_extract_page_range, source, page_range, layout)
+        for page_range in _split_ranges(page_indices, workers)
+    ]
+    # Futures are consumed in submission order, so pages come back in the requested order.
+    pages: List[PageContent] = []
+    for future in futures:
+        pages.extend(future.result())
+    return pages
+
+
+def _read_page(doc: fitz.Document, page_index: int, layout: bool = False) -> PageContent:
     page = doc.load_page(page_index)
+    if layout:
+        return _read_page_layout(page, page_index + 1)
     text = page.get_text("text") or ""
     return PageContent(page_number=page_index + 1, text=text.strip())
 
 
+def _read_page_layout(page: fitz.Page, page_number: int) -> PageContent:
+    """
+    Build page text block by block and classify blocks by font.
+
+    The body font size is the size covering the most characters on the page.
+    Short blocks set larger than that (or in bold) are headings, and headings
+    that name a project or a date range are project entries. A heading's
+    section runs to the next heading on the page. Blocks whose lines are
+    mostly bullets become bullet sections, with adjacent ones merged.
+    """
+    blocks = []  # (lines, max font size, bold share)
+    size_chars: Counter = Counter()
+    for block in page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)["blocks"]:
+        if block.get("type") != 0:
+            continue
+        lines: List[str] = []
+        max_size = 0.0
+        chars = bold_chars = 0
+        for line in block["lines"]:
+            text = " ".join("".join(span["text"] for span in line["spans"]).split())
+            if not text:
+                continue
+            lines.append(text)
+            for span in line["spans"]:
+                n = len(span["text"].strip())
+                if not n:
+                    continue
+                chars += n
+                size_chars[round(span["size"], 1)] += n
+                max_size = max(max_size, span["size"])
+                if span["flags"] & fitz.TEXT_FONT_BOLD or "bold" in span["font"].lower():
+                    bold_chars += n
+        if lines:
+            blocks.append((lines, max_size, bold_chars / chars if chars else 0.0))
+
+    body_size = size_chars.most_common(1)[0][0] if size_chars else 0.0
+    texts: List[str] = []
+    sections: List[Section] = []
+    offset = 0
+    for lines, size, bold_share in blocks:
+        block_text = "\n".join(lines)
+        start, end = offset, offset + len(block_text)
+        texts.append(block_text)
+        offset = end + 1
+        bullets = sum(1 for line in lines if _BULLET_RE.match(line))
+
+        if bullets * 2 >= len(lines):
+            previous = sections[-1] if sections else None
+            if previous is not None and previous.kind == "bullets" and previous.end == start - 1:
+                previous.end = end
+            else:
+                sections.append(Section("bullets", lines[0][:HEADING_MAX_CHARS], page_number, start, end))
+        elif len(lines) <= 2 and len(block_text) <= HEADING_MAX_CHARS and (
+            size >= body_size * HEADING_SIZE_RATIO or (bold_share > 0.5 and size >= body_size)
+        ):
+            title = " ".join(lines)
+            sections.append(
+                Section(
+                    kind="project" if _PROJECT_RE.search(title) else "heading",
+                    title=title,
+                    page_number=page_number,
+                    start=start,
+                    end=end,
+                    level=1 if size >= body_size * 1.5 else 2,
+                    font_size=round(size, 1),
+                )
+            )
+
+    text = "\n".join(texts)
+    # Headings cover their content: extend each to the next heading (or the page end).
+    headings = [section for section in sections if section.kind != "bullets"]
+    for heading, following in zip(headings, headings[1:] + [None]):
+        heading.end = following.start - 1 if following is not None else len(text)
+    return PageContent(page_number=page_number, text=text, sections=sections)
+
+
 def _to_positive_int(value: Union[str, int]) -> int:
     if isinstance(value, int):
         if value <= 0:
@@ -131,11 +785,45 @@ def _to_positive_int(value: Union[str, int]) -> int:
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Extract text and metadata from a PDF.")
-    parser.add_argument("path", help="Path to the PDF file.")
+    parser.add_argument(
+        "path",
+        nargs="+",
+        help="Path to the PDF file (with --batch: directories, glob patterns, or files).",
+    )
     parser.add_argument(
         "--pages",
         help='Optional comma/range list of pages (1-based), e.g., "1,3-5".',
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for large PDFs, or per-document processes with --batch "
+        "(default: auto; 1 disables parallel extraction).",
+    )
+    parser.add_argument(
+        "--layout",
+        action="store_true",
+        help="Build a section index (headings, project entries, bullet blocks) from fonts and blocks.",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Drop repeated headers/footers and page numbers, rejoin wrapped lines, and report token savings.",
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream one JSON record per line (document header, then each page) as pages are read.",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Extract every PDF under the given paths in parallel and write one compact JSONL record per document.",
+    )
+    parser.add_argument(
+        "--output",
+        help="With --batch: append JSONL here (default: stdout) and skip documents already recorded in it.",
+    )
     parser.add_argument(
         "--indent",
         type=int,
@@ -149,12 +837,42 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     parser = _build_parser()
     args = parser.parse_args(argv)
     page_numbers = parse_page_spec(args.pages) if args.pages else None
-    extraction = extract_pdf(args.path, page_numbers=page_numbers)
+    if args.batch:
+        _run_batch_cli(args, page_numbers)
+        return
+    if len(args.path) > 1:
+        parser.error("multiple paths require --batch")
+    path = args.path[0]
+    if args.ndjson:
+        out = _stdout()
+        for record in iter_extraction(path, page_numbers=page_numbers, layout=args.layout):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+        return
+    extraction = extract_pdf(path, page_numbers=page_numbers, workers=args.workers, layout=args.layout)
+    if args.compact:
+        extraction = compact_extraction(extraction)
     out = _stdout()
     json.dump(extraction.as_dict(), fp=out, ensure_ascii=False, indent=args.indent)
     out.write("\n")
 
 
+def _run_batch_cli(args: argparse.Namespace, page_numbers: Optional[List[int]]) -> None:
+    import sys
+
+    options = dict(workers=args.workers, page_numbers=page_numbers, layout=args.layout, compact=args.compact)
+    if args.output:
+        output = Path(args.output)
+        skip_hashes = _read_processed_hashes(output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with output.open("a", encoding="utf-8") as out:
+            summary = run_batch(args.path, out, skip_hashes=skip_hashes, **options)
+    else:
+        summary = run_batch(args.path, sys.stdout, **options)
+    # Keep stdout pure JSONL; the summary goes to stderr.
+    print(json.dumps(summary), file=sys.stderr)
+
+
 def _stdout():
     # Lazy import to keep module import light for MCP integration.
     import sys
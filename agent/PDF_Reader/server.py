@@ -1,19 +1,53 @@
 from __future__ import annotations
 
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from pdf_reader import extract_pdf, parse_page_spec
+# Same fallback Starlette uses: the package was renamed from `multipart` to `python_multipart`.
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ModuleNotFoundError:
+    from multipart.multipart import MultipartParser, parse_options_header
+
+from extraction_cache import ExtractionCache
+from pdf_reader import (
+    PDFExtraction,
+    compact_extraction,
+    extract_pdf,
+    extract_pdf_bytes,
+    iter_extraction,
+    parse_page_spec,
+    shutdown_pool,
+)
 
 app = FastAPI(title="PDF Reader MCP Service", version="1.0.0")
 
+# Upper bound on documents extracted at the same time by /extract_batch.
+MAX_BATCH_CONCURRENCY = int(os.getenv("PDF_BATCH_CONCURRENCY", "4"))
+# Uploaded PDFs are held in memory, so cap their size.
+MAX_UPLOAD_BYTES = int(os.getenv("PDF_MAX_UPLOAD_BYTES", str(50 * 1024 * 1024)))
+
+EXTRACTION_CACHE = ExtractionCache(
+    db_path=os.getenv("PDF_CACHE_PATH", "/app/outputs/.pdf_cache.sqlite3"),
+    max_bytes=int(os.getenv("PDF_CACHE_MAX_BYTES", str(128 * 1024 * 1024))),
+)
+
 
 class ExtractRequest(BaseModel):
     pdf_path: str
     pages: Optional[str] = None
+    workers: Optional[int] = None  # None: auto (parallel only for large PDFs)
+    use_cache: bool = True
+    compact: bool = False  # Drop headers/footers/page numbers and rejoin wrapped lines
+    layout: bool = False  # Build a section index from fonts/blocks (not cached)
 
 
 class ExtractResponse(BaseModel):
@@ -21,11 +55,81 @@ class ExtractResponse(BaseModel):
     total_pages: int
     extracted_pages: list[int]
     pages_data: list[dict]
+    cache: Optional[str] = None  # "hit", "partial", "miss", or None when bypassed
+    compaction: Optional[dict] = None  # before/after char and token counts when compact=True
+    sections: Optional[list[dict]] = None  # section index when layout=True
+
+
+class BatchExtractRequest(BaseModel):
+    documents: list[ExtractRequest]
+    join_text: bool = False  # Return one joined text per document instead of pages_data
+    separator: str = "\n\n"
+
+
+class BatchDocumentResult(BaseModel):
+    pdf_path: str
+    status: str  # "completed" or "error"
+    total_pages: Optional[int] = None
+    extracted_pages: list[int] = []
+    pages_data: Optional[list[dict]] = None
+    text: Optional[str] = None
+    cache: Optional[str] = None
+    compaction: Optional[dict] = None
+    sections: Optional[list[dict]] = None
+    error: Optional[str] = None
+
+
+class BatchExtractResponse(BaseModel):
+    documents: list[BatchDocumentResult]
+
+
+def _extract_document(req: ExtractRequest) -> Tuple[PDFExtraction, Optional[str]]:
+    """Extract one document per request options; returns (extraction, cache status)."""
+    pdf_path = Path(req.pdf_path)
+    if not pdf_path.is_file():
+        raise FileNotFoundError(f"PDF not found: {req.pdf_path}")
+
+    # Parse page spec if provided
+    page_numbers = None
+    if req.pages:
+        page_numbers = parse_page_spec(req.pages)
+
+    # Extract PDF (served per page from the cache when possible).
+    # The cache holds plain page text only, so layout extraction always runs fresh.
+    if req.layout:
+        extraction, cache_status = (
+            extract_pdf(pdf_path, page_numbers=page_numbers, workers=req.workers, layout=True),
+            None,
+        )
+    elif req.use_cache:
+        extraction, cache_status = EXTRACTION_CACHE.extract(
+            pdf_path, page_numbers=page_numbers, workers=req.workers
+        )
+    else:
+        extraction, cache_status = extract_pdf(pdf_path, page_numbers=page_numbers, workers=req.workers), None
+
+    # The cache keeps raw text; compaction is cheap and runs on top of it.
+    if req.compact:
+        extraction = compact_extraction(extraction)
+    return extraction, cache_status
+
+
+def _compaction_dict(extraction: PDFExtraction) -> Optional[dict]:
+    return extraction.compaction.as_dict() if extraction.compaction else None
+
+
+def _sections_list(extraction: PDFExtraction) -> Optional[list[dict]]:
+    sections = extraction.sections
+    return [section.as_dict() for section in sections] if sections is not None else None
 
 
 @app.get("/health")
 def health() -> dict:
-    return {"status": "ok", "service": "pdf_reader"}
+    return {
+        "status": "ok",
+        "service": "pdf_reader",
+        "extraction_cache": EXTRACTION_CACHE.stats(),
+    }
 
 
 @app.post("/extract", response_model=ExtractResponse)
@@ -36,13 +140,7 @@ def extract(req: ExtractRequest) -> ExtractResponse:
         if not pdf_path.is_file():
             raise HTTPException(status_code=404, detail=f"PDF not found: {req.pdf_path}")
 
-        # Parse page spec if provided
-        page_numbers = None
-        if req.pages:
-            page_numbers = parse_page_spec(req.pages)
-
-        # Extract PDF
-        extraction = extract_pdf(pdf_path, page_numbers=page_numbers)
+        extraction, cache_status = _extract_document(req)
         extraction_dict = extraction.as_dict()
 
         # Build extracted_pages list from pages data
@@ -53,11 +151,225 @@ def extract(req: ExtractRequest) -> ExtractResponse:
             total_pages=extraction_dict["page_count"],
             extracted_pages=extracted_pages,
             pages_data=extraction_dict["pages"],
+            cache=cache_status,
+            compaction=_compaction_dict(extraction),
+            sections=_sections_list(extraction),
         )
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+class _UploadTooLarge(Exception):
+    pass
+
+
+async def _read_upload(request: Request) -> Tuple[bytes, str, Dict[str, str]]:
+    """
+    Read an uploaded PDF into memory as the body streams in, without a temp file.
+
+    Accepts either a raw `application/pdf` body (options in the query string) or
+    `multipart/form-data` with a `file` part plus optional text fields. Starlette's
+    UploadFile would spool large files to disk, so multipart is parsed here directly.
+
+    Returns:
+        (pdf bytes, filename, fields) where fields merges query params and form fields.
+    """
+    fields: Dict[str, str] = dict(request.query_params)
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+
+    if content_type != b"multipart/form-data":
+        body = bytearray()
+        async for chunk in request.stream():
+            body.extend(chunk)
+            if len(body) > MAX_UPLOAD_BYTES:
+                raise _UploadTooLarge()
+        return bytes(body), fields.get("name") or "upload.pdf", fields
+
+    parts: list[dict] = []
+    header_field = bytearray()
+    header_value = bytearray()
+    received = 0
+
+    def on_part_begin() -> None:
+        parts.append({"headers": {}, "data": bytearray()})
+
+    def on_header_field(data: bytes, start: int, end: int) -> None:
+        header_field.extend(data[start:end])
+
+    def on_header_value(data: bytes, start: int, end: int) -> None:
+        header_value.extend(data[start:end])
+
+    def on_header_end() -> None:
+        parts[-1]["headers"][bytes(header_field).lower()] = bytes(header_value)
+        header_field.clear()
+        header_value.clear()
+
+    def on_part_data(data: bytes, start: int, end: int) -> None:
+        nonlocal received
+        received += end - start
+        if received > MAX_UPLOAD_BYTES:
+            raise _UploadTooLarge()
+        parts[-1]["data"].extend(data[start:end])
+
+    parser = MultipartParser(
+        params.get(b"boundary", b""),
+        {
+            "on_part_begin": on_part_begin,
+            "on_header_field": on_header_field,
+            "on_header_value": on_header_value,
+            "on_header_end": on_header_end,
+            "on_part_data": on_part_data,
+        },
+    )
+    async for chunk in request.stream():
+        parser.write(chunk)
+    parser.finalize()
+
+    data: Optional[bytes] = None
+    filename = "upload.pdf"
+    for part in parts:
+        _, disposition = parse_options_header(part["headers"].get(b"content-disposition", b""))
+        name = disposition.get(b"name", b"").decode("utf-8", "replace")
+        if b"filename" in disposition or name == "file":
+            if data is None:
+                data = bytes(part["data"])
+                filename = disposition.get(b"filename", b"upload.pdf").decode("utf-8", "replace")
+        elif name:
+            fields[name] = part["data"].decode("utf-8", "replace")
+
+    if data is None:
+        raise ValueError("No PDF file part found in the upload (expected a `file` field).")
+    return data, filename, fields
+
+
+@app.post("/extract_upload", response_model=ExtractResponse)
+async def extract_upload(request: Request) -> ExtractResponse:
+    """
+    Extract text from an uploaded PDF without it ever touching the filesystem.
+
+    Lets the PDF reader run on a node that does not share the /app volume.
+    Options: `pages`, `workers`, `use_cache`, `compact`, `layout` (form fields or query params).
+    """
+    try:
+        data, filename, fields = await _read_upload(request)
+    except _UploadTooLarge:
+        raise HTTPException(status_code=413, detail=f"PDF exceeds {MAX_UPLOAD_BYTES} bytes.")
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    def run() -> Tuple[PDFExtraction, Optional[str]]:
+        page_numbers = parse_page_spec(fields["pages"]) if fields.get("pages") else None
+        workers = int(fields["workers"]) if fields.get("workers") else None
+        if _is_true(fields.get("layout", "false")):
+            extraction = extract_pdf_bytes(
+                data, page_numbers=page_numbers, name=filename, workers=workers, layout=True
+            )
+            cache_status = None
+        elif _is_true(fields.get("use_cache", "true")):
+            extraction, cache_status = EXTRACTION_CACHE.extract_bytes(
+                data, page_numbers=page_numbers, name=filename, workers=workers
+            )
+        else:
+            extraction = extract_pdf_bytes(data, page_numbers=page_numbers, name=filename, workers=workers)
+            cache_status = None
+        if _is_true(fields.get("compact", "false")):
+            extraction = compact_extraction(extraction)
+        return extraction, cache_status
+
+    try:
+        # PyMuPDF is blocking; keep it off the event loop.
+        extraction, cache_status = await run_in_threadpool(run)
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    extraction_dict = extraction.as_dict()
+    return ExtractResponse(
+        pdf_path=filename,
+        total_pages=extraction.page_count,
+        extracted_pages=[page.page_number for page in extraction.pages],
+        pages_data=extraction_dict["pages"],
+        cache=cache_status,
+        compaction=_compaction_dict(extraction),
+        sections=_sections_list(extraction),
+    )
+
+
+def _is_true(value: str) -> bool:
+    return value.lower() not in ("0", "false", "no")
+
+
+@app.post("/extract_stream")
+def extract_stream(req: ExtractRequest) -> StreamingResponse:
+    """
+    Stream extraction as NDJSON: a document line, one line per page as it is read, then an end line.
+
+    Pages are read lazily from the PDF, so memory stays bounded by one page.
+    `compact` is ignored here: header/footer detection needs every page first.
+    """
+    pdf_path = Path(req.pdf_path)
+    if not pdf_path.is_file():
+        raise HTTPException(status_code=404, detail=f"PDF not found: {req.pdf_path}")
+
+    try:
+        page_numbers = parse_page_spec(req.pages) if req.pages else None
+        records = iter_extraction(pdf_path, page_numbers=page_numbers, layout=req.layout)
+        # Pull the document record now so invalid input fails with a normal HTTP error.
+        header = next(records)
+    except Exception as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    def lines() -> Iterator[str]:
+        yield json.dumps(header, ensure_ascii=False) + "\n"
+        count = 0
+        try:
+            for record in records:
+                count += 1
+                yield json.dumps(record, ensure_ascii=False) + "\n"
+        except Exception as exc:
+            yield json.dumps({"type": "error", "detail": str(exc)}, ensure_ascii=False) + "\n"
+            return
+        yield json.dumps({"type": "end", "pages": count}) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.post("/extract_batch", response_model=BatchExtractResponse)
+def extract_batch(req: BatchExtractRequest) -> BatchExtractResponse:
+    """Extract several PDFs concurrently; a failing document doesn't fail the batch."""
+
+    def run(doc_req: ExtractRequest) -> BatchDocumentResult:
+        try:
+            extraction, cache_status = _extract_document(doc_req)
+        except Exception as exc:
+            return BatchDocumentResult(pdf_path=doc_req.pdf_path, status="error", error=str(exc))
+
+        return BatchDocumentResult(
+            pdf_path=doc_req.pdf_path,
+            status="completed",
+            total_pages=extraction.page_count,
+            extracted_pages=[page.page_number for page in extraction.pages],
+            pages_data=None if req.join_text else extraction.as_dict()["pages"],
+            text=extraction.full_text(req.separator) if req.join_text else None,
+            cache=cache_status,
+            compaction=_compaction_dict(extraction),
+            sections=_sections_list(extraction),
+        )
+
+    if not req.documents:
+        return BatchExtractResponse(documents=[])
+
+    workers = max(1, min(MAX_BATCH_CONCURRENCY, len(req.documents)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # map() keeps results in request order.
+        results = list(pool.map(run, req.documents))
+    return BatchExtractResponse(documents=results)
+
+
+@app.on_event("shutdown")
+def stop_extraction_pool() -> None:
+    shutdown_pool()
+
+
 if __name__ == "__main__":
     import uvicorn
 
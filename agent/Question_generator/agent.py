@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import argparse
 import json
-import os
 import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Union
 
 from openai import OpenAI
 
@@ -14,7 +14,52 @@ HACKATHON_ROOT = Path(__file__).resolve().parents[1]
 if str(HACKATHON_ROOT) not in sys.path:
     sys.path.append(str(HACKATHON_ROOT))
 
-from PDF_Reader import PDFExtraction, extract_pdf, parse_page_spec  # noqa: E402
+from PDF_Reader import PDFExtraction, count_tokens, extract_pdf, parse_page_spec  # noqa: E402
+
+# Support both package import (Question_generator.agent) and Docker (flat module)
+try:
+    from Question_generator.batch import (  # noqa: E402
+        BATCH_COMPLETION_TOKENS,
+        BATCH_CONCURRENCY,
+        BATCH_MAX_RETRIES,
+        BATCH_RPM,
+        BATCH_TPM,
+        BatchStats,
+        RateLimiter,
+        call_with_retries,
+        run_concurrently,
+    )
+    from Question_generator.context_packer import pack_context  # noqa: E402
+    from Question_generator.hedging import Hedger  # noqa: E402
+    from Question_generator.llm_cache import LLMResponseCache, build_prompt_key  # noqa: E402
+    from Question_generator.llm_client import get_shared_client  # noqa: E402
+    from Question_generator.prefetch import SearchPrefetcher  # noqa: E402
+    from Question_generator.question_stream import QuestionStreamParser  # noqa: E402
+    from Question_generator.web_search import (  # noqa: E402
+        SearchBackend,
+        SearchResultCache,
+        cached_search_many,
+        duckduckgo_backend,
+    )
+except ModuleNotFoundError:
+    from batch import (  # noqa: E402
+        BATCH_COMPLETION_TOKENS,
+        BATCH_CONCURRENCY,
+        BATCH_MAX_RETRIES,
+        BATCH_RPM,
+        BATCH_TPM,
+        BatchStats,
+        RateLimiter,
+        call_with_retries,
+        run_concurrently,
+    )
+    from context_packer import pack_context  # noqa: E402
+    from hedging import Hedger  # noqa: E402
+    from llm_cache import LLMResponseCache, build_prompt_key  # noqa: E402
+    from llm_client import get_shared_client  # noqa: E402
+    from prefetch import SearchPrefetcher  # noqa: E402
+    from question_stream import QuestionStreamParser  # noqa: E402
+    from web_search import SearchBackend, SearchResultCache, cached_search_many, duckduckgo_backend  # noqa: E402
 
 DEFAULT_SEARCH_KEYWORDS: Sequence[str] = (
     "면접 기출문제",
@@ -22,9 +67,76 @@ DEFAULT_SEARCH_KEYWORDS: Sequence[str] = (
     "개발자 면접 예상문제",
 )
 
+# Responses to identical prompts are reused across requests and restarts.
+LLM_CACHE = LLMResponseCache()
+# Company/role search results are reused across candidates until their TTL expires.
+SEARCH_CACHE = SearchResultCache()
+# Duplicates slow LLM calls past the recent latency percentile (off unless LLM_HEDGE is set).
+LLM_HEDGER = Hedger()
+# Company/role searches started at session creation, claimed by the session's /generate.
+SEARCH_PREFETCHER = SearchPrefetcher()
+
+
+def _get_text_response(
+    client: OpenAI,
+    model: str,
+    messages: List[Dict[str, str]],
+    temperature: float = 0.0,
+    use_cache: Optional[bool] = None,
+    hedge: Optional[bool] = None,
+    validate: Optional[Callable[[str], bool]] = None,
+) -> str:
+    """
+    Return plain text from OpenAI regardless of SDK version.
+
+    `use_cache=None` caches only deterministic (temperature 0) calls; True
+    caches at any temperature, False always calls the API. With `validate`,
+    only responses it accepts are cached or served from the cache, so a
+    truncated or malformed reply is retried instead of replayed. `hedge`
+    overrides LLM_HEDGER's policy for this call (None: use the LLM_HEDGE setting).
+    """
+    if use_cache is None:
+        use_cache = temperature == 0
+    key = build_prompt_key(model, messages, temperature) if use_cache else None
+    if key is not None:
+        cached = _cached_response(key, validate)
+        if cached is not None:
+            return cached
+
+    if hedge is None:
+        hedge = LLM_HEDGER.policy.enabled
+    if hedge:
+        text = LLM_HEDGER.call(
+            lambda attempt_model: _request_text_response(client, attempt_model, messages, temperature),
+            model,
+        )
+    else:
+        text = _request_text_response(client, model, messages, temperature)
+    if key is not None:
+        _store_response(key, text, model, validate)
+    return text
+
+
+def _cached_response(key: str, validate: Optional[Callable[[str], bool]] = None) -> Optional[str]:
+    cached = LLM_CACHE.get(key)
+    if cached is not None and validate is not None and not validate(cached):
+        return None
+    return cached
+
 
-def _get_text_response(client: OpenAI, model: str, messages: List[Dict[str, str]], temperature: float = 0.0) -> str:
-    """Return plain text from OpenAI regardless of SDK version."""
+def _store_response(key: str, text: str, model: str, validate: Optional[Callable[[str], bool]] = None) -> None:
+    if not text or (validate is not None and not validate(text)):
+        return
+    try:
+        LLM_CACHE.put(key, text, {"model": model})
+    except OSError as exc:
+        # A read-only or full cache volume must not fail the request.
+        print(f"LLM cache write failed: {exc}")
+
+
+def _request_text_response(
+    client: OpenAI, model: str, messages: List[Dict[str, str]], temperature: float
+) -> str:
     if hasattr(client, "chat") and hasattr(client.chat, "completions"):
         completion = client.chat.completions.create(
             model=model,
@@ -50,23 +162,72 @@ def _get_text_response(client: OpenAI, model: str, messages: List[Dict[str, str]
     raise AttributeError("OpenAI client does not support chat or responses APIs.")
 
 
+def _stream_text_response(
+    client: OpenAI,
+    model: str,
+    messages: List[Dict[str, str]],
+    temperature: float = 0.0,
+    use_cache: Optional[bool] = None,
+    validate: Optional[Callable[[str], bool]] = None,
+) -> Iterator[str]:
+    """
+    Yield response text in pieces as the model produces it.
+
+    Caching follows `_get_text_response`: a cache hit is yielded as one piece,
+    and a fully streamed response is stored once the stream ends. Clients
+    without chat completions fall back to a single non-streamed response.
+    """
+    if use_cache is None:
+        use_cache = temperature == 0
+    key = build_prompt_key(model, messages, temperature) if use_cache else None
+    if key is not None:
+        cached = _cached_response(key, validate)
+        if cached is not None:
+            yield cached
+            return
+
+    if hasattr(client, "chat") and hasattr(client.chat, "completions"):
+        parts: List[str] = []
+        stream = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            stream=True,
+        )
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                parts.append(delta)
+                yield delta
+        text = "".join(parts)
+    else:
+        text = _request_text_response(client, model, messages, temperature)
+        yield text
+
+    if key is not None:
+        _store_response(key, text, model, validate)
+
+
 def fetch_company_role_search_context(
     company: str,
     role: str,
     keywords: Sequence[str],
     per_query: int = 3,
     max_chars: int = 2000,
+    backend: Optional[SearchBackend] = None,
+    use_cache: bool = True,
+    stats: Optional[Dict[str, Any]] = None,
 ) -> str:
     """
     Fetch condensed web search snippets for the target company/role.
     Uses DuckDuckGo so no API key is required. Returns a newline-joined string.
+
+    Queries run concurrently (see web_search.search_many); snippets keep the
+    keyword order. `backend` replaces DuckDuckGo, e.g., with a local fake.
+    Per-query results come from SEARCH_CACHE when fresh (`use_cache`). If a
+    `stats` dict is given, it is filled with query and cache-hit counts.
     """
-    try:
-        from duckduckgo_search import DDGS
-    except ImportError as exc:  # pragma: no cover - informs misconfiguration
-        raise RuntimeError(
-            "duckduckgo-search is required for web search. Install via `pip install duckduckgo-search`."
-        ) from exc
+    backend = backend or duckduckgo_backend()
 
     base_terms = " ".join(part for part in (company, role) if part).strip()
     queries = [
@@ -79,24 +240,26 @@ def fetch_company_role_search_context(
 
     snippets: List[str] = []
     try:
-        with DDGS(timeout=10) as ddgs:
-            for query in queries:
-                try:
-                    for item in ddgs.text(query, max_results=per_query):
-                        title = (item.get("title") or "").strip()
-                        snippet = (item.get("body") or "").strip()
-                        link = (item.get("href") or "").strip()
-                        if not title and not snippet:
-                            continue
-                        line = f"[{query}] {title}: {snippet}"
-                        if link:
-                            line += f" (link: {link})"
-                        snippets.append(line)
-                except Exception:
-                    # Skip individual query failures to keep the flow resilient.
-                    continue
+        per_query_items, cache_hits = cached_search_many(
+            queries, per_query, backend, SEARCH_CACHE if use_cache else None
+        )
     except Exception as exc:
         raise RuntimeError(f"Web search failed: {exc}") from exc
+    if stats is not None:
+        stats.update(queries=len(queries), cache_hits=cache_hits)
+
+    for query, items in zip(queries, per_query_items):
+        # A failed or timed-out query yields None; skip it to keep the flow resilient.
+        for item in items or []:
+            title = (item.get("title") or "").strip()
+            snippet = (item.get("body") or "").strip()
+            link = (item.get("href") or "").strip()
+            if not title and not snippet:
+                continue
+            line = f"[{query}] {title}: {snippet}"
+            if link:
+                line += f" (link: {link})"
+            snippets.append(line)
 
     context = "\n".join(snippets)
     if len(context) > max_chars:
@@ -104,6 +267,53 @@ def fetch_company_role_search_context(
     return context
 
 
+def prefetch_company_role_search(
+    session_id: str,
+    company: Optional[str] = None,
+    role: Optional[str] = None,
+    search_keywords: Optional[Sequence[str]] = None,
+    search_results_per_query: int = 3,
+    max_search_chars: int = 2000,
+    search_backend: Optional[SearchBackend] = None,
+    use_search_cache: bool = True,
+) -> bool:
+    """
+    Start the company/role search for a session in the background.
+
+    `generate_questions_from_texts(session_id=...)` with the same search
+    arguments then uses the result instead of searching after PDF extraction.
+    Returns False if there is nothing to search.
+    """
+    if not (company or role):
+        return False
+    keywords = list(search_keywords) if search_keywords is not None else list(DEFAULT_SEARCH_KEYWORDS)
+
+    def run() -> tuple[str, Dict[str, Any]]:
+        stats: Dict[str, Any] = {}
+        context = fetch_company_role_search_context(
+            company=company or "",
+            role=role or "",
+            keywords=keywords,
+            per_query=search_results_per_query,
+            max_chars=max_search_chars,
+            backend=search_backend,
+            use_cache=use_search_cache,
+            stats=stats,
+        )
+        return context, stats
+
+    params = _prefetch_params(company, role, keywords, search_results_per_query, max_search_chars)
+    SEARCH_PREFETCHER.start(session_id, params, run)
+    return True
+
+
+def _prefetch_params(
+    company: Optional[str], role: Optional[str], keywords: Sequence[str], per_query: int, max_chars: int
+) -> tuple:
+    # The search inputs a prefetched result must match to stand in for a fresh search.
+    return (company or "", role or "", tuple(keywords), per_query, max_chars)
+
+
 def run_agent(
     pdf_path: Union[str, Path],
     out_dir: Optional[Union[str, Path]] = None,
@@ -146,6 +356,8 @@ def generate_questions(
     model: str,
     max_context_chars: int,
     client: Optional[OpenAI] = None,
+    use_llm_cache: Optional[bool] = None,
+    hedge_llm: Optional[bool] = None,
 ) -> List[str]:
     client = client or _build_client()
 
@@ -179,13 +391,11 @@ def generate_questions(
             {"role": "user", "content": user_prompt},
         ],
         temperature=0,
-    ) or "{}"
-    try:
-        payload = json.loads(content)
-        questions = payload.get("questions", [])
-    except json.JSONDecodeError:
-        questions = []
-    return questions
+        use_cache=use_llm_cache,
+        hedge=hedge_llm,
+        validate=_has_questions,
+    )
+    return _parse_questions(content)
 
 
 def generate_questions_from_texts(
@@ -199,24 +409,220 @@ def generate_questions_from_texts(
     search_keywords: Optional[Sequence[str]] = None,
     search_results_per_query: int = 3,
     max_search_chars: int = 2000,
+    use_llm_cache: Optional[bool] = None,
+    search_backend: Optional[SearchBackend] = None,
+    use_search_cache: bool = True,
+    search_stats: Optional[Dict[str, Any]] = None,
+    hedge_llm: Optional[bool] = None,
+    session_id: Optional[str] = None,
 ) -> List[str]:
     """
     Generate interview questions from introduce/portfolio texts plus optional company/role search context.
+
+    Identical inputs (texts, company/role, search snippets) reuse a cached LLM
+    response; see `_get_text_response` for `use_llm_cache` and `hedge_llm`.
+    `search_stats` is filled as in `fetch_company_role_search_context`.
+    With `session_id`, a matching search started by
+    `prefetch_company_role_search` is used instead of searching again.
+    """
+    client = client or _build_client()
+    messages = _build_text_messages(
+        introduce_text,
+        portfolio_text,
+        max_context_chars,
+        company=company,
+        role=role,
+        search_keywords=search_keywords,
+        search_results_per_query=search_results_per_query,
+        max_search_chars=max_search_chars,
+        search_backend=search_backend,
+        use_search_cache=use_search_cache,
+        search_stats=search_stats,
+        session_id=session_id,
+    )
+
+    content = _get_text_response(
+        client,
+        model,
+        messages=messages,
+        temperature=0,
+        use_cache=use_llm_cache,
+        hedge=hedge_llm,
+        validate=_has_questions,
+    )
+    return _parse_questions(content)
+
+
+def generate_questions_batch(
+    records: Iterable[Dict[str, Any]],
+    model: str,
+    max_context_chars: int,
+    client: Optional[OpenAI] = None,
+    concurrency: int = BATCH_CONCURRENCY,
+    rpm: int = BATCH_RPM,
+    tpm: int = BATCH_TPM,
+    max_retries: int = BATCH_MAX_RETRIES,
+    use_llm_cache: Optional[bool] = None,
+    stats: Optional[BatchStats] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Generate questions for many candidates under one requests/tokens-per-minute budget.
+
+    Each record holds introduce_text and portfolio_text, and optionally id,
+    company, role, search_keywords, search_results_per_query,
+    max_search_chars and use_search_cache (as in
+    `generate_questions_from_texts`). Records run `concurrency` at a time and
+    one result dict is yielded per record as it finishes:
+    {"id", "status": "completed" | "error", "questions", "attempts",
+    "tokens", "cached", "seconds"} plus "error" on failure.
+
+    Every LLM request first reserves its estimated tokens from the shared
+    RateLimiter; rate-limit, timeout and 5xx errors are retried with backoff
+    up to `max_retries` times. Cached responses skip the budget entirely.
+    Hedging is off here, since duplicates would spend the budget twice.
+    If `stats` is given, it is filled as results are produced.
+    """
+    limiter = RateLimiter(rpm=rpm, tpm=tpm)
+    if stats is not None:
+        stats.limiter = limiter
+    # Retries happen in call_with_retries, under the budget, not inside the SDK.
+    batch_client = (client or _build_client()).with_options(max_retries=0)
+    # Requests here are deterministic (temperature 0), so only an explicit False skips the cache.
+    use_cache = use_llm_cache is not False
+
+    def process(item: tuple[int, Dict[str, Any]]) -> Dict[str, Any]:
+        index, record = item
+        started = time.perf_counter()
+        result: Dict[str, Any] = {"id": str(record.get("id", index)), "status": "completed"}
+        attempts = tokens = 0
+        cached = False
+
+        def request() -> str:
+            nonlocal attempts
+            attempts += 1
+            # The cache was already checked once for this record; only store the reply.
+            text = _request_text_response(batch_client, model, messages, 0)
+            if use_cache:
+                _store_response(key, text, model, _has_questions)
+            return text
+
+        try:
+            messages = _build_text_messages(
+                record.get("introduce_text") or "",
+                record.get("portfolio_text") or "",
+                max_context_chars,
+                company=record.get("company"),
+                role=record.get("role"),
+                search_keywords=record.get("search_keywords"),
+                search_results_per_query=record.get("search_results_per_query", 3),
+                max_search_chars=record.get("max_search_chars", 2000),
+                use_search_cache=record.get("use_search_cache", True),
+            )
+            key = build_prompt_key(model, messages, 0)
+            content = _cached_response(key, _has_questions) if use_cache else None
+            cached = content is not None
+            if not cached:
+                prompt_tokens, _ = count_tokens("\n".join(message["content"] for message in messages))
+                tokens = prompt_tokens + BATCH_COMPLETION_TOKENS
+                content, _ = call_with_retries(request, limiter, tokens, max_retries=max_retries)
+            result["questions"] = _parse_questions(content)
+        except Exception as exc:
+            result.update(status="error", error=str(exc))
+        result.update(
+            attempts=attempts,
+            tokens=tokens,
+            cached=cached,
+            seconds=round(time.perf_counter() - started, 3),
+        )
+        if stats is not None:
+            stats.record(result)
+        return result
+
+    yield from run_concurrently(enumerate(records), process, concurrency=concurrency)
+
+
+def stream_questions_from_texts(
+    introduce_text: str,
+    portfolio_text: str,
+    model: str,
+    max_context_chars: int,
+    client: Optional[OpenAI] = None,
+    company: Optional[str] = None,
+    role: Optional[str] = None,
+    search_keywords: Optional[Sequence[str]] = None,
+    search_results_per_query: int = 3,
+    max_search_chars: int = 2000,
+    use_llm_cache: Optional[bool] = None,
+    search_backend: Optional[SearchBackend] = None,
+    use_search_cache: bool = True,
+    search_stats: Optional[Dict[str, Any]] = None,
+    session_id: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Like `generate_questions_from_texts`, but yield each question as soon as the streamed completion finishes it.
     """
     client = client or _build_client()
+    messages = _build_text_messages(
+        introduce_text,
+        portfolio_text,
+        max_context_chars,
+        company=company,
+        role=role,
+        search_keywords=search_keywords,
+        search_results_per_query=search_results_per_query,
+        max_search_chars=max_search_chars,
+        search_backend=search_backend,
+        use_search_cache=use_search_cache,
+        search_stats=search_stats,
+        session_id=session_id,
+    )
+
+    parser = QuestionStreamParser()
+    for delta in _stream_text_response(
+        client, model, messages, temperature=0, use_cache=use_llm_cache, validate=_has_questions
+    ):
+        yield from parser.feed(delta)
+    yield from parser.close()
+
 
+def _build_text_messages(
+    introduce_text: str,
+    portfolio_text: str,
+    max_context_chars: int,
+    company: Optional[str] = None,
+    role: Optional[str] = None,
+    search_keywords: Optional[Sequence[str]] = None,
+    search_results_per_query: int = 3,
+    max_search_chars: int = 2000,
+    search_backend: Optional[SearchBackend] = None,
+    use_search_cache: bool = True,
+    search_stats: Optional[Dict[str, Any]] = None,
+    session_id: Optional[str] = None,
+) -> List[Dict[str, str]]:
+    """Run (or claim the prefetched) company/role search, pack the context, and build the chat messages."""
     keywords = list(search_keywords) if search_keywords is not None else list(DEFAULT_SEARCH_KEYWORDS)
     search_context = ""
 
     if company or role:
+        params = _prefetch_params(company, role, keywords, search_results_per_query, max_search_chars)
+        prefetched = SEARCH_PREFETCHER.claim(session_id, params) if session_id else None
         try:
-            search_context = fetch_company_role_search_context(
-                company=company or "",
-                role=role or "",
-                keywords=keywords,
-                per_query=search_results_per_query,
-                max_chars=max_search_chars,
-            )
+            if prefetched is not None:
+                # Already running or done since the session started; its search is bounded by its own deadline.
+                search_context, prefetch_stats = prefetched.result()
+                if search_stats is not None:
+                    search_stats.update(prefetch_stats, prefetched=True)
+            else:
+                search_context = fetch_company_role_search_context(
+                    company=company or "",
+                    role=role or "",
+                    keywords=keywords,
+                    per_query=search_results_per_query,
+                    max_chars=max_search_chars,
+                    backend=search_backend,
+                    use_cache=use_search_cache,
+                    stats=search_stats,
+                )
         except Exception:
             # If search fails, proceed with the provided texts only.
             search_context = ""
@@ -230,20 +636,23 @@ def generate_questions_from_texts(
             meta_lines.append(f"직무: {role}")
         if keywords:
             meta_lines.append("검색 키워드: " + ", ".join(keywords))
-        context_sections.append("=== 회사/직무 정보 ===\n" + "\n".join(meta_lines))
+        context_sections.append(("회사/직무 정보", "\n".join(meta_lines)))
 
-    context_sections.append("=== 자기소개서 ===\n" + introduce_text)
-    context_sections.append("=== 포트폴리오 ===\n" + portfolio_text)
+    context_sections.append(("자기소개서", introduce_text))
+    context_sections.append(("포트폴리오", portfolio_text))
 
     if search_context:
-        context_sections.append("=== 검색 결과 요약 ===\n" + search_context)
-
-    combined_text = "\n\n".join(context_sections)
-
-    truncated = False
-    if len(combined_text) > max_context_chars:
-        combined_text = combined_text[:max_context_chars]
-        truncated = True
+        context_sections.append(("검색 결과 요약", search_context))
+
+    # Keep the chunks most relevant to the role/keywords (BM25) within per-source
+    # quotas, instead of cutting the concatenation off at max_context_chars.
+    packed = pack_context(
+        context_sections,
+        query=" ".join([company or "", role or "", *keywords]),
+        max_chars=max_context_chars,
+    )
+    combined_text = packed.text
+    truncated = packed.truncated
 
     system_prompt = (
         "You are an interview question generator for Korean technical interviews. "
@@ -257,22 +666,22 @@ def generate_questions_from_texts(
         "Available context (company/role, candidate docs, search snippets):\n"
         f"{combined_text}"
     )
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
 
-    content = _get_text_response(
-        client,
-        model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-        temperature=0,
-    ) or "{}"
+
+def _parse_questions(content: Optional[str]) -> List[str]:
     try:
-        payload = json.loads(content)
-        questions = payload.get("questions", [])
+        payload = json.loads(content or "{}")
+        return payload.get("questions", [])
     except json.JSONDecodeError:
-        questions = []
-    return questions
+        return []
+
+
+def _has_questions(content: str) -> bool:
+    return bool(_parse_questions(content))
 
 
 def _write_json(data: Any, path: Path) -> None:
@@ -289,23 +698,34 @@ def _write_txt(questions: List[str], path: Path) -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     for i, question in enumerate(questions, start=1):
-        question_file = output_dir / f"question_{i}.txt"
-        with question_file.open("w", encoding="utf-8") as f:
-            f.write(question)
+        _write_question(question, i, output_dir)
+
+
+def _write_question(question: str, index: int, output_dir: Path) -> None:
+    """Save one question as question_{index}.txt, e.g., as soon as it is streamed."""
+    question_file = output_dir / f"question_{index}.txt"
+    with question_file.open("w", encoding="utf-8") as f:
+        f.write(question)
 
 
 def _build_client() -> OpenAI:
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY environment variable is required.")
-    return OpenAI(api_key=api_key)
+    # One pooled client per process, so requests reuse keep-alive connections.
+    return get_shared_client()
 
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Run agent: PDF -> JSON -> LLM (3 interview questions)."
     )
-    parser.add_argument("--pdf", required=True, help="Path to PDF file.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--pdf", help="Path to PDF file.")
+    source.add_argument(
+        "--batch",
+        help=(
+            "JSONL file of candidate records (introduce_text, portfolio_text, optional id/company/role/"
+            "search_keywords), or - for stdin. Writes one JSON result line per record."
+        ),
+    )
     parser.add_argument(
         "--out",
         help="Output directory for JSON files (default: <pdf_dir>/outputs).",
@@ -325,12 +745,43 @@ def _build_parser() -> argparse.ArgumentParser:
         default=8000,
         help="Max characters of PDF text to send to the LLM (default: 8000).",
     )
+    parser.add_argument(
+        "--output",
+        help="With --batch: append results to this JSONL file and skip records already completed in it.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=BATCH_CONCURRENCY,
+        help=f"With --batch: records in flight at once (default: {BATCH_CONCURRENCY}).",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=BATCH_RPM,
+        help=f"With --batch: LLM requests per minute budget (default: {BATCH_RPM}).",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=int,
+        default=BATCH_TPM,
+        help=f"With --batch: LLM tokens per minute budget (default: {BATCH_TPM}).",
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=BATCH_MAX_RETRIES,
+        help=f"With --batch: retries per record on rate-limit/timeout/5xx errors (default: {BATCH_MAX_RETRIES}).",
+    )
     return parser
 
 
 def main(argv: Optional[Sequence[str]] = None) -> None:
     parser = _build_parser()
     args = parser.parse_args(argv)
+    if args.batch:
+        _run_batch_cli(args)
+        return
     pages = parse_page_spec(args.pages) if args.pages else None
     result = run_agent(
         pdf_path=args.pdf,
@@ -342,5 +793,70 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     print(json.dumps(result, ensure_ascii=False, indent=2))
 
 
+def _run_batch_cli(args: argparse.Namespace) -> None:
+    if args.batch == "-":
+        records = _read_batch_records(sys.stdin)
+    else:
+        with open(args.batch, "r", encoding="utf-8") as f:
+            records = _read_batch_records(f)
+
+    stats = BatchStats()
+    options = dict(
+        model=args.model,
+        max_context_chars=args.max_context_chars,
+        concurrency=args.concurrency,
+        rpm=args.rpm,
+        tpm=args.tpm,
+        max_retries=args.max_retries,
+        stats=stats,
+    )
+    if args.output:
+        output = Path(args.output)
+        done = _read_completed_ids(output)
+        pending = [record for record in records if record["id"] not in done]
+        stats.skipped = len(records) - len(pending)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with output.open("a", encoding="utf-8") as out:
+            _write_batch_results(generate_questions_batch(pending, **options), out)
+    else:
+        _write_batch_results(generate_questions_batch(records, **options), sys.stdout)
+    # Keep stdout pure JSONL; the summary goes to stderr.
+    print(json.dumps(stats.summary()), file=sys.stderr)
+
+
+def _read_batch_records(lines: Iterable[str]) -> List[Dict[str, Any]]:
+    records = []
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        # Ids default to the line number, so a resumed run matches records to earlier results.
+        record["id"] = str(record.get("id", line_number))
+        records.append(record)
+    return records
+
+
+def _read_completed_ids(path: Path) -> Set[str]:
+    """Ids of successfully generated records in an existing JSONL output."""
+    ids: Set[str] = set()
+    if not path.is_file():
+        return ids
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a partial last line from an interrupted run
+            if result.get("status") == "completed" and result.get("id") is not None:
+                ids.add(str(result["id"]))
+    return ids
+
+
+def _write_batch_results(results: Iterable[Dict[str, Any]], out: Any) -> None:
+    for result in results:
+        out.write(json.dumps(result, ensure_ascii=False, separators=(",", ":")) + "\n")
+        out.flush()
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+
+import openai
+
+T = TypeVar("T")
+
+# Defaults for bulk generation; set them to the account's OpenAI rate limits.
+BATCH_CONCURRENCY = int(os.getenv("QG_BATCH_CONCURRENCY", "8"))
+BATCH_RPM = int(os.getenv("QG_BATCH_RPM", "500"))
+BATCH_TPM = int(os.getenv("QG_BATCH_TPM", "200000"))
+BATCH_MAX_RETRIES = int(os.getenv("QG_BATCH_MAX_RETRIES", "5"))
+BATCH_BACKOFF_BASE = float(os.getenv("QG_BATCH_BACKOFF_BASE", "1"))
+BATCH_BACKOFF_MAX = float(os.getenv("QG_BATCH_BACKOFF_MAX", "60"))
+# Budget that may be spent at once; the rest is paced evenly over the minute.
+BATCH_BURST_SECONDS = float(os.getenv("QG_BATCH_BURST_SECONDS", "1"))
+# Completion tokens charged to the TPM budget per request, on top of the prompt.
+BATCH_COMPLETION_TOKENS = int(os.getenv("QG_BATCH_COMPLETION_TOKENS", "600"))
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute budget shared by all batch workers.
+
+    Two token buckets refill continuously at rpm/60 and tpm/60 per second and
+    hold at most `burst_seconds` of budget, so a run never spends faster than
+    the budget beyond that burst. A request larger than the token bucket may
+    proceed once the bucket is full and leaves it in debt, which later
+    requests wait out. pause() stops everyone, e.g., when the API answers
+    429 with a Retry-After.
+    """
+
+    def __init__(self, rpm: int = BATCH_RPM, tpm: int = BATCH_TPM, burst_seconds: float = BATCH_BURST_SECONDS) -> None:
+        if rpm <= 0 or tpm <= 0:
+            raise ValueError("rpm and tpm must be positive.")
+        self.rpm = rpm
+        self.tpm = tpm
+        self._max_requests = max(1.0, rpm * burst_seconds / 60)
+        self._max_tokens = max(1.0, tpm * burst_seconds / 60)
+        self._lock = threading.Lock()
+        self._requests = self._max_requests
+        self._tokens = self._max_tokens
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self.waited_seconds = 0.0
+
+    def acquire(self, tokens: int) -> float:
+        """Block until one request and `tokens` fit the budget; return the seconds waited."""
+        tokens = max(0, tokens)
+        needed = min(tokens, self._max_tokens)
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._requests >= 1 and self._tokens >= needed:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    waited = now - start
+                    self.waited_seconds += waited
+                    return waited
+                delay = max(
+                    self._paused_until - now,
+                    (1 - self._requests) * 60 / self.rpm,
+                    (needed - self._tokens) * 60 / self.tpm,
+                )
+            time.sleep(min(max(delay, 0.01), 1.0))
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self._max_requests, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self._max_tokens, self._tokens + elapsed * self.tpm / 60)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Rate limits, timeouts, connection errors, and 5xx responses are worth retrying."""
+    if isinstance(exc, (openai.APIConnectionError, openai.RateLimitError, TimeoutError, ConnectionError)):
+        return True
+    if isinstance(exc, openai.APIStatusError):
+        return exc.status_code in (408, 409) or exc.status_code >= 500
+    return False
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    response = getattr(exc, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def call_with_retries(
+    fn: Callable[[], T],
+    limiter: RateLimiter,
+    tokens: int,
+    max_retries: int = BATCH_MAX_RETRIES,
+    backoff_base: float = BATCH_BACKOFF_BASE,
+    backoff_max: float = BATCH_BACKOFF_MAX,
+) -> Tuple[T, int]:
+    """
+    Call fn() within the rate budget, retrying retryable errors with exponential backoff and full jitter.
+
+    A 429 with Retry-After pauses the whole limiter for that long, since every
+    worker would hit the same limit.
+
+    Returns:
+        (fn() result, attempts made)
+    """
+    attempt = 0
+    while True:
+        limiter.acquire(tokens)
+        attempt += 1
+        try:
+            return fn(), attempt
+        except Exception as exc:
+            if attempt > max_retries or not is_retryable(exc):
+                raise
+            delay = random.uniform(0, min(backoff_max, backoff_base * 2 ** (attempt - 1)))
+            retry_after = _retry_after(exc)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+                if isinstance(exc, openai.RateLimitError):
+                    limiter.pause(retry_after)
+            time.sleep(delay)
+
+
+def run_concurrently(
+    items: Iterable[T], process: Callable[[T], Dict[str, Any]], concurrency: int = BATCH_CONCURRENCY
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run process(item) on a thread pool and yield results as they complete.
+
+    An item is submitted only when a worker frees up, so closing the generator
+    early (e.g., the client of a streamed batch went away) starts no further
+    items; at most `concurrency` calls already in flight run to completion.
+    """
+    concurrency = max(1, concurrency)
+    items = iter(items)
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="batch")
+    try:
+        pending = {pool.submit(process, item) for item in islice(items, concurrency)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.update(pool.submit(process, item) for item in islice(items, 1))
+                yield future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+class BatchStats:
+    """Throughput counters for one batch run."""
+
+    def __init__(self, limiter: Optional[RateLimiter] = None) -> None:
+        self.limiter = limiter
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self.records = 0
+        self.completed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.requests = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.tokens = 0  # estimated prompt + completion tokens charged to the budget
+
+    def record(self, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self.records += 1
+            if result.get("status") == "completed":
+                self.completed += 1
+            else:
+                self.failed += 1
+            attempts = result.get("attempts", 0)
+            self.requests += attempts
+            self.retries += max(0, attempts - 1)
+            self.cache_hits += 1 if result.get("cached") else 0
+            self.tokens += result.get("tokens", 0) * attempts
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self._start
+        minutes = elapsed / 60
+        with self._lock:
+            return {
+                "records": self.records,
+                "completed": self.completed,
+                "failed": self.failed,
+                "skipped": self.skipped,
+                "requests": self.requests,
+                "retries": self.retries,
+                "cache_hits": self.cache_hits,
+                "seconds": round(elapsed, 3),
+                "records_per_minute": round(self.records / minutes, 2) if minutes else None,
+                "requests_per_minute": round(self.requests / minutes, 2) if minutes else None,
+                "tokens_per_minute": round(self.tokens / minutes) if minutes else None,
+                "rate_limit_wait_seconds": round(self.limiter.waited_seconds, 3) if self.limiter else 0.0,
+            }
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Share of the budget (after pinned sections) each ranked section may fill first.
+# Shares are renormalized over the sections actually present.
+DEFAULT_QUOTAS: Dict[str, float] = {
+    "자기소개서": 0.35,
+    "포트폴리오": 0.45,
+    "검색 결과 요약": 0.2,
+}
+DEFAULT_CHUNK_CHARS = 400
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*|[가-힣]+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?。])\s+")
+
+
+@dataclass
+class Chunk:
+    section: str
+    index: int  # position within its section
+    text: str
+    score: float = 0.0
+
+
+@dataclass
+class PackedContext:
+    text: str
+    truncated: bool  # True if any chunk was left out
+    chunks_total: int = 0
+    chunks_used: int = 0
+    chars_by_section: Dict[str, int] = field(default_factory=dict)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercased word tokens; Hangul words also yield character bigrams.
+
+    Korean attaches particles to nouns (백엔드를, 백엔드는), so bigrams let
+    "백엔드" match those forms without a morphological analyzer.
+    """
+    tokens: List[str] = []
+    for word in _TOKEN_RE.findall(text.lower()):
+        tokens.append(word)
+        if "가" <= word[0] <= "힣" and len(word) > 2:
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def chunk_text(text: str, chunk_chars: int = DEFAULT_CHUNK_CHARS) -> List[str]:
+    """
+    Split text into chunks of at most `chunk_chars`, preferring paragraph, then line, then sentence breaks.
+
+    A short piece (a heading or label line) is merged with the piece after it,
+    so headings stay with their content.
+    """
+    pieces: List[str] = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= chunk_chars:
+            pieces.append(paragraph)
+            continue
+        for line in paragraph.splitlines():
+            line = line.strip()
+            if len(line) <= chunk_chars:
+                pieces.append(line)
+                continue
+            for sentence in _SENTENCE_SPLIT_RE.split(line):
+                while len(sentence) > chunk_chars:
+                    pieces.append(sentence[:chunk_chars])
+                    sentence = sentence[chunk_chars:]
+                pieces.append(sentence)
+
+    chunks: List[str] = []
+    for piece in pieces:
+        if not piece:
+            continue
+        if chunks and len(chunks[-1]) < chunk_chars // 4 and len(chunks[-1]) + 1 + len(piece) <= chunk_chars:
+            chunks[-1] = f"{chunks[-1]}\n{piece}"
+        else:
+            chunks.append(piece)
+    return chunks
+
+
+def bm25_scores(documents: Sequence[List[str]], query: List[str], k1: float = 1.5, b: float = 0.75) -> List[float]:
+    """Okapi BM25 score of each tokenized document against the query tokens."""
+    if not documents:
+        return []
+    n_docs = len(documents)
+    avg_len = sum(len(doc) for doc in documents) / n_docs or 1.0
+    doc_freq: Counter = Counter()
+    for doc in documents:
+        doc_freq.update(set(doc))
+
+    terms = set(query)
+    idf = {
+        term: math.log(1 + (n_docs - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+        for term in terms
+    }
+    scores = []
+    for doc in documents:
+        counts = Counter(doc)
+        norm = k1 * (1 - b + b * len(doc) / avg_len)
+        scores.append(
+            sum(idf[t] * counts[t] * (k1 + 1) / (counts[t] + norm) for t in terms if counts[t])
+        )
+    return scores
+
+
+def pack_context(
+    sections: Sequence[Tuple[str, str]],
+    query: str,
+    max_chars: int,
+    quotas: Optional[Dict[str, float]] = None,
+    chunk_chars: int = DEFAULT_CHUNK_CHARS,
+) -> PackedContext:
+    """
+    Fit (title, text) sections into `max_chars`, keeping the chunks most relevant to `query`.
+
+    Sections without a quota are pinned and included first (e.g., the short
+    company/role block). Ranked sections are chunked and scored with BM25
+    against the query; each first takes its best chunks up to its quota share,
+    then any budget left over goes to the best remaining chunks that match the
+    query, and after those to unmatched chunks in document order.
+    Selected chunks are emitted in their original order under "=== title ===".
+    If everything fits in `max_chars`, the sections are returned whole.
+    """
+    quotas = DEFAULT_QUOTAS if quotas is None else quotas
+    sections = [(title, text) for title, text in sections if text and text.strip()]
+    budget = max_chars
+
+    whole = "\n\n".join(f"=== {title} ===\n{text}" for title, text in sections)
+    if len(whole) <= max_chars:
+        chunks_total = sum(len(chunk_text(text, chunk_chars)) for title, text in sections if title in quotas)
+        return PackedContext(
+            text=whole,
+            truncated=False,
+            chunks_total=chunks_total,
+            chunks_used=chunks_total,
+            chars_by_section={title: len(text) for title, text in sections},
+        )
+
+    rendered: Dict[str, List[Chunk]] = {}
+    ranked: List[Chunk] = []
+    for title, text in sections:
+        header_cost = len(f"=== {title} ===\n") + 2  # plus the "\n\n" between sections
+        if title not in quotas:
+            body = text[: max(0, budget - header_cost)]
+            rendered[title] = [Chunk(title, 0, body)]
+            budget -= header_cost + len(body)
+        else:
+            rendered[title] = []
+            budget -= header_cost
+            ranked.extend(Chunk(title, idx, chunk) for idx, chunk in enumerate(chunk_text(text, chunk_chars)))
+
+    scores = bm25_scores([tokenize(chunk.text) for chunk in ranked], tokenize(query))
+    for chunk, score in zip(ranked, scores):
+        chunk.score = score
+    # Best first; ties keep document order, so with no query this degrades to per-section head truncation.
+    order = sorted(ranked, key=lambda chunk: (-chunk.score, chunk.index))
+
+    present = {chunk.section for chunk in ranked}
+    share_total = sum(quotas[title] for title in present) or 1.0
+    allowance = {title: max(0, budget) * quotas[title] / share_total for title in present}
+
+    selected = set()
+    used = 0
+    for chunk in order:
+        cost = len(chunk.text) + 2
+        if cost <= allowance[chunk.section] and used + cost <= budget:
+            allowance[chunk.section] -= cost
+            used += cost
+            selected.add(id(chunk))
+    # Leftover budget: chunks that match the query first, best first; then the rest in document order.
+    leftovers = [chunk for chunk in order if chunk.score > 0] + [chunk for chunk in ranked if chunk.score <= 0]
+    for chunk in leftovers:
+        cost = len(chunk.text) + 2
+        if id(chunk) not in selected and used + cost <= budget:
+            used += cost
+            selected.add(id(chunk))
+
+    for chunk in ranked:
+        if id(chunk) in selected:
+            rendered[chunk.section].append(chunk)
+
+    blocks = []
+    chars_by_section: Dict[str, int] = {}
+    for title, _ in sections:
+        chunks = sorted(rendered[title], key=lambda chunk: chunk.index)
+        body = "\n\n".join(chunk.text for chunk in chunks)
+        chars_by_section[title] = len(body)
+        if body:
+            blocks.append(f"=== {title} ===\n{body}")
+
+    pinned_cut = any(
+        title not in quotas and len(rendered[title][0].text) < len(text) for title, text in sections
+    )
+    return PackedContext(
+        text="\n\n".join(blocks),
+        truncated=pinned_cut or len(selected) < len(ranked),
+        chunks_total=len(ranked),
+        chunks_used=len(selected),
+        chars_by_section=chars_by_section,
+    )
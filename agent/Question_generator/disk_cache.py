@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+class TTLDiskCache:
+    """
+    Disk-backed JSON cache with TTL and LRU eviction by total size.
+
+    Each entry is a JSON file named after its key. Entries older than
+    `ttl_seconds` are treated as misses and removed; file mtime is bumped on
+    every hit, so size-based eviction removes the least recently used first.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_bytes: int,
+        ttl_seconds: float,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for key, or None on miss/expiry."""
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.expired += 1
+                self.misses += 1
+            return None
+
+        try:
+            # Mark as recently used.
+            os.utime(path, None)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return entry
+
+    def put_entry(self, key: str, data: Dict[str, Any]) -> None:
+        """Store an entry and evict old entries if over the size cap."""
+        entry = {**data, "created_at": time.time()}
+        path = self._entry_path(key)
+        with self._lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so concurrent readers never see a partial entry.
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort(key=lambda item: item[0])
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current disk usage."""
+        entries = list(self.cache_dir.glob("*.json")) if self.cache_dir.exists() else []
+        size = 0
+        for path in entries:
+            try:
+                size += path.stat().st_size
+            except OSError:
+                continue
+        return {
+            "cache_dir": str(self.cache_dir),
+            "entries": len(entries),
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+        }
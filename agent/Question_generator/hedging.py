@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Hedging is off unless LLM_HEDGE is set; a request may still opt in or out.
+LLM_HEDGE_ENABLED = os.getenv("LLM_HEDGE", "").lower() in {"1", "true", "yes", "on"}
+LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+LLM_HEDGE_INITIAL_DELAY = float(os.getenv("LLM_HEDGE_INITIAL_DELAY", "10"))
+LLM_HEDGE_MIN_DELAY = float(os.getenv("LLM_HEDGE_MIN_DELAY", "1"))
+LLM_HEDGE_MAX_DELAY = float(os.getenv("LLM_HEDGE_MAX_DELAY", "60"))
+LLM_HEDGE_FALLBACK_MODEL = os.getenv("LLM_HEDGE_FALLBACK_MODEL") or None
+LLM_HEDGE_MAX_WORKERS = int(os.getenv("LLM_HEDGE_MAX_WORKERS", "16"))
+LLM_HEDGE_WINDOW = int(os.getenv("LLM_HEDGE_WINDOW", "200"))
+
+
+@dataclass
+class HedgePolicy:
+    enabled: bool = LLM_HEDGE_ENABLED
+    percentile: float = LLM_HEDGE_PERCENTILE
+    min_samples: int = LLM_HEDGE_MIN_SAMPLES  # below this, initial_delay is used
+    initial_delay: float = LLM_HEDGE_INITIAL_DELAY
+    min_delay: float = LLM_HEDGE_MIN_DELAY
+    max_delay: float = LLM_HEDGE_MAX_DELAY
+    fallback_model: Optional[str] = LLM_HEDGE_FALLBACK_MODEL  # None: hedge with the same model
+
+
+class LatencyTracker:
+    """Sliding window of recent call latencies (seconds)."""
+
+    def __init__(self, window: int = LLM_HEDGE_WINDOW) -> None:
+        self._lock = threading.Lock()
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = min(len(samples) - 1, max(0, round(pct / 100 * (len(samples) - 1))))
+        return samples[rank]
+
+
+class Hedger:
+    """
+    Send a duplicate request when the first one is slower than the recent p-th percentile.
+
+    The first successful attempt wins. A blocking SDK call cannot be interrupted
+    mid-flight, so the loser is cancelled if it has not started and otherwise
+    abandoned: its result is discarded, but its latency is still recorded (so
+    hedging does not hide the tail it reacts to) and, when the hedge won, used
+    to measure the time saved.
+    """
+
+    def __init__(self, policy: Optional[HedgePolicy] = None, max_workers: int = LLM_HEDGE_MAX_WORKERS) -> None:
+        self.policy = policy or HedgePolicy()
+        self.latencies = LatencyTracker()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-hedge")
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.saved_seconds = 0.0
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for the first attempt before hedging."""
+        policy = self.policy
+        if len(self.latencies) < policy.min_samples:
+            return policy.initial_delay
+        observed = self.latencies.percentile(policy.percentile) or policy.initial_delay
+        return min(policy.max_delay, max(policy.min_delay, observed))
+
+    def call(self, request: Callable[[str], T], model: str) -> T:
+        """
+        Run request(model), hedging with request(fallback or model) past the delay.
+
+        Errors propagate only when every launched attempt failed; the first
+        error is raised.
+        """
+        with self._lock:
+            self.calls += 1
+        delay = self.hedge_delay()
+        start = time.monotonic()
+        primary = self._pool.submit(self._timed, request, model)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        hedge = self._pool.submit(self._timed, request, self.policy.fallback_model or model)
+        with self._lock:
+            self.hedged += 1
+
+        pending = {primary, hedge}
+        first_error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    first_error = first_error or future.exception()
+                    continue
+                if future is hedge:
+                    with self._lock:
+                        self.hedge_wins += 1
+                    if primary in pending:
+                        winner_elapsed = time.monotonic() - start
+                        primary.add_done_callback(
+                            lambda loser, elapsed=winner_elapsed: self._record_saving(loser, start, elapsed)
+                        )
+                for loser in pending:
+                    loser.cancel()
+                return future.result()
+        assert first_error is not None
+        raise first_error
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            calls, hedged, wins, saved = self.calls, self.hedged, self.hedge_wins, self.saved_seconds
+        p50 = self.latencies.percentile(50)
+        p99 = self.latencies.percentile(99)
+        return {
+            "enabled": self.policy.enabled,
+            "fallback_model": self.policy.fallback_model,
+            "calls": calls,
+            "hedged": hedged,
+            "hedge_rate": round(hedged / calls, 3) if calls else None,
+            "hedge_wins": wins,
+            "saved_seconds": round(saved, 3),
+            "hedge_delay": round(self.hedge_delay(), 3),
+            "latency_p50": round(p50, 3) if p50 is not None else None,
+            "latency_p99": round(p99, 3) if p99 is not None else None,
+        }
+
+    def _timed(self, request: Callable[[str], T], model: str) -> T:
+        started = time.monotonic()
+        result = request(model)
+        self.latencies.record(time.monotonic() - started)
+        return result
+
+    def _record_saving(self, loser: Future, start: float, winner_elapsed: float) -> None:
+        # Only a primary that eventually succeeded tells us how long we would have waited.
+        if loser.cancelled() or loser.exception() is not None:
+            return
+        with self._lock:
+            self.saved_seconds += max(0.0, time.monotonic() - start - winner_elapsed)
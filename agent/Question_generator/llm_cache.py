@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+# Support both package import (Question_generator.llm_cache) and Docker (flat module)
+try:
+    from Question_generator.disk_cache import TTLDiskCache
+except ModuleNotFoundError:
+    from disk_cache import TTLDiskCache
+
+# Shared by every worker on the host; entries are small JSON files.
+DEFAULT_CACHE_DIR = os.getenv("LLM_CACHE_DIR", "/app/outputs/.llm_cache")
+DEFAULT_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+DEFAULT_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+
+def build_prompt_key(model: str, messages: List[Dict[str, str]], temperature: float) -> str:
+    """Hash model, the full message list, and temperature into one cache key."""
+    payload = json.dumps(
+        {"model": model, "messages": messages, "temperature": temperature},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache(TTLDiskCache):
+    """Cache of LLM text responses keyed by build_prompt_key()."""
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ):
+        super().__init__(cache_dir, max_bytes, ttl_seconds)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response text for key, or None on miss/expiry."""
+        entry = self.get_entry(key)
+        return entry.get("text") if entry is not None else None
+
+    def put(self, key: str, text: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Store a response and evict old entries if over the size cap."""
+        self.put_entry(key, {"text": text, **(metadata or {})})
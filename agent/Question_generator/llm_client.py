@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import httpx
+from openai import OpenAI
+
+# Connection pool and timeouts for the shared OpenAI client.
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "32"))
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "16"))
+OPENAI_KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "120"))
+OPENAI_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "5"))
+OPENAI_READ_TIMEOUT = float(os.getenv("OPENAI_READ_TIMEOUT", "120"))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+
+
+class ConnectionStats:
+    """
+    Counts HTTP requests and the new connections/TLS handshakes they needed.
+
+    Uses httpcore's trace extension: a request that opens no TCP connection
+    was served on a pooled keep-alive connection.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+
+    def on_request(self, request: httpx.Request) -> None:
+        with self._lock:
+            self.requests += 1
+        request.extensions["trace"] = self._trace
+
+    def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self.new_connections += 1
+        elif event_name == "connection.start_tls.complete":
+            with self._lock:
+                self.tls_handshakes += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            reused = max(0, self.requests - self.new_connections)
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "tls_handshakes": self.tls_handshakes,
+                "reused_connections": reused,
+                "reuse_ratio": round(reused / self.requests, 3) if self.requests else None,
+            }
+
+
+CONNECTION_STATS = ConnectionStats()
+
+_SHARED_CLIENT: Optional[OpenAI] = None
+_SHARED_LOCK = threading.Lock()
+
+
+def build_pooled_client(api_key: str, base_url: Optional[str] = None) -> OpenAI:
+    """Create an OpenAI client on a keep-alive httpx pool that reports into CONNECTION_STATS."""
+    http_client = httpx.Client(
+        limits=httpx.Limits(
+            max_connections=OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(OPENAI_READ_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT),
+        event_hooks={"request": [CONNECTION_STATS.on_request]},
+    )
+    return OpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=http_client,
+        max_retries=OPENAI_MAX_RETRIES,
+    )
+
+
+def get_shared_client() -> OpenAI:
+    """Return the process-wide OpenAI client, creating it on first use."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is not None:
+        return _SHARED_CLIENT
+    with _SHARED_LOCK:
+        if _SHARED_CLIENT is None:
+            api_key = os.getenv("OPENAI_API_KEY")
+            if not api_key:
+                raise RuntimeError("OPENAI_API_KEY environment variable is required.")
+            # OPENAI_BASE_URL lets tests point the pool at a local fake server.
+            _SHARED_CLIENT = build_pooled_client(api_key, base_url=os.getenv("OPENAI_BASE_URL") or None)
+        return _SHARED_CLIENT
+
+
+def close_shared_client() -> None:
+    global _SHARED_CLIENT
+    with _SHARED_LOCK:
+        if _SHARED_CLIENT is not None:
+            _SHARED_CLIENT.close()
+            _SHARED_CLIENT = None
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Connection reuse counters plus the pool configuration."""
+    return {
+        "initialized": _SHARED_CLIENT is not None,
+        "max_connections": OPENAI_MAX_CONNECTIONS,
+        "max_keepalive_connections": OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+        "keepalive_expiry": OPENAI_KEEPALIVE_EXPIRY,
+        **CONNECTION_STATS.snapshot(),
+    }
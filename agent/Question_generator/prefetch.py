@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# Unclaimed prefetches (e.g., abandoned sessions) are dropped after this long.
+PREFETCH_TTL_SECONDS = float(os.getenv("SEARCH_PREFETCH_TTL_SECONDS", "900"))
+PREFETCH_MAX_ENTRIES = int(os.getenv("SEARCH_PREFETCH_MAX_ENTRIES", "256"))
+PREFETCH_WORKERS = int(os.getenv("SEARCH_PREFETCH_WORKERS", "4"))
+
+
+@dataclass
+class _Entry:
+    params: Hashable
+    future: Future
+    created: float
+
+
+class SearchPrefetcher:
+    """
+    Runs work in the background keyed by session, for a later request to claim.
+
+    A claim only matches if it asks for the same params the prefetch was
+    started with; otherwise the caller should do the work itself.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = PREFETCH_TTL_SECONDS,
+        max_entries: int = PREFETCH_MAX_ENTRIES,
+        workers: int = PREFETCH_WORKERS,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _Entry] = {}
+        self.started = 0
+        self.claimed = 0
+        self.mismatched = 0
+        self.expired = 0
+
+    def start(self, session_id: str, params: Hashable, fn: Callable[[], Any]) -> None:
+        """Submit fn() for session_id, replacing any earlier prefetch for it."""
+        future = self._pool.submit(fn)
+        with self._lock:
+            self._prune()
+            self._entries[session_id] = _Entry(params, future, time.monotonic())
+            while len(self._entries) > self.max_entries:
+                oldest = min(self._entries, key=lambda sid: self._entries[sid].created)
+                del self._entries[oldest]
+                self.expired += 1
+            self.started += 1
+
+    def claim(self, session_id: str, params: Hashable) -> Optional[Future]:
+        """Remove and return the session's prefetch future if its params match, else None."""
+        with self._lock:
+            self._prune()
+            entry = self._entries.pop(session_id, None)
+            if entry is None:
+                return None
+            if entry.params != params:
+                self.mismatched += 1
+                return None
+            self.claimed += 1
+            return entry.future
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "pending": len(self._entries),
+                "started": self.started,
+                "claimed": self.claimed,
+                "mismatched": self.mismatched,
+                "expired": self.expired,
+            }
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        for session_id in [sid for sid, entry in self._entries.items() if entry.created < cutoff]:
+            del self._entries[session_id]
+            self.expired += 1
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import List
+
+_QUESTIONS_KEY_RE = re.compile(r'"questions"\s*:\s*\[')
+
+
+class QuestionStreamParser:
+    """
+    Incrementally extract the strings of the "questions" array from streamed JSON.
+
+    The model answers with {"questions": ["...", "...", "..."]}; each string is
+    returned by feed() as soon as its closing quote arrives, without waiting
+    for the rest of the document.
+    """
+
+    def __init__(self) -> None:
+        self.questions: List[str] = []
+        self._buffer = ""
+        self._pos = 0
+        self._in_array = False
+        self._done = False
+
+    def feed(self, delta: str) -> List[str]:
+        """Add streamed text; return the questions completed by it."""
+        self._buffer += delta
+        completed: List[str] = []
+        while not self._done:
+            if not self._in_array:
+                match = _QUESTIONS_KEY_RE.search(self._buffer, self._pos)
+                if match is None:
+                    break
+                self._pos = match.end()
+                self._in_array = True
+                continue
+
+            pos = self._pos
+            while pos < len(self._buffer) and self._buffer[pos] in " \t\r\n,":
+                pos += 1
+            self._pos = pos
+            if pos >= len(self._buffer):
+                break
+            if self._buffer[pos] != '"':
+                # "]" ends the array; anything else is not a list of strings, leave it to close().
+                self._done = True
+                break
+            end = self._string_end(pos)
+            if end is None:
+                break
+            question = json.loads(self._buffer[pos : end + 1])
+            self._pos = end + 1
+            self.questions.append(question)
+            completed.append(question)
+        return completed
+
+    def close(self) -> List[str]:
+        """
+        Finish the stream; return any questions only a full parse could find.
+
+        Covers responses the incremental scan can't follow (e.g., non-string
+        items); questions already returned by feed() are not repeated.
+        """
+        self._done = True
+        try:
+            payload = json.loads(self._buffer)
+        except json.JSONDecodeError:
+            return []
+        questions = payload.get("questions", []) if isinstance(payload, dict) else []
+        remaining = [str(q) for q in questions[len(self.questions) :]]
+        self.questions.extend(remaining)
+        return remaining
+
+    def _string_end(self, start: int) -> int | None:
+        pos = start + 1
+        while pos < len(self._buffer):
+            char = self._buffer[pos]
+            if char == "\\":
+                pos += 2
+                continue
+            if char == '"':
+                return pos
+            pos += 1
+        return None
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import json
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Optional
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 HACKATHON_ROOT = Path(__file__).resolve().parents[1]
@@ -14,14 +16,34 @@ if str(HACKATHON_ROOT) not in sys.path:
 
 from PDF_Reader import PDFExtraction  # noqa: E402
 
-from agent import generate_questions, _write_txt  # noqa: E402
+from agent import (  # noqa: E402
+    LLM_CACHE,
+    LLM_HEDGER,
+    SEARCH_CACHE,
+    SEARCH_PREFETCHER,
+    _write_question,
+    _write_txt,
+    generate_questions,
+)
+
+# Same import path as agent.py, so the server and agent share one client pool and its stats.
+try:
+    from Question_generator.batch import (  # noqa: E402
+        BATCH_CONCURRENCY,
+        BATCH_MAX_RETRIES,
+        BATCH_RPM,
+        BATCH_TPM,
+        BatchStats,
+    )
+    from Question_generator.llm_client import close_shared_client, get_shared_client, pool_stats  # noqa: E402
+except ModuleNotFoundError:
+    from batch import BATCH_CONCURRENCY, BATCH_MAX_RETRIES, BATCH_RPM, BATCH_TPM, BatchStats  # noqa: E402
+    from llm_client import close_shared_client, get_shared_client, pool_stats  # noqa: E402
 
 app = FastAPI(title="Question Generator MCP Service", version="1.0.0")
 
 
-class GenerateRequest(BaseModel):
-    introduce_text: str
-    portfolio_text: str
+class SearchOptions(BaseModel):
     company: str = "kakao"
     role: str = "백엔드 개발자"
     search_keywords: list[str] = Field(
@@ -33,17 +55,95 @@ class GenerateRequest(BaseModel):
     )
     search_results_per_query: int = 3
     max_search_chars: int = 2000
+    use_search_cache: bool = True
+
+
+class GenerateRequest(SearchOptions):
+    introduce_text: str
+    portfolio_text: str
     model: str = "gpt-5.1"
     max_context_chars: int = 16000  # Increased for two documents
+    use_llm_cache: Optional[bool] = None  # None: cache temperature-0 calls only
+    hedge_llm: Optional[bool] = None  # None: follow LLM_HEDGE; ignored by /generate_stream
+    session_id: Optional[str] = None  # Claims the search started by /prefetch for this session
+
+
+class PrefetchRequest(SearchOptions):
+    session_id: str
+
+
+class PrefetchResponse(BaseModel):
+    session_id: str
+    started: bool
+
+
+class BatchRecord(SearchOptions):
+    id: Optional[str] = None  # defaults to the record's position
+    introduce_text: str
+    portfolio_text: str
+
+
+class BatchRequest(BaseModel):
+    records: list[BatchRecord]
+    model: str = "gpt-5.1"
+    max_context_chars: int = 16000
+    concurrency: int = BATCH_CONCURRENCY
+    rpm: int = BATCH_RPM  # LLM requests per minute for this batch
+    tpm: int = BATCH_TPM  # LLM tokens per minute for this batch
+    max_retries: int = BATCH_MAX_RETRIES
+    use_llm_cache: Optional[bool] = None
 
 
 class GenerateResponse(BaseModel):
     questions: list[str]
+    search: Optional[dict] = None  # {"queries": n, "cache_hits": k[, "prefetched": true]} when a search ran
+
+
+@app.on_event("startup")
+def create_openai_client() -> None:
+    # Build the pooled client up front; requests then reuse its keep-alive connections.
+    if os.getenv("OPENAI_API_KEY"):
+        get_shared_client()
+
+
+@app.on_event("shutdown")
+def close_openai_client() -> None:
+    close_shared_client()
 
 
 @app.get("/health")
 def health() -> dict:
-    return {"status": "ok", "service": "question_generator"}
+    return {
+        "status": "ok",
+        "service": "question_generator",
+        "openai_pool": pool_stats(),
+        "llm_cache": LLM_CACHE.stats(),
+        "llm_hedge": LLM_HEDGER.stats(),
+        "search_cache": SEARCH_CACHE.stats(),
+        "search_prefetch": SEARCH_PREFETCHER.stats(),
+    }
+
+
+@app.post("/prefetch", response_model=PrefetchResponse)
+def prefetch(req: PrefetchRequest) -> PrefetchResponse:
+    """
+    Start the company/role search for a session in the background.
+
+    A later /generate with the same session_id and search options uses the
+    result, so the search overlaps with PDF extraction.
+    """
+    from agent import prefetch_company_role_search
+
+    started = prefetch_company_role_search(
+        session_id=req.session_id,
+        company=req.company,
+        role=req.role,
+        search_keywords=req.search_keywords,
+        search_results_per_query=req.search_results_per_query,
+        max_search_chars=req.max_search_chars,
+        use_search_cache=req.use_search_cache,
+    )
+    return PrefetchResponse(session_id=req.session_id, started=started)
 
 
 @app.post("/generate", response_model=GenerateResponse)
@@ -61,6 +161,7 @@ def generate(req: GenerateRequest) -> GenerateResponse:
         from agent import generate_questions_from_texts
 
         # Generate questions using both texts
+        search_stats: Dict[str, Any] = {}
         questions_list = generate_questions_from_texts(
             introduce_text=req.introduce_text,
             portfolio_text=req.portfolio_text,
@@ -71,6 +172,11 @@ def generate(req: GenerateRequest) -> GenerateResponse:
             search_keywords=req.search_keywords,
             search_results_per_query=req.search_results_per_query,
             max_search_chars=req.max_search_chars,
+            use_llm_cache=req.use_llm_cache,
+            use_search_cache=req.use_search_cache,
+            search_stats=search_stats,
+            hedge_llm=req.hedge_llm,
+            session_id=req.session_id,
             client=None,  # Will use default client
         )
 
@@ -81,11 +187,113 @@ def generate(req: GenerateRequest) -> GenerateResponse:
 
         return GenerateResponse(
             questions=questions_list,
+            search=search_stats or None,
         )
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@app.post("/generate_stream")
+def generate_stream(req: GenerateRequest) -> StreamingResponse:
+    """
+    Stream questions as NDJSON as soon as each one is complete.
+
+    Emits {"type": "question", "index": i, "question": ...} per question
+    (question_{i}.txt is written before the line is sent), then
+    {"type": "end", "questions": [...], "search": ...}, or
+    {"type": "error", "error": ...} if generation fails midway.
+    """
+    if not os.getenv("OPENAI_API_KEY"):
+        raise HTTPException(
+            status_code=500,
+            detail="OPENAI_API_KEY environment variable is required.",
+        )
+
+    from agent import stream_questions_from_texts
+
+    output_dir = Path("/app/outputs")
+
+    def lines() -> Iterator[str]:
+        search_stats: Dict[str, Any] = {}
+        questions: list[str] = []
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            for question in stream_questions_from_texts(
+                introduce_text=req.introduce_text,
+                portfolio_text=req.portfolio_text,
+                model=req.model,
+                max_context_chars=req.max_context_chars,
+                company=req.company,
+                role=req.role,
+                search_keywords=req.search_keywords,
+                search_results_per_query=req.search_results_per_query,
+                max_search_chars=req.max_search_chars,
+                use_llm_cache=req.use_llm_cache,
+                use_search_cache=req.use_search_cache,
+                search_stats=search_stats,
+                session_id=req.session_id,
+            ):
+                questions.append(question)
+                _write_question(question, len(questions), output_dir)
+                record = {"type": "question", "index": len(questions), "question": question}
+                yield json.dumps(record, ensure_ascii=False) + "\n"
+        except Exception as exc:
+            yield json.dumps({"type": "error", "error": str(exc)}, ensure_ascii=False) + "\n"
+            return
+        end = {"type": "end", "questions": questions, "search": search_stats or None}
+        yield json.dumps(end, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.post("/generate_batch")
+def generate_batch(req: BatchRequest) -> StreamingResponse:
+    """
+    Generate questions for many candidates under a requests/tokens-per-minute budget, streamed as NDJSON.
+
+    Emits {"type": "result", "id", "status", "questions", ...} per record in
+    completion order, then {"type": "summary", ...} with throughput figures.
+    No question_{i}.txt files are written.
+    """
+    if not os.getenv("OPENAI_API_KEY"):
+        raise HTTPException(
+            status_code=500,
+            detail="OPENAI_API_KEY environment variable is required.",
+        )
+    if req.rpm <= 0 or req.tpm <= 0:
+        raise HTTPException(status_code=400, detail="rpm and tpm must be positive.")
+
+    from agent import generate_questions_batch
+
+    records = [record.model_dump(exclude_none=True) for record in req.records]
+
+    def lines() -> Iterator[str]:
+        stats = BatchStats()
+        results = generate_questions_batch(
+            records,
+            model=req.model,
+            max_context_chars=req.max_context_chars,
+            concurrency=req.concurrency,
+            rpm=req.rpm,
+            tpm=req.tpm,
+            max_retries=req.max_retries,
+            use_llm_cache=req.use_llm_cache,
+            stats=stats,
+        )
+        try:
+            for result in results:
+                yield json.dumps({"type": "result", **result}, ensure_ascii=False) + "\n"
+        except Exception as exc:
+            yield json.dumps({"type": "error", "error": str(exc)}, ensure_ascii=False) + "\n"
+            return
+        finally:
+            # Closing the stream early (client disconnected) cancels the records not yet started.
+            results.close()
+        yield json.dumps({"type": "summary", **stats.summary()}) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 if __name__ == "__main__":
     import uvicorn
 
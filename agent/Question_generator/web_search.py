@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+# Support both package import (Question_generator.web_search) and Docker (flat module)
+try:
+    from Question_generator.disk_cache import TTLDiskCache
+except ModuleNotFoundError:
+    from disk_cache import TTLDiskCache
+
+# A search backend takes (query, max_results) and returns DDGS-style items: {"title", "body", "href"}.
+SearchBackend = Callable[[str, int], List[Dict[str, Any]]]
+
+# Queries in flight at once, and how long a single query may take.
+MAX_SEARCH_CONCURRENCY = int(os.getenv("SEARCH_MAX_CONCURRENCY", "4"))
+SEARCH_QUERY_TIMEOUT = float(os.getenv("SEARCH_QUERY_TIMEOUT", "10"))
+
+# Company/role searches repeat across candidates; results are reused for a day by default.
+DEFAULT_SEARCH_CACHE_DIR = os.getenv("SEARCH_CACHE_DIR", "/app/outputs/.search_cache")
+DEFAULT_SEARCH_CACHE_MAX_BYTES = int(os.getenv("SEARCH_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+DEFAULT_SEARCH_CACHE_TTL_SECONDS = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", str(24 * 3600)))
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for cache lookups: NFKC, case-folded, single spaces."""
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def build_search_key(query: str, per_query: int) -> str:
+    payload = json.dumps({"query": normalize_query(query), "per_query": per_query}, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SearchResultCache(TTLDiskCache):
+    """Cache of per-query search results keyed by normalized query and result count."""
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = DEFAULT_SEARCH_CACHE_DIR,
+        max_bytes: int = DEFAULT_SEARCH_CACHE_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_SEARCH_CACHE_TTL_SECONDS,
+    ):
+        super().__init__(cache_dir, max_bytes, ttl_seconds)
+
+    def get(self, query: str, per_query: int) -> Optional[List[Dict[str, Any]]]:
+        entry = self.get_entry(build_search_key(query, per_query))
+        return entry.get("items") if entry is not None else None
+
+    def put(self, query: str, per_query: int, items: List[Dict[str, Any]]) -> None:
+        self.put_entry(build_search_key(query, per_query), {"query": query, "items": items})
+
+
+def duckduckgo_backend(timeout: float = SEARCH_QUERY_TIMEOUT) -> SearchBackend:
+    """Return a DuckDuckGo backend; each call uses its own DDGS session so calls can run in parallel."""
+    try:
+        from duckduckgo_search import DDGS
+    except ImportError as exc:  # pragma: no cover - informs misconfiguration
+        raise RuntimeError(
+            "duckduckgo-search is required for web search. Install via `pip install duckduckgo-search`."
+        ) from exc
+
+    def search(query: str, max_results: int) -> List[Dict[str, Any]]:
+        with DDGS(timeout=timeout) as ddgs:
+            return list(ddgs.text(query, max_results=max_results) or [])
+
+    return search
+
+
+def search_many(
+    queries: Sequence[str],
+    per_query: int,
+    backend: SearchBackend,
+    max_concurrency: int = MAX_SEARCH_CONCURRENCY,
+    timeout: float = SEARCH_QUERY_TIMEOUT,
+) -> List[Optional[List[Dict[str, Any]]]]:
+    """
+    Run queries concurrently and return their results in query order.
+
+    Element i holds the items for queries[i], or None if that query failed or
+    did not finish within its deadline. At most `max_concurrency` queries run
+    at once and each gets `timeout` seconds, so the whole fan-out is bounded
+    by `timeout` times the number of waves.
+    """
+    if not queries:
+        return []
+
+    workers = max(1, min(max_concurrency, len(queries)))
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search")
+    try:
+        futures = [pool.submit(backend, query, per_query) for query in queries]
+        waves = math.ceil(len(queries) / workers)
+        done, _ = wait(futures, timeout=timeout * waves)
+
+        results: List[Optional[List[Dict[str, Any]]]] = []
+        for future in futures:
+            if future not in done or future.exception() is not None:
+                results.append(None)
+            else:
+                results.append(future.result())
+        return results
+    finally:
+        # Don't block on stragglers past the deadline; their results are discarded.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def cached_search_many(
+    queries: Sequence[str],
+    per_query: int,
+    backend: SearchBackend,
+    cache: Optional[SearchResultCache],
+) -> Tuple[List[Optional[List[Dict[str, Any]]]], int]:
+    """
+    search_many() that serves queries from the cache and only searches the rest.
+
+    Successful results (including empty ones) are cached; failed or timed-out
+    queries are not.
+
+    Returns:
+        (per-query results in query order, number of queries served from cache)
+    """
+    if cache is None:
+        return search_many(queries, per_query, backend), 0
+
+    results: List[Optional[List[Dict[str, Any]]]] = [cache.get(query, per_query) for query in queries]
+    missing = [idx for idx, items in enumerate(results) if items is None]
+    hits = len(queries) - len(missing)
+    if missing:
+        fresh = search_many([queries[idx] for idx in missing], per_query, backend)
+        for idx, items in zip(missing, fresh):
+            results[idx] = items
+            if items is not None:
+                try:
+                    cache.put(queries[idx], per_query, items)
+                except OSError as exc:
+                    # A read-only or full cache volume must not fail the search.
+                    print(f"Search cache write failed: {exc}")
+    return results, hits
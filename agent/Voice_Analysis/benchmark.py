@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import soundfile as sf
+import torch
+
+# Support both package import (Voice_Analysis.benchmark) and Docker (flat module)
+try:
+    from Voice_Analysis import voice_analysis as va
+    from Voice_Analysis.model_loader import current_rss_bytes
+except ModuleNotFoundError:
+    import voice_analysis as va
+    from model_loader import current_rss_bytes
+
+PATTERNS = ("tone", "noise", "silence")
+# Decode backends for the preprocessing path: soundfile (wav fast path) or PyAV (video/compressed path).
+BACKENDS = ("soundfile", "pyav")
+
+
+def synthesize_audio(pattern: str, seconds: float, sample_rate: int, channels: int) -> np.ndarray:
+    """
+    Generate deterministic test audio of shape (samples, channels).
+
+    tone: two harmonics with a slow amplitude envelope (voiced-like)
+    noise: white noise
+    silence: 1s tone bursts alternating with 1s of silence
+    """
+    rng = np.random.default_rng(0)
+    n = int(seconds * sample_rate)
+    t = np.arange(n, dtype=np.float32) / sample_rate
+
+    if pattern == "tone":
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 0.5 * t)
+        mono = 0.3 * envelope * (np.sin(2 * np.pi * 220 * t) + 0.5 * np.sin(2 * np.pi * 440 * t))
+    elif pattern == "noise":
+        mono = 0.1 * rng.standard_normal(n)
+    elif pattern == "silence":
+        gate = (np.floor(t) % 2 == 0).astype(np.float32)
+        mono = 0.3 * gate * np.sin(2 * np.pi * 220 * t)
+    else:
+        raise ValueError(f"Unknown pattern: {pattern} (expected one of {PATTERNS})")
+
+    mono = mono.astype(np.float32)
+    if channels == 1:
+        return mono[:, None]
+    # Second channel slightly delayed so the channels are not identical
+    shifted = np.roll(mono, sample_rate // 100)
+    return np.stack([mono, shifted][:channels], axis=1)
+
+
+class _PeakRSSSampler:
+    """Background thread sampling process RSS to capture the peak during a run."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, current_rss_bytes())
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "_PeakRSSSampler":
+        self.peak = current_rss_bytes()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss_bytes())
+
+
+def _preprocess(path: Path, backend: str, processor) -> torch.Tensor:
+    if backend == "pyav":
+        waveform = va._decode_audio_track(path)
+    elif backend == "soundfile":
+        waveform = va.load_waveform(path)
+    else:
+        raise ValueError(f"Unknown backend: {backend} (expected one of {BACKENDS})")
+    inputs = processor(waveform.squeeze().numpy(), sampling_rate=va.TARGET_SAMPLE_RATE, return_tensors="pt")
+    return inputs.input_values[0]
+
+
+def run_case(
+    path: Path,
+    audio_seconds: float,
+    backend: str,
+    threads: int,
+    max_inference_seconds: float,
+) -> Dict[str, Any]:
+    """Benchmark preprocessing + transcription of one file; returns a result record."""
+    torch.set_num_threads(threads)
+    model, processor = va._load_model_and_processor()
+    if torch.cuda.is_available():
+        torch.cuda.reset_peak_memory_stats()
+
+    record: Dict[str, Any] = {"backend": backend, "threads": threads, "status": "ok"}
+    rss_start = current_rss_bytes()
+    try:
+        with _PeakRSSSampler() as sampler:
+            start = time.perf_counter()
+            input_values = _preprocess(path, backend, processor)
+            preprocess_seconds = time.perf_counter() - start
+
+            inference_seconds = None
+            if audio_seconds <= max_inference_seconds:
+                start = time.perf_counter()
+                va._run_inference(input_values, model, processor)
+                inference_seconds = time.perf_counter() - start
+            else:
+                # Unchunked attention over long inputs needs tens of GB; measure preprocessing only.
+                record["status"] = "inference_skipped"
+    except Exception as exc:
+        record.update(status="error", error=str(exc))
+        return record
+
+    total = preprocess_seconds + (inference_seconds or 0.0)
+    record.update(
+        preprocess_seconds=round(preprocess_seconds, 4),
+        inference_seconds=round(inference_seconds, 4) if inference_seconds is not None else None,
+        total_seconds=round(total, 4),
+        rtf=round(total / audio_seconds, 5),
+        preprocess_rtf=round(preprocess_seconds / audio_seconds, 5),
+        inference_rtf=round(inference_seconds / audio_seconds, 5) if inference_seconds is not None else None,
+        preprocess_share=round(preprocess_seconds / total, 4) if total else None,
+        peak_rss_bytes=sampler.peak,
+        peak_rss_delta_bytes=max(0, sampler.peak - rss_start),
+    )
+    if torch.cuda.is_available():
+        record["peak_cuda_bytes"] = torch.cuda.max_memory_allocated()
+    return record
+
+
+def run_benchmark(
+    sample_rates: Sequence[int],
+    channels: Sequence[int],
+    patterns: Sequence[str],
+    durations: Sequence[float],
+    threads: Sequence[int],
+    backends: Sequence[str],
+    max_inference_seconds: float = 120.0,
+    workdir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Run the full grid and return a JSON-serializable report."""
+    load_stats = va.preload_model()
+    results: List[Dict[str, Any]] = []
+
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        tmp_dir = Path(tmp)
+        for pattern in patterns:
+            for sample_rate in sample_rates:
+                for n_channels in channels:
+                    for seconds in durations:
+                        audio = synthesize_audio(pattern, seconds, sample_rate, n_channels)
+                        path = tmp_dir / f"{pattern}_{sample_rate}_{n_channels}ch_{seconds:g}s.wav"
+                        sf.write(path, audio, sample_rate, subtype="PCM_16")
+                        for backend in backends:
+                            for n_threads in threads:
+                                record = run_case(path, seconds, backend, n_threads, max_inference_seconds)
+                                record.update(
+                                    pattern=pattern,
+                                    sample_rate=sample_rate,
+                                    channels=n_channels,
+                                    audio_seconds=seconds,
+                                )
+                                print(
+                                    f"{path.name} backend={backend} threads={n_threads} "
+                                    f"status={record['status']} rtf={record.get('rtf')}",
+                                    file=sys.stderr,
+                                    flush=True,
+                                )
+                                results.append(record)
+                        path.unlink(missing_ok=True)
+
+    return {
+        "model": va.MODEL_NAME,
+        "device": va.DEVICE,
+        "torch_version": torch.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "model_load": load_stats,
+        "max_inference_seconds": max_inference_seconds,
+        "results": results,
+    }
+
+
+def _csv_list(cast):
+    def parse(value: str):
+        return [cast(item.strip()) for item in value.split(",") if item.strip()]
+
+    return parse
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Benchmark Voice_Analysis preprocessing/transcription real-time factor on synthetic audio."
+    )
+    parser.add_argument("--sample-rates", type=_csv_list(int), default=[8000, 16000, 44100, 48000])
+    parser.add_argument("--channels", type=_csv_list(int), default=[1, 2])
+    parser.add_argument("--patterns", type=_csv_list(str), default=list(PATTERNS))
+    parser.add_argument(
+        "--durations",
+        type=_csv_list(float),
+        default=[10.0, 60.0, 600.0],
+        help="Audio lengths in seconds (default: 10,60,600).",
+    )
+    parser.add_argument("--threads", type=_csv_list(int), default=[1, 2, 4])
+    parser.add_argument("--backends", type=_csv_list(str), default=list(BACKENDS))
+    parser.add_argument(
+        "--max-inference-seconds",
+        type=float,
+        default=120.0,
+        help="Skip inference (preprocessing only) for longer audio (default: 120).",
+    )
+    parser.add_argument("--out", help="Write the JSON report here instead of stdout.")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    report = run_benchmark(
+        sample_rates=args.sample_rates,
+        channels=args.channels,
+        patterns=args.patterns,
+        durations=args.durations,
+        threads=args.threads,
+        backends=args.backends,
+        max_inference_seconds=args.max_inference_seconds,
+    )
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        Path(args.out).write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import struct
+import time
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+import torch
+import transformers
+from transformers import Wav2Vec2Config, Wav2Vec2ForCTC
+
+# Converted checkpoints live here; keep it on a volume shared by all workers on the host.
+DEFAULT_MODEL_CACHE_DIR = os.getenv("VOICE_MODEL_CACHE_DIR", "/app/outputs/.voice_models")
+
+_SAFETENSORS_DTYPES = {
+    "F64": torch.float64,
+    "F32": torch.float32,
+    "F16": torch.float16,
+    "BF16": torch.bfloat16,
+    "I64": torch.int64,
+    "I32": torch.int32,
+    "I16": torch.int16,
+    "I8": torch.int8,
+    "U8": torch.uint8,
+    "BOOL": torch.bool,
+}
+
+
+def current_rss_bytes() -> int:
+    """Return the resident set size of this process (0 if unavailable)."""
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def mmap_safetensors(path: Union[str, Path]) -> Dict[str, torch.Tensor]:
+    """
+    Map a .safetensors file into memory and return zero-copy tensor views.
+
+    The file is mapped copy-on-write (MAP_PRIVATE), so pages are only read from
+    disk when touched and stay shared with every other process mapping the same
+    file until someone writes to them (inference never does).
+    """
+    path = Path(path)
+    with path.open("rb") as f:
+        (header_len,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_len))
+    header.pop("__metadata__", None)
+    data_start = 8 + header_len
+
+    nbytes = path.stat().st_size
+    storage = torch.UntypedStorage.from_file(str(path), shared=False, nbytes=nbytes)
+
+    tensors: Dict[str, torch.Tensor] = {}
+    for name, info in header.items():
+        dtype = _SAFETENSORS_DTYPES[info["dtype"]]
+        begin, end = info["data_offsets"]
+        byte_offset = data_start + begin
+        itemsize = torch.empty((), dtype=dtype).element_size()
+        if byte_offset % itemsize:
+            raise ValueError(f"Unaligned tensor '{name}' in {path}")
+        tensor = torch.empty(0, dtype=dtype)
+        tensor.set_(storage, byte_offset // itemsize, tuple(info["shape"]))
+        if tensor.numel() * itemsize != end - begin:
+            raise ValueError(f"Size mismatch for tensor '{name}' in {path}")
+        tensors[name] = tensor
+    return tensors
+
+
+def _converted_checkpoint_path(model_name: str, cache_dir: Union[str, Path]) -> Path:
+    # The state_dict layout follows the installed transformers version, so include it in the name.
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+    return Path(cache_dir) / f"{safe_name}-tf{transformers.__version__}.safetensors"
+
+
+def _convert_checkpoint(model_name: str, target: Path) -> Wav2Vec2ForCTC:
+    """Load through from_pretrained once and save a flat safetensors copy for later mmap loads."""
+    from safetensors.torch import save_file
+
+    model = Wav2Vec2ForCTC.from_pretrained(
+        model_name,
+        low_cpu_mem_usage=True,
+        torch_dtype=torch.float32,
+    )
+    state_dict = {name: tensor.contiguous() for name, tensor in model.state_dict().items()}
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_suffix(f".{os.getpid()}.tmp")
+    save_file(state_dict, str(tmp_path), metadata={"model_name": model_name})
+    os.replace(tmp_path, target)
+    return model
+
+
+def load_wav2vec2_mmap(
+    model_name: str,
+    cache_dir: Union[str, Path] = DEFAULT_MODEL_CACHE_DIR,
+) -> Tuple[Wav2Vec2ForCTC, Dict[str, Any]]:
+    """
+    Load Wav2Vec2ForCTC with weights memory-mapped from a local safetensors file.
+
+    The model skeleton is built on the meta device (no weight allocation or
+    random init) and parameters are assigned directly to the mapped tensors.
+    On the first start the checkpoint is converted once; if anything goes wrong
+    we fall back to a regular low-memory from_pretrained load.
+
+    Returns:
+        (model, stats) where stats holds the load strategy, seconds and RSS.
+    """
+    start = time.perf_counter()
+    rss_before = current_rss_bytes()
+    checkpoint = _converted_checkpoint_path(model_name, cache_dir)
+    strategy = "mmap"
+
+    try:
+        if not checkpoint.is_file():
+            strategy = "convert"
+            model = _convert_checkpoint(model_name, checkpoint)
+        else:
+            config = Wav2Vec2Config.from_pretrained(model_name)
+            with torch.device("meta"):
+                model = Wav2Vec2ForCTC(config)
+            model.load_state_dict(mmap_safetensors(checkpoint), strict=True, assign=True)
+            leftover = [name for name, t in model.state_dict().items() if t.is_meta]
+            if leftover:
+                raise RuntimeError(f"Tensors not found in checkpoint: {leftover[:5]}")
+    except Exception as exc:
+        print(f"mmap model load failed ({exc}); falling back to from_pretrained")
+        strategy = "from_pretrained"
+        model = Wav2Vec2ForCTC.from_pretrained(
+            model_name,
+            low_cpu_mem_usage=True,
+            torch_dtype=torch.float32,
+        )
+
+    stats = {
+        "strategy": strategy,
+        "checkpoint": str(checkpoint),
+        "load_seconds": round(time.perf_counter() - start, 3),
+        "rss_before_bytes": rss_before,
+        "rss_after_bytes": current_rss_bytes(),
+    }
+    return model, stats
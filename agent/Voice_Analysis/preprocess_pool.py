@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Callable, Optional, Tuple, TypeVar, Union
+
+import numpy as np
+import torch
+
+# Number of preprocessing processes; 0 runs decode/resample/normalize inline on the request thread.
+PREPROCESS_WORKERS = int(os.getenv("VOICE_PREPROCESS_WORKERS", "2"))
+
+T = TypeVar("T")
+
+# Per-worker feature extractor (normalization only, no model weights).
+_WORKER_FEATURE_EXTRACTOR = None
+
+
+def _init_worker(model_name: str) -> None:
+    global _WORKER_FEATURE_EXTRACTOR
+    from transformers import Wav2Vec2FeatureExtractor
+
+    # Workers run alongside inference; keep each one to a single intra-op thread.
+    torch.set_num_threads(1)
+    _WORKER_FEATURE_EXTRACTOR = Wav2Vec2FeatureExtractor.from_pretrained(model_name)
+
+
+def _preprocess_job(audio_path: str) -> Tuple[str, int]:
+    """
+    Decode, resample, and normalize one file inside a worker process.
+
+    The float32 result is written into a new shared memory block whose name is
+    returned; the parent attaches to it and unlinks it once inference is done.
+    """
+    try:
+        from Voice_Analysis.voice_analysis import TARGET_SAMPLE_RATE, load_waveform
+    except ModuleNotFoundError:
+        from voice_analysis import TARGET_SAMPLE_RATE, load_waveform
+
+    waveform = load_waveform(Path(audio_path))
+    features = _WORKER_FEATURE_EXTRACTOR(
+        waveform.squeeze().numpy(),
+        sampling_rate=TARGET_SAMPLE_RATE,
+        return_tensors="np",
+    )
+    values = np.ascontiguousarray(features.input_values[0], dtype=np.float32)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    try:
+        np.ndarray(values.shape, dtype=np.float32, buffer=shm.buf)[:] = values
+    except Exception:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    return shm.name, values.shape[0]
+
+
+class PreprocessPool:
+    """
+    Small process pool that prepares wav2vec2 input values outside the GIL.
+
+    Requests submit preprocessing here and only take the inference lock once
+    their buffer is ready, so the next job's decode/resample overlaps with the
+    current job's inference.
+    """
+
+    def __init__(self, model_name: str, workers: int = PREPROCESS_WORKERS):
+        self.model_name = model_name
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is not None:
+            return self._executor
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process that already holds torch/model state is unsafe.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.model_name,),
+                )
+            return self._executor
+
+    def _reset(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def run(self, audio_path: Union[str, Path], fn: Callable[[torch.Tensor], T]) -> T:
+        """
+        Preprocess audio in a worker and call fn with the input values.
+
+        The tensor passed to fn is backed by shared memory and is only valid
+        during the call; the block is released as soon as fn returns.
+        """
+        try:
+            name, length = self._get_executor().submit(_preprocess_job, str(audio_path)).result()
+        except BrokenProcessPool:
+            # A worker died (e.g., OOM); start a fresh pool for the next request.
+            self._reset()
+            raise
+
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            values = np.ndarray((length,), dtype=np.float32, buffer=shm.buf)
+            result = fn(torch.from_numpy(values))
+            del values
+            return result
+        finally:
+            shm.unlink()
+            try:
+                shm.close()
+            except BufferError:
+                # Something (e.g., a traceback) still references the buffer; it is unmapped on GC.
+                pass
+
+    def shutdown(self) -> None:
+        self._reset()
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
-from voice_analysis import analyze_audio
+from streaming import stream_registry
+from voice_analysis import (
+    MODEL_LOAD_STATS,
+    PREPROCESS_POOL,
+    TRANSCRIPT_CACHE,
+    TARGET_SAMPLE_RATE,
+    analyze_audio,
+    preload_model,
+)
 
 app = FastAPI(title="Voice Analysis MCP Service", version="1.0.0")
 
@@ -15,6 +26,7 @@ class AnalyzeRequest(BaseModel):
     audio_path: str
     output_csv: Optional[str] = None
     output_txt: Optional[str] = None
+    use_cache: bool = True
 
 
 class AnalyzeResponse(BaseModel):
@@ -23,14 +35,40 @@ class AnalyzeResponse(BaseModel):
     status: str
 
 
+class AttachStreamRequest(BaseModel):
+    output_txt: Optional[str] = None
+
+
+@app.on_event("startup")
+def load_model_on_startup() -> None:
+    # Load eagerly so the first request does not pay for it; set VOICE_PRELOAD_MODEL=0 to skip.
+    if os.getenv("VOICE_PRELOAD_MODEL", "1") == "0":
+        return
+    try:
+        preload_model()
+    except Exception as exc:
+        # Keep serving; the model will be loaded lazily on the first request instead.
+        print(f"Model preload failed: {exc}")
+
+
+@app.on_event("shutdown")
+def stop_preprocess_pool() -> None:
+    PREPROCESS_POOL.shutdown()
+
+
 @app.get("/health")
 def health() -> dict:
-    return {"status": "ok", "service": "voice_analysis"}
+    return {
+        "status": "ok",
+        "service": "voice_analysis",
+        "transcript_cache": TRANSCRIPT_CACHE.stats(),
+        "model": MODEL_LOAD_STATS,
+    }
 
 
 @app.post("/analyze", response_model=AnalyzeResponse)
 def analyze(req: AnalyzeRequest) -> AnalyzeResponse:
-    """Analyze audio emotions from audio file (placeholder implementation)."""
+    """Transcribe an audio file, or the audio track of a video file (mp4/webm)."""
     try:
         audio_path = Path(req.audio_path)
         if not audio_path.is_file():
@@ -54,6 +92,7 @@ def analyze(req: AnalyzeRequest) -> AnalyzeResponse:
             audio_path=audio_path,
             output_csv=csv_path,
             output_txt=txt_path,
+            use_cache=req.use_cache,
         )
 
         # Create summary
@@ -61,6 +100,7 @@ def analyze(req: AnalyzeRequest) -> AnalyzeResponse:
             "transcription": df["transcription"].iloc[0],
             "output_txt": df["output_txt"].iloc[0],
             "audio_path": df["audio_path"].iloc[0],
+            "cache": df["cache"].iloc[0],
         }
 
         return AnalyzeResponse(
@@ -72,6 +112,110 @@ def analyze(req: AnalyzeRequest) -> AnalyzeResponse:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@app.websocket("/ws/stream/{stream_id}")
+async def stream_audio(
+    websocket: WebSocket,
+    stream_id: str,
+    sample_rate: int = TARGET_SAMPLE_RATE,
+    encoding: str = "pcm_s16le",
+    output_txt: Optional[str] = None,
+) -> None:
+    """
+    Transcribe an answer while it is being recorded.
+
+    Binary frames carry raw mono PCM (`encoding` at `sample_rate`). A text frame
+    `{"event": "end"}` finalizes the stream and writes `output_txt` if given.
+    The server replies with `partial` events as windows are transcribed and a
+    single `final` event at the end.
+    """
+    await websocket.accept()
+    try:
+        stream = stream_registry.open(
+            stream_id,
+            sample_rate=sample_rate,
+            encoding=encoding,
+            output_txt=output_txt,
+        )
+    except ValueError as exc:
+        await websocket.send_json({"event": "error", "detail": str(exc)})
+        await websocket.close(code=1008)
+        return
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message.get("type") == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            if message.get("bytes") is not None:
+                # Inference is blocking; keep the event loop free for other streams.
+                changed = await asyncio.to_thread(stream.feed, message["bytes"])
+                if changed:
+                    await websocket.send_json({"event": "partial", **stream.to_dict()})
+                continue
+
+            text = message.get("text") or ""
+            try:
+                event = json.loads(text).get("event")
+            except (json.JSONDecodeError, AttributeError):
+                event = text.strip()
+            if event == "end":
+                await asyncio.to_thread(stream.finalize)
+                await websocket.send_json({"event": "final", **stream.to_dict()})
+                await websocket.close()
+                return
+    except WebSocketDisconnect:
+        # Keep what was received so the admin can still attach it to a session.
+        await asyncio.to_thread(stream.finalize)
+    except Exception as exc:
+        stream.status = "error"
+        try:
+            await websocket.send_json({"event": "error", "detail": str(exc)})
+            await websocket.close(code=1011)
+        except Exception:
+            pass
+
+
+@app.get("/streams/{stream_id}")
+def get_stream(stream_id: str) -> dict:
+    """Return the rolling transcript and progress of a stream."""
+    stream = stream_registry.get(stream_id)
+    if stream is None:
+        raise HTTPException(status_code=404, detail=f"Stream not found: {stream_id}")
+    return stream.to_dict()
+
+
+@app.post("/streams/{stream_id}/attach", response_model=AnalyzeResponse)
+def attach_stream(stream_id: str, req: AttachStreamRequest) -> AnalyzeResponse:
+    """Use a finished stream as the analysis result instead of an uploaded audio file."""
+    stream = stream_registry.get(stream_id)
+    if stream is None:
+        raise HTTPException(status_code=404, detail=f"Stream not found: {stream_id}")
+    if stream.status == "error":
+        raise HTTPException(status_code=409, detail=f"Stream failed: {stream_id}")
+
+    try:
+        transcription = stream.finalize()
+        txt_path = Path(req.output_txt) if req.output_txt else stream.output_txt
+        if txt_path is None:
+            txt_path = Path("/app/outputs/Voice_Text.txt")
+        stream.write_transcript(txt_path)
+
+        summary = {
+            "transcription": transcription,
+            "output_txt": str(txt_path),
+            "audio_path": None,
+            "stream_id": stream_id,
+            "cache": "stream",
+        }
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    # The transcript now lives in txt_path; the stream is no longer needed.
+    stream_registry.discard(stream_id)
+    return AnalyzeResponse(csv_path=None, summary=summary, status="completed")
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import torch
+import torchaudio
+
+# Support both package import (Voice_Analysis.streaming) and Docker (flat module)
+try:
+    from Voice_Analysis.voice_analysis import TARGET_SAMPLE_RATE, transcribe_waveform
+except ModuleNotFoundError:
+    from voice_analysis import TARGET_SAMPLE_RATE, transcribe_waveform
+
+# Audio is transcribed in windows of this length while the candidate is still speaking.
+STREAM_CHUNK_SECONDS = float(os.getenv("VOICE_STREAM_CHUNK_SECONDS", "10"))
+# Within the last part of each window, cut at the quietest frame to avoid splitting words.
+STREAM_SPLIT_SEARCH_SECONDS = 1.0
+_ENERGY_FRAME_SAMPLES = 320  # 20ms at 16kHz
+
+SUPPORTED_ENCODINGS = ("pcm_s16le", "f32le")
+# Streams nobody attached (or that stopped receiving audio) are dropped after this long.
+STREAM_TTL_SECONDS = float(os.getenv("VOICE_STREAM_TTL_SECONDS", "3600"))
+
+
+def _decode_chunk(data: bytes, encoding: str) -> np.ndarray:
+    """Decode raw little-endian PCM bytes into a float32 mono array."""
+    if encoding == "pcm_s16le":
+        return np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+    if encoding == "f32le":
+        return np.frombuffer(data, dtype="<f4").astype(np.float32)
+    raise ValueError(f"Unsupported encoding: {encoding} (expected one of {SUPPORTED_ENCODINGS})")
+
+
+def _quietest_split(waveform: torch.Tensor, window: int) -> int:
+    """Return a split index <= window that falls on the lowest-energy frame near the end."""
+    search = int(STREAM_SPLIT_SEARCH_SECONDS * TARGET_SAMPLE_RATE)
+    start = max(0, window - search)
+    region = waveform[start:window]
+    n_frames = region.numel() // _ENERGY_FRAME_SAMPLES
+    if n_frames < 2:
+        return window
+    frames = region[: n_frames * _ENERGY_FRAME_SAMPLES].reshape(n_frames, _ENERGY_FRAME_SAMPLES)
+    energy = frames.pow(2).mean(dim=1)
+    quietest = int(torch.argmin(energy))
+    return start + quietest * _ENERGY_FRAME_SAMPLES + _ENERGY_FRAME_SAMPLES // 2
+
+
+class StreamingTranscriber:
+    """
+    Rolling transcript for one answer, fed with audio chunks as they arrive.
+
+    Audio is resampled to 16kHz and buffered; every time the buffer holds a full
+    window it is transcribed and appended to the transcript, so only the tail
+    remains to be processed when the stream ends.
+    """
+
+    def __init__(
+        self,
+        stream_id: str,
+        sample_rate: int = TARGET_SAMPLE_RATE,
+        encoding: str = "pcm_s16le",
+        output_txt: Optional[Union[str, Path]] = None,
+        chunk_seconds: float = STREAM_CHUNK_SECONDS,
+    ):
+        if encoding not in SUPPORTED_ENCODINGS:
+            raise ValueError(f"Unsupported encoding: {encoding} (expected one of {SUPPORTED_ENCODINGS})")
+        self.stream_id = stream_id
+        self.sample_rate = sample_rate
+        self.encoding = encoding
+        self.output_txt = Path(output_txt) if output_txt else None
+        self.window = int(chunk_seconds * TARGET_SAMPLE_RATE)
+        self.segments: List[str] = []
+        self.status = "streaming"
+        self.received_seconds = 0.0
+        self.transcribed_seconds = 0.0
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self.finalized_at: Optional[float] = None
+        self._buffer = torch.zeros(0)
+        self._resampler = (
+            torchaudio.transforms.Resample(sample_rate, TARGET_SAMPLE_RATE)
+            if sample_rate != TARGET_SAMPLE_RATE
+            else None
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def transcript(self) -> str:
+        return " ".join(segment for segment in self.segments if segment).strip()
+
+    def feed(self, data: bytes) -> bool:
+        """
+        Append a raw audio chunk and transcribe any complete windows.
+
+        Returns:
+            True if the transcript changed.
+        """
+        samples = _decode_chunk(data, self.encoding)
+        waveform = torch.from_numpy(samples)
+        if self._resampler is not None and samples.size:
+            waveform = self._resampler(waveform.unsqueeze(0)).squeeze(0)
+
+        with self._lock:
+            # Checked under the lock so a chunk cannot slip in while finalize() runs.
+            if self.status != "streaming":
+                raise RuntimeError(f"Stream {self.stream_id} is already {self.status}")
+            self.updated_at = time.time()
+            if samples.size == 0:
+                return False
+            self.received_seconds += samples.size / self.sample_rate
+            self._buffer = torch.cat([self._buffer, waveform])
+            changed = False
+            while self._buffer.numel() >= self.window:
+                split = _quietest_split(self._buffer, self.window)
+                self._transcribe(self._buffer[:split])
+                self._buffer = self._buffer[split:]
+                changed = True
+            return changed
+
+    def finalize(self) -> str:
+        """Transcribe the remaining buffer, write output_txt, and close the stream."""
+        with self._lock:
+            if self.status == "streaming":
+                self._transcribe(self._buffer)
+                self._buffer = torch.zeros(0)
+                self.status = "finalized"
+                self.finalized_at = self.updated_at = time.time()
+                if self.output_txt is not None:
+                    self.write_transcript(self.output_txt)
+            return self.transcript
+
+    def write_transcript(self, output_txt: Union[str, Path]) -> Path:
+        output_txt = Path(output_txt)
+        output_txt.parent.mkdir(parents=True, exist_ok=True)
+        output_txt.write_text(self.transcript, encoding="utf-8")
+        return output_txt
+
+    def _transcribe(self, waveform: torch.Tensor) -> None:
+        if waveform.numel() == 0:
+            return
+        self.segments.append(transcribe_waveform(waveform).strip())
+        self.transcribed_seconds += waveform.numel() / TARGET_SAMPLE_RATE
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stream_id": self.stream_id,
+            "status": self.status,
+            "transcript": self.transcript,
+            "received_seconds": round(self.received_seconds, 3),
+            "transcribed_seconds": round(self.transcribed_seconds, 3),
+            "output_txt": str(self.output_txt) if self.output_txt else None,
+        }
+
+
+class StreamRegistry:
+    """
+    In-memory registry of live and finished streams, keyed by stream id.
+
+    A stream is removed once it has been attached; streams idle for longer than
+    `ttl_seconds` (never attached, or abandoned mid-answer) are expired lazily.
+    """
+
+    def __init__(self, ttl_seconds: float = STREAM_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._streams: Dict[str, StreamingTranscriber] = {}
+        self._lock = threading.Lock()
+
+    def open(self, stream_id: str, **kwargs) -> StreamingTranscriber:
+        with self._lock:
+            self._expire_locked()
+            existing = self._streams.get(stream_id)
+            if existing is not None and existing.status == "streaming":
+                raise ValueError(f"Stream already active: {stream_id}")
+            stream = StreamingTranscriber(stream_id, **kwargs)
+            self._streams[stream_id] = stream
+            return stream
+
+    def get(self, stream_id: str) -> Optional[StreamingTranscriber]:
+        with self._lock:
+            self._expire_locked()
+            return self._streams.get(stream_id)
+
+    def discard(self, stream_id: str) -> None:
+        with self._lock:
+            self._streams.pop(stream_id, None)
+
+    def _expire_locked(self) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        cutoff = time.time() - self.ttl_seconds
+        for stream_id in [sid for sid, stream in self._streams.items() if stream.updated_at < cutoff]:
+            del self._streams[stream_id]
+
+
+stream_registry = StreamRegistry()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+# Cache location/size are configurable so multiple workers on one host share the same entries.
+DEFAULT_CACHE_DIR = os.getenv("VOICE_CACHE_DIR", "/app/outputs/.voice_cache")
+DEFAULT_MAX_BYTES = int(os.getenv("VOICE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def hash_file(path: Union[str, Path]) -> str:
+    """Return the sha256 hex digest of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_cache_key(content_hash: str, model_name: str, options: Dict[str, Any]) -> str:
+    """Combine audio content hash, model name, and preprocessing options into one key."""
+    payload = json.dumps(
+        {"content": content_hash, "model": model_name, "options": options},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TranscriptCache:
+    """
+    Disk-backed transcript cache with LRU eviction by total size.
+
+    Each entry is a small JSON file named after its key. File mtime is bumped on
+    every hit, so eviction removes the least recently used entries first.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for key, or None on miss."""
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            # Mark as recently used.
+            os.utime(path, None)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return entry
+
+    def put(self, key: str, transcription: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Store a transcription and evict old entries if over the size cap."""
+        entry = {
+            "transcription": transcription,
+            "created_at": time.time(),
+            **(metadata or {}),
+        }
+        path = self._entry_path(key)
+        with self._lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so concurrent readers never see a partial entry.
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort(key=lambda item: item[0])
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current disk usage."""
+        entries = list(self.cache_dir.glob("*.json")) if self.cache_dir.exists() else []
+        size = 0
+        for path in entries:
+            try:
+                size += path.stat().st_size
+            except OSError:
+                continue
+        return {
+            "cache_dir": str(self.cache_dir),
+            "entries": len(entries),
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -6,34 +6,59 @@ import threading
 from pathlib import Path
 from typing import Dict, Any, Union
 
+import av
+import numpy as np
 import pandas as pd
 import soundfile as sf
 import torch
 import torchaudio
-from transformers import Wav2Vec2ForCTC, Wav2Vec2Processor
+from transformers import Wav2Vec2Processor
+
+# Support both package import (Voice_Analysis.voice_analysis) and Docker (flat module)
+try:
+    from Voice_Analysis.model_loader import load_wav2vec2_mmap
+    from Voice_Analysis.preprocess_pool import PreprocessPool
+    from Voice_Analysis.transcript_cache import TranscriptCache, build_cache_key, hash_file
+except ModuleNotFoundError:
+    from model_loader import load_wav2vec2_mmap
+    from preprocess_pool import PreprocessPool
+    from transcript_cache import TranscriptCache, build_cache_key, hash_file
 
 MODEL_NAME = "kresnik/wav2vec2-large-xlsr-korean"
 DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
+TARGET_SAMPLE_RATE = 16000
+# Read with soundfile; every other suffix (mp4, webm, m4a, ...) is decoded with PyAV.
+SOUNDFILE_SUFFIXES = {".wav", ".flac", ".ogg"}
+# Everything that changes the model input for the same file must be part of the cache key.
+PREPROCESS_OPTIONS: Dict[str, Any] = {"target_sample_rate": TARGET_SAMPLE_RATE}
 
 _MODEL = None
 _PROCESSOR = None
+# Filled in once the model is loaded (strategy, load_seconds, RSS) for /health.
+MODEL_LOAD_STATS: Dict[str, Any] = {}
 _LOAD_LOCK = threading.Lock()
 # Serialize inference to avoid concurrent model moves/allocations (meta tensor error).
 _INFERENCE_LOCK = threading.Lock()
 
+TRANSCRIPT_CACHE = TranscriptCache()
+# Decode/resample/normalize run in worker processes so they overlap with inference.
+PREPROCESS_POOL = PreprocessPool(MODEL_NAME)
+
 
 def analyze_audio(
     audio_path: Union[str, Path],
     output_csv: Union[str, Path] = None,
     output_txt: Union[str, Path] = None,
+    use_cache: bool = True,
 ) -> pd.DataFrame:
     """
     Analyze audio file using wav2vec2-base-korean model for transcription.
 
     Args:
-        audio_path: Path to audio file
+        audio_path: Path to audio file, or a video file whose audio track is analyzed
         output_csv: Optional path to save results as CSV
         output_txt: Optional path to save transcription as txt (default: /app/outputs/Voice_Text.txt)
+        use_cache: Reuse a cached transcript for identical audio content (default: True)
 
     Returns:
         DataFrame with transcription results
@@ -43,8 +68,25 @@ def analyze_audio(
     if not audio_path.is_file():
         raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-    # Run wav2vec2 transcription
-    transcription = run_wav2vec2_transcription(audio_path)
+    # Look up transcript cache before touching the model
+    cache_status = "disabled"
+    cache_key = None
+    transcription = None
+    if use_cache:
+        cache_key = build_cache_key(hash_file(audio_path), MODEL_NAME, PREPROCESS_OPTIONS)
+        cached = TRANSCRIPT_CACHE.get(cache_key)
+        if cached is not None:
+            transcription = cached["transcription"]
+            cache_status = "hit"
+        else:
+            cache_status = "miss"
+
+    if transcription is None:
+        # Run wav2vec2 transcription
+        transcription = run_wav2vec2_transcription(audio_path)
+        # Never cache failures so a retry gets a fresh attempt
+        if cache_key is not None and not transcription.startswith("[ERROR]"):
+            TRANSCRIPT_CACHE.put(cache_key, transcription, {"model": MODEL_NAME})
 
     # Save transcription to txt file
     if output_txt is None:
@@ -59,6 +101,7 @@ def analyze_audio(
         "audio_path": [str(audio_path)],
         "transcription": [transcription],
         "output_txt": [str(output_txt)],
+        "cache": [cache_status],
         "status": ["completed"],
     }
 
@@ -77,13 +120,31 @@ def load_and_preprocess_audio(file_path: Path, processor, device: str = "cpu"):
     Load and preprocess audio file for wav2vec2 model.
 
     Args:
-        file_path: Path to audio file
+        file_path: Path to audio file, or a video container (mp4/webm) with an audio track
         processor: Wav2Vec2Processor instance
         device: Device to use (cpu or cuda)
 
     Returns:
         Preprocessed audio tensor
     """
+    waveform = load_waveform(file_path)
+
+    # Process through processor
+    inputs = processor(waveform.squeeze().numpy(), sampling_rate=TARGET_SAMPLE_RATE, return_tensors="pt")
+    return inputs.input_values[0]
+
+
+def load_waveform(file_path: Path) -> torch.Tensor:
+    """
+    Decode a media file into a 16kHz waveform tensor.
+
+    Formats soundfile understands are read directly; anything else (video
+    containers, compressed audio) is decoded with PyAV.
+    """
+    file_path = Path(file_path)
+    if file_path.suffix.lower() not in SOUNDFILE_SUFFIXES:
+        return _decode_audio_track(file_path)
+
     # Load audio using soundfile (avoids torchcodec errors)
     audio_input, sampling_rate = sf.read(file_path)
 
@@ -97,13 +158,44 @@ def load_and_preprocess_audio(file_path: Path, processor, device: str = "cpu"):
         waveform = waveform.unsqueeze(0)
 
     # Resample to 16000Hz (model requirement)
-    if sampling_rate != 16000:
-        resampler = torchaudio.transforms.Resample(sampling_rate, 16000)
+    if sampling_rate != TARGET_SAMPLE_RATE:
+        resampler = torchaudio.transforms.Resample(sampling_rate, TARGET_SAMPLE_RATE)
         waveform = resampler(waveform)
 
-    # Process through processor
-    inputs = processor(waveform.squeeze().numpy(), sampling_rate=16000, return_tensors="pt")
-    return inputs.input_values[0]
+    return waveform
+
+
+def _decode_audio_track(file_path: Path) -> torch.Tensor:
+    """
+    Stream-decode only the first audio track of a container into 16kHz mono float32.
+
+    Video packets are demuxed but never decoded, and decoded frames go straight
+    through the PyAV resampler, so no intermediate WAV is written.
+    """
+    with av.open(str(file_path)) as container:
+        if not container.streams.audio:
+            raise ValueError(f"No audio track found in: {file_path}")
+        stream = container.streams.audio[0]
+        stream.thread_type = "AUTO"
+        resampler = av.AudioResampler(format="flt", layout="mono", rate=TARGET_SAMPLE_RATE)
+
+        chunks = []
+        for frame in container.decode(stream):
+            for resampled in resampler.resample(frame):
+                chunks.append(resampled.to_ndarray().reshape(-1))
+        # Flush samples buffered inside the resampler
+        for resampled in resampler.resample(None):
+            chunks.append(resampled.to_ndarray().reshape(-1))
+
+    if not chunks:
+        return torch.zeros(0)
+    return torch.from_numpy(np.concatenate(chunks))
+
+
+def preload_model() -> Dict[str, Any]:
+    """Load the model eagerly (e.g., at server startup) and return the load stats."""
+    _load_model_and_processor()
+    return dict(MODEL_LOAD_STATS)
 
 
 def _load_model_and_processor():
@@ -118,18 +210,55 @@ def _load_model_and_processor():
 
         print(f"Loading model: {MODEL_NAME} on {DEVICE}...")
         processor = Wav2Vec2Processor.from_pretrained(MODEL_NAME)
-        model = Wav2Vec2ForCTC.from_pretrained(
-            MODEL_NAME,
-            low_cpu_mem_usage=False,
-            torch_dtype=torch.float32,
-        )
+        # Weights are memory-mapped so workers on one host share the read-only pages.
+        model, stats = load_wav2vec2_mmap(MODEL_NAME)
         model.to(DEVICE)
         model.eval()
+        MODEL_LOAD_STATS.update(stats, device=DEVICE)
+        print(
+            f"Model loaded via {stats['strategy']} in {stats['load_seconds']}s "
+            f"(RSS {stats['rss_before_bytes'] / 2**20:.1f} MiB -> {stats['rss_after_bytes'] / 2**20:.1f} MiB)"
+        )
         _MODEL = model
         _PROCESSOR = processor
         return model, processor
 
 
+def _run_inference(input_values: torch.Tensor, model, processor) -> str:
+    """Run CTC inference on preprocessed input values and decode to text."""
+    # Move to device and add batch dimension
+    input_tensor = input_values.unsqueeze(0).to(DEVICE)
+
+    # Run inference
+    with _INFERENCE_LOCK:
+        with torch.no_grad():
+            logits = model(input_tensor).logits
+
+    predicted_ids = torch.argmax(logits, dim=-1)
+
+    # Decode to text
+    return processor.batch_decode(predicted_ids)[0]
+
+
+def transcribe_waveform(waveform: torch.Tensor) -> str:
+    """
+    Transcribe an in-memory mono waveform that is already at 16kHz.
+
+    Used by the streaming path, which feeds the model one audio window at a time.
+
+    Args:
+        waveform: 1-D float tensor sampled at TARGET_SAMPLE_RATE
+
+    Returns:
+        Transcribed text (empty string for empty input)
+    """
+    if waveform.numel() == 0:
+        return ""
+    model, processor = _load_model_and_processor()
+    inputs = processor(waveform.numpy(), sampling_rate=TARGET_SAMPLE_RATE, return_tensors="pt")
+    return _run_inference(inputs.input_values[0], model, processor)
+
+
 def run_wav2vec2_transcription(audio_path: Path) -> str:
     """
     Run wav2vec2 model for Korean speech-to-text transcription.
@@ -143,21 +272,16 @@ def run_wav2vec2_transcription(audio_path: Path) -> str:
     try:
         model, processor = _load_model_and_processor()
 
-        # Preprocess audio
-        input_values = load_and_preprocess_audio(audio_path, processor, DEVICE)
-
-        # Move to device and add batch dimension
-        input_tensor = input_values.unsqueeze(0).to(DEVICE)
-
-        # Run inference
-        with _INFERENCE_LOCK:
-            with torch.no_grad():
-                logits = model(input_tensor).logits
-
-        predicted_ids = torch.argmax(logits, dim=-1)
-
-        # Decode to text
-        transcription = processor.batch_decode(predicted_ids)[0]
+        if PREPROCESS_POOL.enabled:
+            # Preprocess in a worker process; only inference runs on this thread.
+            transcription = PREPROCESS_POOL.run(
+                audio_path,
+                lambda input_values: _run_inference(input_values, model, processor),
+            )
+        else:
+            # Preprocess audio
+            input_values = load_and_preprocess_audio(audio_path, processor, DEVICE)
+            transcription = _run_inference(input_values, model, processor)
 
         print(f"Transcription: {transcription}")
         return transcription
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import math
 import os
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import partial
 from operator import add
 from pathlib import Path
 import json
-from typing import Annotated, Any, Dict, Optional, Sequence
+from typing import Annotated, Any, Callable, Dict, Generator, Optional, Sequence
 
 import httpx
 import pandas as pd
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from langgraph.graph import END, StateGraph
 from typing_extensions import TypedDict
 
@@ -18,15 +23,39 @@ try:
 except ModuleNotFoundError:
     from session_manager import Session, SessionStatus, session_manager
 
-# Service URLs from environment variables
-PDF_READER_URL = os.getenv("PDF_READER_URL", "http://localhost:8001")
-QUESTION_GEN_URL = os.getenv("QUESTION_GEN_URL", "http://localhost:8002")
-FACE_ANALYSIS_URL = os.getenv("FACE_ANALYSIS_URL", "http://localhost:8003")
-VOICE_ANALYSIS_URL = os.getenv("VOICE_ANALYSIS_URL", "http://localhost:8004")
+# Service URLs (from environment variables) and one pooled keep-alive client per service
+try:
+    from admin.service_clients import (
+        FACE_ANALYSIS_URL,
+        PDF_READER_URL,
+        QUESTION_GEN_URL,
+        VOICE_ANALYSIS_URL,
+        async_service_client,
+        service_client,
+    )
+except ModuleNotFoundError:
+    from service_clients import (
+        FACE_ANALYSIS_URL,
+        PDF_READER_URL,
+        QUESTION_GEN_URL,
+        VOICE_ANALYSIS_URL,
+        async_service_client,
+        service_client,
+    )
 
 # Base directory - use /app in Docker, or configured path in local
 BASE_DIR = Path(os.getenv("BASE_DIR", "/app" if Path("/app").exists() else "."))
 
+# Opt in to PDF_Reader's compaction (drops running headers/footers and page numbers) for admin sessions
+PDF_COMPACT = os.getenv("PDF_COMPACT", "").lower() in {"1", "true", "yes", "on"}
+
+# Web search fan-out: queries in flight at once, and how long a single query may take
+SEARCH_MAX_CONCURRENCY = int(os.getenv("SEARCH_MAX_CONCURRENCY", "4"))
+SEARCH_QUERY_TIMEOUT = float(os.getenv("SEARCH_QUERY_TIMEOUT", "10"))
+
+# (query, max_results) -> DDGS-style items with "title", "body", "href"
+SearchBackend = Callable[[str, int], list[dict]]
+
 
 def get_text_response(client: OpenAI, model: str, messages: list[dict], temperature: float = 0.3) -> str:
     """Call OpenAI and return plain text regardless of client version.
@@ -60,6 +89,146 @@ def get_text_response(client: OpenAI, model: str, messages: list[dict], temperat
     raise AttributeError("OpenAI client does not support chat or responses APIs")
 
 
+async def get_text_response_async(
+    client: AsyncOpenAI, model: str, messages: list[dict], temperature: float = 0.3
+) -> str:
+    """Async counterpart of get_text_response()."""
+    if hasattr(client, "chat") and hasattr(client.chat, "completions"):
+        completion = await client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+        )
+        choice = completion.choices[0].message
+        return choice.content if hasattr(choice, "content") else ""
+
+    if hasattr(client, "responses"):
+        response = await client.responses.create(
+            model=model,
+            input=messages,
+            temperature=temperature,
+        )
+        if getattr(response, "output_text", None):
+            return response.output_text
+        try:
+            return response.output[0].content[0].text
+        except Exception:
+            return ""
+
+    raise AttributeError("OpenAI client does not support chat or responses APIs")
+
+
+# Nodes are written once, as generators that yield the network calls they need
+# and receive the results back. run_steps() performs the calls with blocking
+# clients (the graph for `langgraph dev --allow-blocking`); run_steps_async()
+# awaits them on httpx.AsyncClient / AsyncOpenAI, so a session waiting on a
+# service or the LLM holds no worker thread. Yielding a list of calls runs them
+# concurrently in the async graph (one after another in the sync one) and
+# returns their results in order. A failed call is raised at the yield.
+
+
+@dataclass
+class ServiceCall:
+    """POST `json` to a downstream service; the node receives the httpx.Response."""
+
+    service: str
+    url: str
+    json: Dict[str, Any]
+
+
+@dataclass
+class LLMCall:
+    """One chat completion; the node receives the response text."""
+
+    model: str
+    messages: list[dict]
+    temperature: float = 0.3
+
+
+@dataclass
+class BlockingCall:
+    """A blocking fn() without an async client (e.g., DuckDuckGo search); async nodes run it on a thread."""
+
+    fn: Callable[[], Any]
+
+
+NodeSteps = Generator[Any, Any, Dict[str, Any]]
+
+
+def _advance(steps: NodeSteps, result: Any, error: Optional[BaseException]) -> tuple[bool, Any]:
+    """Resume steps with result (or raise error at its yield); (True, return value) once it finishes."""
+    try:
+        return False, steps.throw(error) if error is not None else steps.send(result)
+    except StopIteration as stop:
+        return True, stop.value
+
+
+def run_steps(steps: NodeSteps, llm_client: Optional[OpenAI] = None) -> Any:
+    """Run a node's steps, performing each call with the pooled blocking clients."""
+
+    def perform(call: Any) -> Any:
+        nonlocal llm_client
+        if isinstance(call, ServiceCall):
+            return service_client(call.service).post(call.url, json=call.json)
+        if isinstance(call, LLMCall):
+            if llm_client is None:
+                llm_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            return get_text_response(llm_client, call.model, call.messages, call.temperature)
+        return call.fn()
+
+    result: Any = None
+    error: Optional[BaseException] = None
+    while True:
+        done, call = _advance(steps, result, error)
+        if done:
+            return call
+        try:
+            result = [perform(item) for item in call] if isinstance(call, list) else perform(call)
+            error = None
+        except Exception as exc:
+            result, error = None, exc
+
+
+async def run_steps_async(steps: NodeSteps, llm_client: Optional[AsyncOpenAI] = None) -> Any:
+    """
+    Run a node's steps without blocking the event loop.
+
+    Calls are awaited on async clients, and the node's own code between calls
+    (file I/O, pandas) runs on a worker thread, so the thread is only held
+    while the node computes.
+    """
+    owns_client = llm_client is None
+
+    async def perform(call: Any) -> Any:
+        nonlocal llm_client
+        if isinstance(call, ServiceCall):
+            return await async_service_client(call.service).post(call.url, json=call.json)
+        if isinstance(call, LLMCall):
+            if llm_client is None:
+                llm_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            return await get_text_response_async(llm_client, call.model, call.messages, call.temperature)
+        return await asyncio.to_thread(call.fn)
+
+    result: Any = None
+    error: Optional[BaseException] = None
+    try:
+        while True:
+            done, call = await asyncio.to_thread(_advance, steps, result, error)
+            if done:
+                return call
+            try:
+                if isinstance(call, list):
+                    result = list(await asyncio.gather(*(perform(item) for item in call)))
+                else:
+                    result = await perform(call)
+                error = None
+            except Exception as exc:
+                result, error = None, exc
+    finally:
+        if owns_client and llm_client is not None:
+            await llm_client.close()
+
+
 def generate_search_queries_from_context(
     client: OpenAI,
     model: str,
@@ -67,6 +236,10 @@ def generate_search_queries_from_context(
     max_queries: int = 6,
 ) -> list[str]:
     """Ask the LLM to propose Korean web search queries tailored to the candidate."""
+    return run_steps(_search_query_steps(model, context, max_queries), llm_client=client)
+
+
+def _search_query_steps(model: str, context: str, max_queries: int = 6) -> NodeSteps:
     prompt = (
         "아래 자기소개서/포트폴리오/면접 요약을 보고, 경력 개발/프로그램/캠프/강의/기술 트렌드/면접 준비에 도움이 될 "
         "한국어 웹 검색 쿼리 6개 이하를 JSON으로 반환하세요. "
@@ -74,8 +247,7 @@ def generate_search_queries_from_context(
         "반드시 JSON 객체 형태로, 키 'queries'에 문자열 배열만 포함하세요."
     )
     try:
-        raw = get_text_response(
-            client,
+        raw = yield LLMCall(
             model=model,
             messages=[
                 {"role": "system", "content": "검색 키워드를 설계하는 리서치 어시스턴트입니다."},
@@ -99,50 +271,95 @@ def generate_search_queries_from_context(
     return queries[:max_queries]
 
 
+def duckduckgo_backend(timeout: float = SEARCH_QUERY_TIMEOUT) -> SearchBackend:
+    """Return a DuckDuckGo search backend; each call opens its own DDGS session so calls can run in parallel."""
+    try:
+        from duckduckgo_search import DDGS
+    except ImportError as exc:
+        raise RuntimeError(
+            "duckduckgo-search가 설치되어야 웹 서치를 수행할 수 있습니다. `pip install duckduckgo-search`를 실행하세요."
+        ) from exc
+
+    def search(query: str, max_results: int) -> list[dict]:
+        with DDGS(timeout=timeout) as ddgs:
+            return list(ddgs.text(query, max_results=max_results) or [])
+
+    return search
+
+
+def _search_concurrently(
+    queries: Sequence[str],
+    per_query: int,
+    backend: SearchBackend,
+    max_concurrency: int = SEARCH_MAX_CONCURRENCY,
+    timeout: float = SEARCH_QUERY_TIMEOUT,
+) -> list[Optional[list[dict]] | BaseException]:
+    """Run queries on a bounded thread pool; returns per-query items (or the error) in query order."""
+    workers = max(1, min(max_concurrency, len(queries)))
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search")
+    try:
+        futures = [pool.submit(backend, query, per_query) for query in queries]
+        # Each query gets `timeout` seconds; queued queries start as earlier ones finish.
+        done, _ = wait(futures, timeout=timeout * math.ceil(len(queries) / workers))
+        outcomes: list[Optional[list[dict]] | BaseException] = []
+        for future in futures:
+            if future not in done:
+                outcomes.append(TimeoutError(f"search exceeded {timeout}s"))
+            else:
+                outcomes.append(future.exception() or future.result())
+        return outcomes
+    finally:
+        # Don't wait for stragglers past the deadline; their results are discarded.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def run_duckduckgo_search(
     queries: Sequence[str],
     per_query: int = 3,
     max_chars: int = 2400,
+    backend: Optional[SearchBackend] = None,
 ) -> tuple[list[dict], str]:
-    """Execute DuckDuckGo searches and return both structured and plain text snippets."""
+    """Execute web searches concurrently and return both structured and plain text snippets.
+
+    Results keep the query order and links are de-duplicated across queries,
+    exactly as if the queries had run one after another. A query that fails or
+    misses its deadline is skipped; if every query fails the search fails.
+    `backend` replaces DuckDuckGo, e.g., with a local fake.
+    """
+    queries = [query for query in queries if query]
     if not queries:
         return [], ""
 
-    try:
-        from duckduckgo_search import DDGS
-    except ImportError as exc:
-        raise RuntimeError(
-            "duckduckgo-search가 설치되어야 웹 서치를 수행할 수 있습니다. `pip install duckduckgo-search`를 실행하세요."
-        ) from exc
+    backend = backend or duckduckgo_backend()
+    outcomes = _search_concurrently(queries, per_query, backend)
+    errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+    if len(errors) == len(outcomes):
+        raise RuntimeError(f"DuckDuckGo 검색 실패: {errors[0]}") from errors[0]
 
     results: list[dict] = []
     seen_links: set[str] = set()
 
-    try:
-        with DDGS(timeout=10) as ddgs:
-            for query in queries:
-                if not query:
-                    continue
-                for item in ddgs.text(query, max_results=per_query):
-                    title = (item.get("title") or "").strip()
-                    snippet = (item.get("body") or "").strip()
-                    link = (item.get("href") or "").strip()
-                    if not title and not snippet:
-                        continue
-                    if link and link in seen_links:
-                        continue
-                    if link:
-                        seen_links.add(link)
-                    results.append(
-                        {
-                            "query": query,
-                            "title": title,
-                            "snippet": snippet,
-                            "link": link,
-                        }
-                    )
-    except Exception as exc:
-        raise RuntimeError(f"DuckDuckGo 검색 실패: {exc}") from exc
+    for query, items in zip(queries, outcomes):
+        if isinstance(items, BaseException):
+            continue
+        for item in items or []:
+            title = (item.get("title") or "").strip()
+            snippet = (item.get("body") or "").strip()
+            link = (item.get("href") or "").strip()
+            if not title and not snippet:
+                continue
+            if link and link in seen_links:
+                continue
+            if link:
+                seen_links.add(link)
+            results.append(
+                {
+                    "query": query,
+                    "title": title,
+                    "snippet": snippet,
+                    "link": link,
+                }
+            )
 
     lines = []
     for item in results:
@@ -194,6 +411,8 @@ class WorkflowState(TypedDict, total=False):
     # Support 3 video/audio files (one per question)
     video_paths: list[str]
     audio_paths: list[str]
+    # Finished Voice_Analysis stream ids per question (used instead of audio files)
+    voice_stream_ids: list[str]
     # Legacy single path fields
     video_path: Optional[str]
     audio_path: Optional[str]
@@ -224,7 +443,7 @@ class WorkflowState(TypedDict, total=False):
     status: Annotated[str, keep_latest]
 
 
-def pdf_extract_node(state: WorkflowState) -> WorkflowState:
+def _pdf_extract_steps(state: WorkflowState) -> NodeSteps:
     """Extract text from both introduce.pdf and portfolio.pdf, save as txt files."""
     # Auto-generate session_id if not provided
     session_id = state.get("session_id")
@@ -254,41 +473,31 @@ def pdf_extract_node(state: WorkflowState) -> WorkflowState:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        introduce_txt_path = None
-        portfolio_txt_path = None
-
-        with httpx.Client() as client:
-            # Extract introduce.pdf
-            response = client.post(
-                f"{PDF_READER_URL}/extract",
-                json={"pdf_path": pdf_files["introduce"]},
-                timeout=60.0,
-            )
-            response.raise_for_status()
-            introduce_data = response.json()
+        # Extract both PDFs in one call; the service joins page texts (and compacts them if enabled)
+        response = yield ServiceCall(
+            "pdf_reader",
+            f"{PDF_READER_URL}/extract_batch",
+            json={
+                "documents": [
+                    {"pdf_path": pdf_files[name], "compact": PDF_COMPACT} for name in pdf_files
+                ],
+                "join_text": True,
+            },
+        )
+        response.raise_for_status()
+        documents = response.json()["documents"]
 
-            # Save as introduce.txt
-            introduce_txt = "\n\n".join(
-                page["text"] for page in introduce_data["pages_data"] if page.get("text")
-            )
-            introduce_txt_path = output_dir / "introduce.txt"
-            introduce_txt_path.write_text(introduce_txt, encoding="utf-8")
-
-            # Extract portfolio.pdf
-            response = client.post(
-                f"{PDF_READER_URL}/extract",
-                json={"pdf_path": pdf_files["portfolio"]},
-                timeout=60.0,
-            )
-            response.raise_for_status()
-            portfolio_data = response.json()
+        txt_paths = {}
+        for name, document in zip(pdf_files, documents):
+            if document["status"] != "completed":
+                raise RuntimeError(f"{name}.pdf: {document.get('error')}")
+            # Save as introduce.txt / portfolio.txt
+            txt_path = output_dir / f"{name}.txt"
+            txt_path.write_text(document.get("text") or "", encoding="utf-8")
+            txt_paths[name] = txt_path
 
-            # Save as portfolio.txt
-            portfolio_txt = "\n\n".join(
-                page["text"] for page in portfolio_data["pages_data"] if page.get("text")
-            )
-            portfolio_txt_path = output_dir / "portfolio.txt"
-            portfolio_txt_path.write_text(portfolio_txt, encoding="utf-8")
+        introduce_txt_path = txt_paths["introduce"]
+        portfolio_txt_path = txt_paths["portfolio"]
 
         # Store paths in extraction_data for backward compatibility
         extraction_data = {
@@ -318,7 +527,15 @@ def pdf_extract_node(state: WorkflowState) -> WorkflowState:
         return {"session_id": session_id, "errors": [f"PDF extraction failed: {str(e)}"], "status": "error"}
 
 
-def question_generate_node(state: WorkflowState) -> WorkflowState:
+def pdf_extract_node(state: WorkflowState) -> WorkflowState:
+    return run_steps(_pdf_extract_steps(state))
+
+
+async def pdf_extract_node_async(state: WorkflowState) -> WorkflowState:
+    return await run_steps_async(_pdf_extract_steps(state))
+
+
+def _question_generate_steps(state: WorkflowState) -> NodeSteps:
     """Generate interview questions using Question Generator service with both txt files."""
     session_id = state["session_id"]
     introduce_txt_path = state.get("introduce_txt_path")
@@ -334,17 +551,18 @@ def question_generate_node(state: WorkflowState) -> WorkflowState:
         introduce_txt = Path(introduce_txt_path).read_text(encoding="utf-8")
         portfolio_txt = Path(portfolio_txt_path).read_text(encoding="utf-8")
 
-        with httpx.Client() as client:
-            response = client.post(
-                f"{QUESTION_GEN_URL}/generate",
-                json={
-                    "introduce_text": introduce_txt,
-                    "portfolio_text": portfolio_txt,
-                },
-                timeout=60.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = yield ServiceCall(
+            "question_generator",
+            f"{QUESTION_GEN_URL}/generate",
+            json={
+                "introduce_text": introduce_txt,
+                "portfolio_text": portfolio_txt,
+                # Picks up the search admin /start prefetched for this session
+                "session_id": session_id,
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
 
         questions = data.get("questions", [])
 
@@ -368,6 +586,14 @@ def question_generate_node(state: WorkflowState) -> WorkflowState:
         return {"session_id": session_id, "errors": [f"Question generation failed: {str(e)}"], "status": "error"}
 
 
+def question_generate_node(state: WorkflowState) -> WorkflowState:
+    return run_steps(_question_generate_steps(state))
+
+
+async def question_generate_node_async(state: WorkflowState) -> WorkflowState:
+    return await run_steps_async(_question_generate_steps(state))
+
+
 def wait_for_upload_node(state: WorkflowState) -> WorkflowState:
     """Mark session as waiting for file upload and initialize analysis fields."""
     session_id = state["session_id"]
@@ -404,10 +630,10 @@ def wait_for_upload_node(state: WorkflowState) -> WorkflowState:
     }
 
 
-def _create_face_analysis_node(index: int):
+def _create_face_analysis_node(index: int, asynchronous: bool = False):
     """Factory function to create face analysis node for question index (0, 1, or 2)."""
 
-    def face_analysis_node(state: WorkflowState) -> WorkflowState:
+    def face_analysis_steps(state: WorkflowState) -> NodeSteps:
         """Analyze facial expressions for one video file."""
         session_id = state["session_id"]
         session = session_manager.get_session(session_id)
@@ -448,21 +674,20 @@ def _create_face_analysis_node(index: int):
                 # 1차: auto, 2차: 강제 CPU로 재시도 (모델 초기 로드 실패/무감지 대응)
                 device = "auto" if attempt == 1 else "cpu"
                 try:
-                    with httpx.Client() as client:
-                        response = client.post(
-                            f"{FACE_ANALYSIS_URL}/analyze",
-                            json={
-                                "video_path": video_path,
-                                "output_csv": output_csv,
-                                "step_seconds": 1.0,
-                                "device": device,
-                            },
-                            timeout=300.0,
-                        )
-                        response.raise_for_status()
-                        data = response.json()
-                        data["question_index"] = index
-                        data["attempt"] = attempt
+                    response = yield ServiceCall(
+                        "face_analysis",
+                        f"{FACE_ANALYSIS_URL}/analyze",
+                        json={
+                            "video_path": video_path,
+                            "output_csv": output_csv,
+                            "step_seconds": 1.0,
+                            "device": device,
+                        },
+                    )
+                    response.raise_for_status()
+                    data = response.json()
+                    data["question_index"] = index
+                    data["attempt"] = attempt
 
                     summary = data.get("summary", {}) or {}
                     frames_with_faces = summary.get("frames_with_faces", 0)
@@ -543,22 +768,33 @@ def _create_face_analysis_node(index: int):
                 "errors": [f"Face analysis {index + 1} failed: {str(e)}"],
             }
 
+    if asynchronous:
+        async def face_analysis_node_async(state: WorkflowState) -> WorkflowState:
+            return await run_steps_async(face_analysis_steps(state))
+
+        return face_analysis_node_async
+
+    def face_analysis_node(state: WorkflowState) -> WorkflowState:
+        return run_steps(face_analysis_steps(state))
+
     return face_analysis_node
 
 
-def _create_voice_analysis_node(index: int):
+def _create_voice_analysis_node(index: int, asynchronous: bool = False):
     """Factory function to create voice analysis node for question index (0, 1, or 2)."""
 
-    def voice_analysis_node(state: WorkflowState) -> WorkflowState:
+    def voice_analysis_steps(state: WorkflowState) -> NodeSteps:
         """Analyze voice emotions for one audio file."""
         session_id = state["session_id"]
         session = session_manager.get_session(session_id)
 
         # Get audio_paths from state or session
         audio_paths = state.get("audio_paths", []) or (session.audio_paths if session else [])
+        stream_ids = state.get("voice_stream_ids", []) or (session.voice_stream_ids if session else [])
+        stream_id = stream_ids[index] if index < len(stream_ids) else ""
 
-        # Check if we have an audio for this index
-        if index >= len(audio_paths) or not audio_paths[index]:
+        # Check if we have an audio (or an attached stream) for this index
+        if not stream_id and (index >= len(audio_paths) or not audio_paths[index]):
             skip_payload = {
                 "status": "skipped",
                 "reason": f"No audio uploaded for question {index + 1}",
@@ -575,25 +811,31 @@ def _create_voice_analysis_node(index: int):
                 "voice_analysis_complete_count": state.get("voice_analysis_complete_count", 0) + 1,
             }
 
-        audio_path = audio_paths[index]
         session_manager.update_session(session_id, status=SessionStatus.ANALYZING_VOICE)
 
         # Set output TXT path with numbered filename
         output_txt = f"/app/outputs/Voice_{index + 1}.txt"
 
         try:
-            with httpx.Client() as client:
-                response = client.post(
+            if stream_id:
+                # Transcript was built while the candidate answered; just attach it.
+                response = yield ServiceCall(
+                    "voice_analysis",
+                    f"{VOICE_ANALYSIS_URL}/streams/{stream_id}/attach",
+                    json={"output_txt": output_txt},
+                )
+            else:
+                response = yield ServiceCall(
+                    "voice_analysis",
                     f"{VOICE_ANALYSIS_URL}/analyze",
                     json={
-                        "audio_path": audio_path,
+                        "audio_path": audio_paths[index],
                         "output_txt": output_txt
                     },
-                    timeout=300.0,
                 )
-                response.raise_for_status()
-                data = response.json()
-                data["question_index"] = index
+            response.raise_for_status()
+            data = response.json()
+            data["question_index"] = index
 
             # Store result in the list
             voice_results = state.get("voice_results", [])
@@ -629,10 +871,19 @@ def _create_voice_analysis_node(index: int):
                 "errors": [f"Voice analysis {index + 1} failed: {str(e)}"],
             }
 
+    if asynchronous:
+        async def voice_analysis_node_async(state: WorkflowState) -> WorkflowState:
+            return await run_steps_async(voice_analysis_steps(state))
+
+        return voice_analysis_node_async
+
+    def voice_analysis_node(state: WorkflowState) -> WorkflowState:
+        return run_steps(voice_analysis_steps(state))
+
     return voice_analysis_node
 
 
-def attitude_evaluation_node(state: WorkflowState) -> WorkflowState:
+def _attitude_evaluation_steps(state: WorkflowState) -> NodeSteps:
     """
     Agent 1: Evaluate interview attitude based on facial expressions from Face_1.csv, Face_2.csv, Face_3.csv.
     Positive emotions: happiness, surprise, neutral
@@ -775,9 +1026,7 @@ def attitude_evaluation_node(state: WorkflowState) -> WorkflowState:
 """
 
         # Call OpenAI for evaluation
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        evaluation_text = get_text_response(
-            client,
+        evaluation_text = yield LLMCall(
             model="gpt-5.1",
             messages=[
                 {"role": "system", "content": "당신은 면접 평가 전문가입니다. 얼굴 표정 데이터를 분석하여 면접자의 태도를 객관적으로 평가합니다."},
@@ -860,7 +1109,15 @@ def attitude_evaluation_node(state: WorkflowState) -> WorkflowState:
         }
 
 
-def qa_relevance_evaluation_node(state: WorkflowState) -> WorkflowState:
+def attitude_evaluation_node(state: WorkflowState) -> WorkflowState:
+    return run_steps(_attitude_evaluation_steps(state))
+
+
+async def attitude_evaluation_node_async(state: WorkflowState) -> WorkflowState:
+    return await run_steps_async(_attitude_evaluation_steps(state))
+
+
+def _qa_relevance_evaluation_steps(state: WorkflowState) -> NodeSteps:
     """
     Agent 2: Evaluate relevance between questions and answers.
     Maps: question_1 ↔ Voice_1, question_2 ↔ Voice_2, question_3 ↔ Voice_3
@@ -930,9 +1187,7 @@ def qa_relevance_evaluation_node(state: WorkflowState) -> WorkflowState:
 """
 
         # Call OpenAI for evaluation
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        evaluation_text = get_text_response(
-            client,
+        evaluation_text = yield LLMCall(
             model="gpt-5.1",
             messages=[
                 {"role": "system", "content": "당신은 면접 평가 전문가입니다. 질문과 답변의 연관성을 객관적으로 평가합니다."},
@@ -973,7 +1228,15 @@ def qa_relevance_evaluation_node(state: WorkflowState) -> WorkflowState:
         }
 
 
-def consistency_evaluation_node(state: WorkflowState) -> WorkflowState:
+def qa_relevance_evaluation_node(state: WorkflowState) -> WorkflowState:
+    return run_steps(_qa_relevance_evaluation_steps(state))
+
+
+async def qa_relevance_evaluation_node_async(state: WorkflowState) -> WorkflowState:
+    return await run_steps_async(_qa_relevance_evaluation_steps(state))
+
+
+def _consistency_evaluation_steps(state: WorkflowState) -> NodeSteps:
     """
     Agent 3: Evaluate consistency between introduce/portfolio and all voice answers.
     Checks for truthfulness and consistency across documents.
@@ -1057,9 +1320,7 @@ def consistency_evaluation_node(state: WorkflowState) -> WorkflowState:
 """
 
         # Call OpenAI for evaluation
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        evaluation_text = get_text_response(
-            client,
+        evaluation_text = yield LLMCall(
             model="gpt-5.1",
             messages=[
                 {"role": "system", "content": "당신은 면접 평가 전문가입니다. 제출 문서와 면접 답변의 일관성을 객관적으로 평가합니다."},
@@ -1100,7 +1361,15 @@ def consistency_evaluation_node(state: WorkflowState) -> WorkflowState:
         }
 
 
-def portfolio_development_node(state: WorkflowState) -> WorkflowState:
+def consistency_evaluation_node(state: WorkflowState) -> WorkflowState:
+    return run_steps(_consistency_evaluation_steps(state))
+
+
+async def consistency_evaluation_node_async(state: WorkflowState) -> WorkflowState:
+    return await run_steps_async(_consistency_evaluation_steps(state))
+
+
+def _portfolio_development_steps(state: WorkflowState) -> NodeSteps:
     """Provide document feedback and suggest programs to strengthen the portfolio."""
     session_id = state["session_id"]
     output_dir = BASE_DIR / "outputs"
@@ -1130,25 +1399,25 @@ def portfolio_development_node(state: WorkflowState) -> WorkflowState:
             )
         )
 
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
     # Build search queries from the candidate's materials and fetch web snippets
     search_queries: list[str] = []
     search_results_text = ""
     search_results_path: Optional[Path] = output_dir / "Portfolio_Search_Results.txt"
     try:
-        search_queries = generate_search_queries_from_context(
-            client,
+        search_queries = yield from _search_query_steps(
             model="gpt-5.1",
             context=(
                 f"{introduce_text}\n\n{portfolio_text}\n\n"
                 + "\n".join(voice_texts)
             ),
         )
-        _, search_results_text = run_duckduckgo_search(
-            queries=search_queries,
-            per_query=3,
-            max_chars=2400,
+        _, search_results_text = yield BlockingCall(
+            partial(
+                run_duckduckgo_search,
+                queries=search_queries,
+                per_query=3,
+                max_chars=2400,
+            )
         )
         if search_results_text:
             search_results_path.write_text(search_results_text, encoding="utf-8")
@@ -1205,8 +1474,7 @@ def portfolio_development_node(state: WorkflowState) -> WorkflowState:
 """
 
     try:
-        report_markdown = get_text_response(
-            client,
+        report_markdown = yield LLMCall(
             model="gpt-5.1",
             messages=[
                 {
@@ -1245,7 +1513,15 @@ def portfolio_development_node(state: WorkflowState) -> WorkflowState:
         }
 
 
-def insight_dashboard_node(state: WorkflowState) -> WorkflowState:
+def portfolio_development_node(state: WorkflowState) -> WorkflowState:
+    return run_steps(_portfolio_development_steps(state))
+
+
+async def portfolio_development_node_async(state: WorkflowState) -> WorkflowState:
+    return await run_steps_async(_portfolio_development_steps(state))
+
+
+def _insight_dashboard_steps(state: WorkflowState) -> NodeSteps:
     """Combine Markdown reports into a single interactive HTML dashboard."""
     session_id = state["session_id"]
     output_dir = BASE_DIR / "outputs"
@@ -1276,8 +1552,6 @@ def insight_dashboard_node(state: WorkflowState) -> WorkflowState:
 
     import json
 
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
     prompt = f"""당신은 프론트엔드 디자이너 겸 커리어 코치 요약가입니다.
 단일 HTML 페이지를 만들어, 면접 평가/포트폴리오 리포트/웹 검색 인사이트를 합쳐
 사용자 맞춤 로드맵을 제시하세요.
@@ -1307,8 +1581,7 @@ def insight_dashboard_node(state: WorkflowState) -> WorkflowState:
 {', '.join(search_queries) if search_queries else "(없음)"}
 """
 
-    html = get_text_response(
-        client,
+    html = yield LLMCall(
         model="gpt-5.1",
         messages=[
             {
@@ -1334,7 +1607,15 @@ def insight_dashboard_node(state: WorkflowState) -> WorkflowState:
     }
 
 
-def debate_node(state: WorkflowState) -> WorkflowState:
+def insight_dashboard_node(state: WorkflowState) -> WorkflowState:
+    return run_steps(_insight_dashboard_steps(state))
+
+
+async def insight_dashboard_node_async(state: WorkflowState) -> WorkflowState:
+    return await run_steps_async(_insight_dashboard_steps(state))
+
+
+def _debate_steps(state: WorkflowState) -> NodeSteps:
     """
     Multi-Agent Debate: 3 evaluation agents debate to reach final consensus.
     - Attitude Agent
@@ -1372,8 +1653,6 @@ def debate_node(state: WorkflowState) -> WorkflowState:
         debate_log.append("=" * 80)
         debate_log.append("")
 
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
         # Round 1: Initial Presentations
         debate_log.append("=" * 80)
         debate_log.append("ROUND 1: INITIAL EVALUATIONS")
@@ -1398,44 +1677,43 @@ def debate_node(state: WorkflowState) -> WorkflowState:
         debate_log.append("=" * 80)
         debate_log.append("")
 
-        # Attitude Agent examines QA Relevance
-        attitude_to_qa = get_text_response(
-            client,
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": "당신은 면접 태도 평가 전문가입니다. 질문-답변 연관성 평가를 검토하고 의견을 제시하세요."},
-                {"role": "user", "content": f"다음은 질문-답변 연관성 평가입니다:\n\n{qa_eval}\n\n면접 태도 관점에서 이 평가에 대한 의견을 2-3문장으로 제시하세요."},
-            ],
-            temperature=0.7,
-        )
+        attitude_to_qa, qa_to_consistency, consistency_to_attitude = yield [
+            # Attitude Agent examines QA Relevance
+            LLMCall(
+                model="gpt-5.1",
+                messages=[
+                    {"role": "system", "content": "당신은 면접 태도 평가 전문가입니다. 질문-답변 연관성 평가를 검토하고 의견을 제시하세요."},
+                    {"role": "user", "content": f"다음은 질문-답변 연관성 평가입니다:\n\n{qa_eval}\n\n면접 태도 관점에서 이 평가에 대한 의견을 2-3문장으로 제시하세요."},
+                ],
+                temperature=0.7,
+            ),
+            # QA Relevance Agent examines Consistency
+            LLMCall(
+                model="gpt-5.1",
+                messages=[
+                    {"role": "system", "content": "당신은 질문-답변 연관성 평가 전문가입니다. 일관성 평가를 검토하고 의견을 제시하세요."},
+                    {"role": "user", "content": f"다음은 일관성 평가입니다:\n\n{consistency_eval}\n\n질문-답변 연관성 관점에서 이 평가에 대한 의견을 2-3문장으로 제시하세요."},
+                ],
+                temperature=0.7,
+            ),
+            # Consistency Agent examines Attitude
+            LLMCall(
+                model="gpt-5.1",
+                messages=[
+                    {"role": "system", "content": "당신은 일관성 평가 전문가입니다. 면접 태도 평가를 검토하고 의견을 제시하세요."},
+                    {"role": "user", "content": f"다음은 면접 태도 평가입니다:\n\n{attitude_eval}\n\n일관성 관점에서 이 평가에 대한 의견을 2-3문장으로 제시하세요."},
+                ],
+                temperature=0.7,
+            ),
+        ]
         debate_log.append("[Attitude Agent → QA Relevance Agent]")
         debate_log.append(attitude_to_qa)
         debate_log.append("")
 
-        # QA Relevance Agent examines Consistency
-        qa_to_consistency = get_text_response(
-            client,
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": "당신은 질문-답변 연관성 평가 전문가입니다. 일관성 평가를 검토하고 의견을 제시하세요."},
-                {"role": "user", "content": f"다음은 일관성 평가입니다:\n\n{consistency_eval}\n\n질문-답변 연관성 관점에서 이 평가에 대한 의견을 2-3문장으로 제시하세요."},
-            ],
-            temperature=0.7,
-        )
         debate_log.append("[QA Relevance Agent → Consistency Agent]")
         debate_log.append(qa_to_consistency)
         debate_log.append("")
 
-        # Consistency Agent examines Attitude
-        consistency_to_attitude = get_text_response(
-            client,
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": "당신은 일관성 평가 전문가입니다. 면접 태도 평가를 검토하고 의견을 제시하세요."},
-                {"role": "user", "content": f"다음은 면접 태도 평가입니다:\n\n{attitude_eval}\n\n일관성 관점에서 이 평가에 대한 의견을 2-3문장으로 제시하세요."},
-            ],
-            temperature=0.7,
-        )
         debate_log.append("[Consistency Agent → Attitude Agent]")
         debate_log.append(consistency_to_attitude)
         debate_log.append("")
@@ -1446,44 +1724,43 @@ def debate_node(state: WorkflowState) -> WorkflowState:
         debate_log.append("=" * 80)
         debate_log.append("")
 
-        # Attitude Agent's rebuttal
-        attitude_rebuttal = get_text_response(
-            client,
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": "당신은 면접 태도 평가 전문가입니다."},
-                {"role": "user", "content": f"Consistency Agent가 다음과 같이 의견을 제시했습니다:\n\n{consistency_to_attitude}\n\n이에 대한 당신의 반박 또는 추가 의견을 2-3문장으로 제시하세요."},
-            ],
-            temperature=0.7,
-        )
+        attitude_rebuttal, qa_rebuttal, consistency_rebuttal = yield [
+            # Attitude Agent's rebuttal
+            LLMCall(
+                model="gpt-5.1",
+                messages=[
+                    {"role": "system", "content": "당신은 면접 태도 평가 전문가입니다."},
+                    {"role": "user", "content": f"Consistency Agent가 다음과 같이 의견을 제시했습니다:\n\n{consistency_to_attitude}\n\n이에 대한 당신의 반박 또는 추가 의견을 2-3문장으로 제시하세요."},
+                ],
+                temperature=0.7,
+            ),
+            # QA Agent's rebuttal
+            LLMCall(
+                model="gpt-5.1",
+                messages=[
+                    {"role": "system", "content": "당신은 질문-답변 연관성 평가 전문가입니다."},
+                    {"role": "user", "content": f"Attitude Agent가 다음과 같이 의견을 제시했습니다:\n\n{attitude_to_qa}\n\n이에 대한 당신의 반박 또는 추가 의견을 2-3문장으로 제시하세요."},
+                ],
+                temperature=0.7,
+            ),
+            # Consistency Agent's rebuttal
+            LLMCall(
+                model="gpt-5.1",
+                messages=[
+                    {"role": "system", "content": "당신은 일관성 평가 전문가입니다."},
+                    {"role": "user", "content": f"QA Relevance Agent가 다음과 같이 의견을 제시했습니다:\n\n{qa_to_consistency}\n\n이에 대한 당신의 반박 또는 추가 의견을 2-3문장으로 제시하세요."},
+                ],
+                temperature=0.7,
+            ),
+        ]
         debate_log.append("[Attitude Agent - Rebuttal]")
         debate_log.append(attitude_rebuttal)
         debate_log.append("")
 
-        # QA Agent's rebuttal
-        qa_rebuttal = get_text_response(
-            client,
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": "당신은 질문-답변 연관성 평가 전문가입니다."},
-                {"role": "user", "content": f"Attitude Agent가 다음과 같이 의견을 제시했습니다:\n\n{attitude_to_qa}\n\n이에 대한 당신의 반박 또는 추가 의견을 2-3문장으로 제시하세요."},
-            ],
-            temperature=0.7,
-        )
         debate_log.append("[QA Relevance Agent - Rebuttal]")
         debate_log.append(qa_rebuttal)
         debate_log.append("")
 
-        # Consistency Agent's rebuttal
-        consistency_rebuttal = get_text_response(
-            client,
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": "당신은 일관성 평가 전문가입니다."},
-                {"role": "user", "content": f"QA Relevance Agent가 다음과 같이 의견을 제시했습니다:\n\n{qa_to_consistency}\n\n이에 대한 당신의 반박 또는 추가 의견을 2-3문장으로 제시하세요."},
-            ],
-            temperature=0.7,
-        )
         debate_log.append("[Consistency Agent - Rebuttal]")
         debate_log.append(consistency_rebuttal)
         debate_log.append("")
@@ -1494,33 +1771,32 @@ def debate_node(state: WorkflowState) -> WorkflowState:
         debate_log.append("=" * 80)
         debate_log.append("")
 
-        attitude_criteria = get_text_response(
-            client,
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": "당신은 면접 태도 평가 전문가입니다. 자신의 평가 기준을 객관적으로 명시하세요."},
-                {"role": "user", "content": f"당신의 초기 평가:\n{attitude_eval}\n\n당신의 기준을 명확히 3-4개로 제시하세요."},
-            ],
-            temperature=0.6,
-        )
-        qa_criteria = get_text_response(
-            client,
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": "당신은 질문-답변 연관성 평가 전문가입니다. 자신의 평가 기준을 객관적으로 명시하세요."},
-                {"role": "user", "content": f"당신의 초기 평가:\n{qa_eval}\n\n당신의 기준을 명확히 3-4개로 제시하세요."},
-            ],
-            temperature=0.6,
-        )
-        consistency_criteria = get_text_response(
-            client,
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": "당신은 일관성 평가 전문가입니다. 자신의 평가 기준을 객관적으로 명시하세요."},
-                {"role": "user", "content": f"당신의 초기 평가:\n{consistency_eval}\n\n당신의 기준을 명확히 3-4개로 제시하세요."},
-            ],
-            temperature=0.6,
-        )
+        attitude_criteria, qa_criteria, consistency_criteria = yield [
+            LLMCall(
+                model="gpt-5.1",
+                messages=[
+                    {"role": "system", "content": "당신은 면접 태도 평가 전문가입니다. 자신의 평가 기준을 객관적으로 명시하세요."},
+                    {"role": "user", "content": f"당신의 초기 평가:\n{attitude_eval}\n\n당신의 기준을 명확히 3-4개로 제시하세요."},
+                ],
+                temperature=0.6,
+            ),
+            LLMCall(
+                model="gpt-5.1",
+                messages=[
+                    {"role": "system", "content": "당신은 질문-답변 연관성 평가 전문가입니다. 자신의 평가 기준을 객관적으로 명시하세요."},
+                    {"role": "user", "content": f"당신의 초기 평가:\n{qa_eval}\n\n당신의 기준을 명확히 3-4개로 제시하세요."},
+                ],
+                temperature=0.6,
+            ),
+            LLMCall(
+                model="gpt-5.1",
+                messages=[
+                    {"role": "system", "content": "당신은 일관성 평가 전문가입니다. 자신의 평가 기준을 객관적으로 명시하세요."},
+                    {"role": "user", "content": f"당신의 초기 평가:\n{consistency_eval}\n\n당신의 기준을 명확히 3-4개로 제시하세요."},
+                ],
+                temperature=0.6,
+            ),
+        ]
         debate_log.append("[Attitude Agent - Criteria]")
         debate_log.append(attitude_criteria)
         debate_log.append("")
@@ -1537,33 +1813,32 @@ def debate_node(state: WorkflowState) -> WorkflowState:
         debate_log.append("=" * 80)
         debate_log.append("")
 
-        attitude_gap = get_text_response(
-            client,
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": "당신은 면접 태도 평가 전문가입니다. 다른 에이전트 평가의 증거/갭을 짧게 지적하세요."},
-                {"role": "user", "content": f"QA 평가: {qa_eval}\n일관성 평가: {consistency_eval}\n증거 부족이나 보완 필요 지점을 2-3줄로 지적하세요."},
-            ],
-            temperature=0.6,
-        )
-        qa_gap = get_text_response(
-            client,
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": "당신은 질문-답변 연관성 평가 전문가입니다. 다른 에이전트 평가의 증거/갭을 짧게 지적하세요."},
-                {"role": "user", "content": f"태도 평가: {attitude_eval}\n일관성 평가: {consistency_eval}\n증거 부족이나 보완 필요 지점을 2-3줄로 지적하세요."},
-            ],
-            temperature=0.6,
-        )
-        consistency_gap = get_text_response(
-            client,
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": "당신은 일관성 평가 전문가입니다. 다른 에이전트 평가의 증거/갭을 짧게 지적하세요."},
-                {"role": "user", "content": f"태도 평가: {attitude_eval}\nQA 평가: {qa_eval}\n증거 부족이나 보완 필요 지점을 2-3줄로 지적하세요."},
-            ],
-            temperature=0.6,
-        )
+        attitude_gap, qa_gap, consistency_gap = yield [
+            LLMCall(
+                model="gpt-5.1",
+                messages=[
+                    {"role": "system", "content": "당신은 면접 태도 평가 전문가입니다. 다른 에이전트 평가의 증거/갭을 짧게 지적하세요."},
+                    {"role": "user", "content": f"QA 평가: {qa_eval}\n일관성 평가: {consistency_eval}\n증거 부족이나 보완 필요 지점을 2-3줄로 지적하세요."},
+                ],
+                temperature=0.6,
+            ),
+            LLMCall(
+                model="gpt-5.1",
+                messages=[
+                    {"role": "system", "content": "당신은 질문-답변 연관성 평가 전문가입니다. 다른 에이전트 평가의 증거/갭을 짧게 지적하세요."},
+                    {"role": "user", "content": f"태도 평가: {attitude_eval}\n일관성 평가: {consistency_eval}\n증거 부족이나 보완 필요 지점을 2-3줄로 지적하세요."},
+                ],
+                temperature=0.6,
+            ),
+            LLMCall(
+                model="gpt-5.1",
+                messages=[
+                    {"role": "system", "content": "당신은 일관성 평가 전문가입니다. 다른 에이전트 평가의 증거/갭을 짧게 지적하세요."},
+                    {"role": "user", "content": f"태도 평가: {attitude_eval}\nQA 평가: {qa_eval}\n증거 부족이나 보완 필요 지점을 2-3줄로 지적하세요."},
+                ],
+                temperature=0.6,
+            ),
+        ]
         debate_log.append("[Attitude Agent - Evidence Gaps]")
         debate_log.append(attitude_gap)
         debate_log.append("")
@@ -1580,33 +1855,32 @@ def debate_node(state: WorkflowState) -> WorkflowState:
         debate_log.append("=" * 80)
         debate_log.append("")
 
-        attitude_closing = get_text_response(
-            client,
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": "당신은 면접 태도 평가 전문가입니다. 최종 입장을 2-3문장으로 명확히 하세요."},
-                {"role": "user", "content": f"초기 평가: {attitude_eval}\n교차검토: {attitude_to_qa}\n반박: {attitude_rebuttal}\n기준: {attitude_criteria}\n증거/갭 지적: {attitude_gap}\n\n최종 입장을 2-3문장으로 압축하세요."},
-            ],
-            temperature=0.5,
-        )
-        qa_closing = get_text_response(
-            client,
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": "당신은 질문-답변 연관성 평가 전문가입니다. 최종 입장을 2-3문장으로 명확히 하세요."},
-                {"role": "user", "content": f"초기 평가: {qa_eval}\n교차검토: {qa_to_consistency}\n반박: {qa_rebuttal}\n기준: {qa_criteria}\n증거/갭 지적: {qa_gap}\n\n최종 입장을 2-3문장으로 압축하세요."},
-            ],
-            temperature=0.5,
-        )
-        consistency_closing = get_text_response(
-            client,
-            model="gpt-5.1",
-            messages=[
-                {"role": "system", "content": "당신은 일관성 평가 전문가입니다. 최종 입장을 2-3문장으로 명확히 하세요."},
-                {"role": "user", "content": f"초기 평가: {consistency_eval}\n교차검토: {consistency_to_attitude}\n반박: {consistency_rebuttal}\n기준: {consistency_criteria}\n증거/갭 지적: {consistency_gap}\n\n최종 입장을 2-3문장으로 압축하세요."},
-            ],
-            temperature=0.5,
-        )
+        attitude_closing, qa_closing, consistency_closing = yield [
+            LLMCall(
+                model="gpt-5.1",
+                messages=[
+                    {"role": "system", "content": "당신은 면접 태도 평가 전문가입니다. 최종 입장을 2-3문장으로 명확히 하세요."},
+                    {"role": "user", "content": f"초기 평가: {attitude_eval}\n교차검토: {attitude_to_qa}\n반박: {attitude_rebuttal}\n기준: {attitude_criteria}\n증거/갭 지적: {attitude_gap}\n\n최종 입장을 2-3문장으로 압축하세요."},
+                ],
+                temperature=0.5,
+            ),
+            LLMCall(
+                model="gpt-5.1",
+                messages=[
+                    {"role": "system", "content": "당신은 질문-답변 연관성 평가 전문가입니다. 최종 입장을 2-3문장으로 명확히 하세요."},
+                    {"role": "user", "content": f"초기 평가: {qa_eval}\n교차검토: {qa_to_consistency}\n반박: {qa_rebuttal}\n기준: {qa_criteria}\n증거/갭 지적: {qa_gap}\n\n최종 입장을 2-3문장으로 압축하세요."},
+                ],
+                temperature=0.5,
+            ),
+            LLMCall(
+                model="gpt-5.1",
+                messages=[
+                    {"role": "system", "content": "당신은 일관성 평가 전문가입니다. 최종 입장을 2-3문장으로 명확히 하세요."},
+                    {"role": "user", "content": f"초기 평가: {consistency_eval}\n교차검토: {consistency_to_attitude}\n반박: {consistency_rebuttal}\n기준: {consistency_criteria}\n증거/갭 지적: {consistency_gap}\n\n최종 입장을 2-3문장으로 압축하세요."},
+                ],
+                temperature=0.5,
+            ),
+        ]
         debate_log.append("[Attitude Agent - Closing]")
         debate_log.append(attitude_closing)
         debate_log.append("")
@@ -1696,8 +1970,7 @@ def debate_node(state: WorkflowState) -> WorkflowState:
 **중요**: 각 섹션은 정확히 5개 항목이어야 하며, 구체적이고 실질적인 내용이어야 합니다.
 """
 
-        final_consensus = get_text_response(
-            client,
+        final_consensus = yield LLMCall(
             model="gpt-5.1",
             messages=[
                 {"role": "system", "content": "당신은 면접 평가 종합 중재자입니다. 여러 전문가의 의견을 균형있게 종합하여 Markdown 형식으로 작성합니다."},
@@ -1737,6 +2010,14 @@ def debate_node(state: WorkflowState) -> WorkflowState:
         }
 
 
+def debate_node(state: WorkflowState) -> WorkflowState:
+    return run_steps(_debate_steps(state))
+
+
+async def debate_node_async(state: WorkflowState) -> WorkflowState:
+    return await run_steps_async(_debate_steps(state))
+
+
 def complete_node(state: WorkflowState) -> WorkflowState:
     """Mark workflow as completed."""
     session_id = state["session_id"]
@@ -1780,42 +2061,47 @@ def check_evaluations_complete_node(state: WorkflowState) -> WorkflowState:
     }
 
 
-def build_workflow() -> StateGraph:
-    """Build the interview analysis workflow graph with 3 parallel analyses per type + multi-agent evaluations."""
+def build_workflow(asynchronous: bool = False) -> StateGraph:
+    """Build the interview analysis workflow graph with 3 parallel analyses per type + multi-agent evaluations.
+
+    With asynchronous=True the service and LLM nodes are their async variants,
+    which must run under ainvoke()/astream() (as the LangGraph API server does).
+    """
     graph = StateGraph(WorkflowState)
+    a = asynchronous
 
     # Add nodes
-    graph.add_node("pdf_extract", pdf_extract_node)
-    graph.add_node("question_generate", question_generate_node)
+    graph.add_node("pdf_extract", pdf_extract_node_async if a else pdf_extract_node)
+    graph.add_node("question_generate", question_generate_node_async if a else question_generate_node)
     graph.add_node("wait_for_upload", wait_for_upload_node)
 
     # Add 3 face analysis nodes (one per question)
     for i in range(3):
-        graph.add_node(f"face_analysis_{i+1}", _create_face_analysis_node(i))
+        graph.add_node(f"face_analysis_{i+1}", _create_face_analysis_node(i, asynchronous=a))
 
     # Add 3 voice analysis nodes (one per question)
     for i in range(3):
-        graph.add_node(f"voice_analysis_{i+1}", _create_voice_analysis_node(i))
+        graph.add_node(f"voice_analysis_{i+1}", _create_voice_analysis_node(i, asynchronous=a))
 
     # Add check node to verify all analyses are complete
     graph.add_node("check_analyses_complete", check_analyses_complete_node)
 
     # Add document feedback agent (runs alongside evaluations, no debate)
-    graph.add_node("portfolio_development", portfolio_development_node)
+    graph.add_node("portfolio_development", portfolio_development_node_async if a else portfolio_development_node)
 
     # Add 3 multi-agent evaluation nodes
-    graph.add_node("attitude_evaluation", attitude_evaluation_node)
-    graph.add_node("qa_relevance_evaluation", qa_relevance_evaluation_node)
-    graph.add_node("consistency_evaluation", consistency_evaluation_node)
+    graph.add_node("attitude_evaluation", attitude_evaluation_node_async if a else attitude_evaluation_node)
+    graph.add_node("qa_relevance_evaluation", qa_relevance_evaluation_node_async if a else qa_relevance_evaluation_node)
+    graph.add_node("consistency_evaluation", consistency_evaluation_node_async if a else consistency_evaluation_node)
 
     # Add check node to verify all evaluations are complete
     graph.add_node("check_evaluations_complete", check_evaluations_complete_node)
 
     # Add debate node where 3 agents debate
-    graph.add_node("debate", debate_node)
+    graph.add_node("debate", debate_node_async if a else debate_node)
 
     # Add dashboard builder to merge reports into HTML
-    graph.add_node("insight_dashboard", insight_dashboard_node)
+    graph.add_node("insight_dashboard", insight_dashboard_node_async if a else insight_dashboard_node)
 
     graph.add_node("complete", complete_node)
 
@@ -1866,6 +2152,10 @@ def build_workflow() -> StateGraph:
 # Only interrupt once - parallel nodes will all execute after resume
 workflow = build_workflow().compile(interrupt_after=["wait_for_upload"])
 
+# Same graph with async nodes: many concurrent sessions share one event loop
+# instead of each parallel node holding a worker thread while it waits.
+async_workflow = build_workflow(asynchronous=True).compile(interrupt_after=["wait_for_upload"])
+
 
 def run_workflow(session_id: str, pdf_path: str) -> Dict[str, Any]:
     """Run the workflow for a session."""
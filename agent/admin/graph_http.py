@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from fastapi import FastAPI
+
+# Same import path as graph.py, so these routes see the graph's client pools.
+try:
+    from admin.service_clients import aclose_service_clients, close_service_clients, service_pool_stats
+except ModuleNotFoundError:
+    from service_clients import aclose_service_clients, close_service_clients, service_pool_stats
+
+# Mounted next to the graph by the LangGraph API server (langgraph.json "http.app").
+app = FastAPI(title="Interview Analysis Graph Routes")
+
+
+@app.get("/service_pools")
+def service_pools() -> Dict[str, Any]:
+    """Keep-alive pool metrics for each downstream service the graph calls."""
+    return service_pool_stats()
+
+
+@app.on_event("shutdown")
+async def close_pools() -> None:
+    close_service_clients()
+    await aclose_service_clients()
@@ -13,7 +13,9 @@ from session_manager import SessionStatus, session_manager
 
 # LangGraph API URL
 LANGGRAPH_API_URL = os.getenv("LANGGRAPH_API_URL", "http://localhost:2024")
-GRAPH_NAME = "interview_analysis"
+# "interview_analysis_async" runs the same workflow with async nodes
+GRAPH_NAME = os.getenv("LANGGRAPH_GRAPH_NAME", "interview_analysis")
+QUESTION_GEN_URL = os.getenv("QUESTION_GEN_URL", "http://localhost:8002")
 
 app = FastAPI(title="Interview Analysis Admin Service", version="1.0.0")
 
@@ -34,6 +36,7 @@ class StatusResponse(BaseModel):
     pdf_path: str
     video_paths: list[str] = []
     audio_paths: list[str] = []
+    voice_stream_ids: list[str] = []
     video_path: Optional[str] = None  # Legacy
     audio_path: Optional[str] = None  # Legacy
     questions: Optional[list[Any]]
@@ -49,6 +52,7 @@ class UploadResponse(BaseModel):
     session_id: str
     video_paths: list[str] = []
     audio_paths: list[str] = []
+    voice_stream_ids: list[str] = []
     message: str
 
 
@@ -67,6 +71,8 @@ async def start_workflow(req: StartRequest) -> StartResponse:
         # Create session
         session = session_manager.create_session(pdf_path=pdf_path)
 
+        # Start the company/role search now so it overlaps with PDF extraction
+        asyncio.create_task(_prefetch_question_search(session.session_id))
         # Run workflow in background
         asyncio.create_task(_run_workflow_async(session.session_id, pdf_path))
 
@@ -79,6 +85,17 @@ async def start_workflow(req: StartRequest) -> StartResponse:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+async def _prefetch_question_search(session_id: str) -> None:
+    """Ask the question generator to start this session's search; question_generate_node claims it."""
+    try:
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            response = await client.post(f"{QUESTION_GEN_URL}/prefetch", json={"session_id": session_id})
+            response.raise_for_status()
+    except Exception as e:
+        # Best effort: without a prefetch, /generate searches as before.
+        print(f"[PREFETCH] Search prefetch failed for session {session_id}: {e}")
+
+
 async def _run_workflow_async(session_id: str, pdf_path: str):
     """Run workflow asynchronously using LangGraph API."""
     try:
@@ -127,6 +144,7 @@ def get_status(session_id: str) -> StatusResponse:
         pdf_path=session.pdf_path,
         video_paths=session.video_paths,
         audio_paths=session.audio_paths,
+        voice_stream_ids=session.voice_stream_ids,
         video_path=session.video_path,  # Legacy
         audio_path=session.audio_path,  # Legacy
         questions=session.questions,
@@ -148,9 +166,19 @@ async def upload_files(
     audio_1: Optional[UploadFile] = File(None),
     audio_2: Optional[UploadFile] = File(None),
     audio_3: Optional[UploadFile] = File(None),
+    voice_stream_1: Optional[str] = Form(None),
+    voice_stream_2: Optional[str] = Form(None),
+    voice_stream_3: Optional[str] = Form(None),
     upload_dir: str = Form("/app/uploads"),
 ) -> UploadResponse:
-    """Upload 3 video and 3 audio files for analysis (one per question)."""
+    """Upload 3 video and 3 audio files for analysis (one per question).
+
+    `audio_{i}` is optional when `video_{i}` is uploaded: the voice analysis then
+    reads the audio track from the video file, so one file per answer is enough.
+
+    Instead of an audio file, a finished Voice_Analysis stream id
+    (`/ws/stream/{stream_id}`) can be attached per question via `voice_stream_{i}`.
+    """
     session = session_manager.get_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail=f"Session not found: {session_id}")
@@ -182,7 +210,10 @@ async def upload_files(
 
         # Save 3 audio files
         for i, audio in enumerate([audio_1, audio_2, audio_3], start=1):
-            if audio:
+            if not audio and video_paths[i - 1]:
+                # Single-file upload: Voice_Analysis decodes the video's audio track directly
+                audio_paths.append(video_paths[i - 1])
+            elif audio:
                 audio_filename = f"{session_id}_audio_{i}{Path(audio.filename or f'audio_{i}.wav').suffix}"
                 audio_file_path = upload_path / audio_filename
                 with audio_file_path.open("wb") as f:
@@ -192,9 +223,16 @@ async def upload_files(
             else:
                 audio_paths.append("")  # Empty string for missing files
 
+        # Attached live-transcription streams (empty string when not used)
+        voice_stream_ids = [
+            (stream_id or "").strip()
+            for stream_id in (voice_stream_1, voice_stream_2, voice_stream_3)
+        ]
+
         # Update session with file paths
         session.video_paths = video_paths
         session.audio_paths = audio_paths
+        session.voice_stream_ids = voice_stream_ids
         # Update legacy fields for backward compatibility (use first file)
         session.video_path = video_paths[0] if video_paths else None
         session.audio_path = audio_paths[0] if audio_paths else None
@@ -204,22 +242,31 @@ async def upload_files(
             status=SessionStatus.FILES_UPLOADED,
             video_paths=video_paths,
             audio_paths=audio_paths,
+            voice_stream_ids=voice_stream_ids,
         )
 
         # Continue workflow from interrupt point
-        asyncio.create_task(_continue_workflow_async(session_id, video_paths, audio_paths))
+        asyncio.create_task(
+            _continue_workflow_async(session_id, video_paths, audio_paths, voice_stream_ids)
+        )
 
         return UploadResponse(
             session_id=session_id,
             video_paths=video_paths,
             audio_paths=audio_paths,
+            voice_stream_ids=voice_stream_ids,
             message="Files uploaded successfully. Analysis will continue automatically.",
         )
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
-async def _continue_workflow_async(session_id: str, video_paths: list[str], audio_paths: list[str]):
+async def _continue_workflow_async(
+    session_id: str,
+    video_paths: list[str],
+    audio_paths: list[str],
+    voice_stream_ids: Optional[list[str]] = None,
+):
     """Continue workflow after file upload using LangGraph API."""
     try:
         async with httpx.AsyncClient(timeout=300.0) as client:
@@ -230,6 +277,7 @@ async def _continue_workflow_async(session_id: str, video_paths: list[str], audi
                     "values": {
                         "video_paths": video_paths,
                         "audio_paths": audio_paths,
+                        "voice_stream_ids": voice_stream_ids or [],
                         "face_results": [],
                         "voice_results": [],
                         "face_analysis_complete_count": 0,
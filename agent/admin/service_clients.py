@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+# Downstream services and how long a request to each may take (analysis calls run for minutes).
+PDF_READER_URL = os.getenv("PDF_READER_URL", "http://localhost:8001")
+QUESTION_GEN_URL = os.getenv("QUESTION_GEN_URL", "http://localhost:8002")
+FACE_ANALYSIS_URL = os.getenv("FACE_ANALYSIS_URL", "http://localhost:8003")
+VOICE_ANALYSIS_URL = os.getenv("VOICE_ANALYSIS_URL", "http://localhost:8004")
+
+# Pool settings shared by every service client.
+SERVICE_MAX_CONNECTIONS = int(os.getenv("SERVICE_MAX_CONNECTIONS", "20"))
+SERVICE_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("SERVICE_MAX_KEEPALIVE_CONNECTIONS", "10"))
+SERVICE_KEEPALIVE_EXPIRY = float(os.getenv("SERVICE_KEEPALIVE_EXPIRY", "60"))
+SERVICE_CONNECT_TIMEOUT = float(os.getenv("SERVICE_CONNECT_TIMEOUT", "5"))
+# HTTP/2 needs the `h2` package (pip install "httpx[http2]") and a server that speaks it;
+# the bundled uvicorn services only speak HTTP/1.1, so it is off by default.
+SERVICE_HTTP2 = os.getenv("SERVICE_HTTP2", "").lower() in {"1", "true", "yes", "on"}
+
+
+@dataclass(frozen=True)
+class ServiceConfig:
+    base_url: str
+    timeout: float  # read/write/pool timeout per request, in seconds
+
+
+SERVICES: Dict[str, ServiceConfig] = {
+    "pdf_reader": ServiceConfig(PDF_READER_URL, float(os.getenv("PDF_READER_TIMEOUT", "60"))),
+    "question_generator": ServiceConfig(QUESTION_GEN_URL, float(os.getenv("QUESTION_GEN_TIMEOUT", "60"))),
+    "face_analysis": ServiceConfig(FACE_ANALYSIS_URL, float(os.getenv("FACE_ANALYSIS_TIMEOUT", "300"))),
+    "voice_analysis": ServiceConfig(VOICE_ANALYSIS_URL, float(os.getenv("VOICE_ANALYSIS_TIMEOUT", "300"))),
+}
+
+
+class PoolStats:
+    """
+    Request, connection, and concurrency counters for one service client.
+
+    New TCP connections are counted with httpcore's trace extension; a request
+    that opens none reused a keep-alive connection.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0  # transport failures (connect/timeout), not HTTP error statuses
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.new_connections = 0
+
+    def started(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def finished(self, failed: bool) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if failed:
+                self.errors += 1
+
+    def trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self.new_connections += 1
+
+    async def atrace(self, event_name: str, info: Dict[str, Any]) -> None:
+        # httpcore's async pool awaits its trace callback.
+        self.trace(event_name, info)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            reused = max(0, self.requests - self.new_connections)
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "new_connections": self.new_connections,
+                "reused_connections": reused,
+                "reuse_ratio": round(reused / self.requests, 3) if self.requests else None,
+            }
+
+
+class _MeteredTransport(httpx.HTTPTransport):
+    """HTTPTransport that reports each request into a PoolStats."""
+
+    def __init__(self, stats: PoolStats, http2: bool = False, **kwargs: Any) -> None:
+        super().__init__(http2=http2, **kwargs)
+        self.stats = stats
+        self.http2 = http2
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.extensions["trace"] = self.stats.trace
+        self.stats.started()
+        failed = True
+        try:
+            response = super().handle_request(request)
+            failed = False
+            return response
+        finally:
+            self.stats.finished(failed)
+
+    def connection_counts(self) -> Dict[str, int]:
+        # httpcore's pool is private to the transport; report nothing if its shape changes.
+        connections = list(getattr(getattr(self, "_pool", None), "connections", []) or [])
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {"open_connections": len(connections), "idle_connections": idle}
+
+
+class _AsyncMeteredTransport(httpx.AsyncHTTPTransport):
+    """AsyncHTTPTransport that reports each request into the same PoolStats as the sync client."""
+
+    def __init__(self, stats: PoolStats, http2: bool = False, **kwargs: Any) -> None:
+        super().__init__(http2=http2, **kwargs)
+        self.stats = stats
+        self.http2 = http2
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.extensions["trace"] = self.stats.atrace
+        self.stats.started()
+        failed = True
+        try:
+            response = await super().handle_async_request(request)
+            failed = False
+            return response
+        finally:
+            self.stats.finished(failed)
+
+    connection_counts = _MeteredTransport.connection_counts
+
+
+_CLIENTS: Dict[str, httpx.Client] = {}
+_TRANSPORTS: Dict[str, _MeteredTransport] = {}
+# Async clients are bound to the event loop that created them, so each loop gets its own pool.
+_AsyncPools = Dict[str, Tuple[httpx.AsyncClient, _AsyncMeteredTransport]]
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AsyncPools]" = weakref.WeakKeyDictionary()
+_STATS: Dict[str, PoolStats] = {name: PoolStats() for name in SERVICES}
+_LOCK = threading.Lock()
+
+
+def _http2_enabled() -> bool:
+    if SERVICE_HTTP2 and importlib.util.find_spec("h2") is None:
+        print("[SERVICE POOL] SERVICE_HTTP2 is set but the h2 package is missing; using HTTP/1.1")
+        return False
+    return SERVICE_HTTP2
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=SERVICE_MAX_CONNECTIONS,
+        max_keepalive_connections=SERVICE_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=SERVICE_KEEPALIVE_EXPIRY,
+    )
+
+
+def _timeout(name: str) -> httpx.Timeout:
+    return httpx.Timeout(SERVICES[name].timeout, connect=SERVICE_CONNECT_TIMEOUT)
+
+
+def service_client(name: str) -> httpx.Client:
+    """
+    Return the process-wide keep-alive client for a downstream service, creating it on first use.
+
+    Callers must not close it; use close_service_clients() at shutdown.
+    """
+    client = _CLIENTS.get(name)
+    if client is not None:
+        return client
+    with _LOCK:
+        if name not in _CLIENTS:
+            transport = _MeteredTransport(_STATS[name], http2=_http2_enabled(), limits=_limits())
+            _TRANSPORTS[name] = transport
+            _CLIENTS[name] = httpx.Client(
+                base_url=SERVICES[name].base_url,
+                transport=transport,
+                timeout=_timeout(name),
+            )
+        return _CLIENTS[name]
+
+
+def async_service_client(name: str) -> httpx.AsyncClient:
+    """
+    Return the running event loop's keep-alive async client for a downstream service.
+
+    Same pool settings and counters as service_client(); callers must not close
+    it; use aclose_service_clients() at shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    with _LOCK:
+        clients = _ASYNC_CLIENTS.setdefault(loop, {})
+        if name not in clients:
+            transport = _AsyncMeteredTransport(_STATS[name], http2=_http2_enabled(), limits=_limits())
+            client = httpx.AsyncClient(
+                base_url=SERVICES[name].base_url,
+                transport=transport,
+                timeout=_timeout(name),
+            )
+            clients[name] = (client, transport)
+        return clients[name][0]
+
+
+def close_service_clients() -> None:
+    with _LOCK:
+        for client in _CLIENTS.values():
+            client.close()
+        _CLIENTS.clear()
+        _TRANSPORTS.clear()
+
+
+async def aclose_service_clients() -> None:
+    """Close the running event loop's async clients."""
+    with _LOCK:
+        clients = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), {})
+    for client, _ in clients.values():
+        await client.aclose()
+
+
+def _async_pools() -> List[_AsyncPools]:
+    with _LOCK:
+        return list(_ASYNC_CLIENTS.values())
+
+
+def service_pool_stats(name: Optional[str] = None) -> Dict[str, Any]:
+    """Per-service pool configuration, request/connection counters, and utilization."""
+    names = [name] if name else list(SERVICES)
+    stats: Dict[str, Any] = {}
+    for service in names:
+        snapshot = _STATS[service].snapshot()
+        async_transports = [pools[service][1] for pools in _async_pools() if service in pools]
+        transports = ([_TRANSPORTS[service]] if service in _TRANSPORTS else []) + async_transports
+        counts: Dict[str, int] = {}
+        for transport in transports:
+            for key, value in transport.connection_counts().items():
+                counts[key] = counts.get(key, 0) + value
+        # in_flight is summed over every pool, so compare it with their combined limit.
+        capacity = SERVICE_MAX_CONNECTIONS * max(1, len(transports))
+        stats[service] = {
+            "base_url": SERVICES[service].base_url,
+            "timeout": SERVICES[service].timeout,
+            "initialized": bool(transports),
+            "async_pools": len(async_transports),
+            "http2": transports[0].http2 if transports else None,
+            "max_connections": SERVICE_MAX_CONNECTIONS,
+            "capacity": capacity,
+            **snapshot,
+            **counts,
+            "utilization": round(snapshot["in_flight"] / capacity, 3),
+        }
+    return stats
@@ -43,6 +43,8 @@ class Session:
         # Changed to lists to support 3 files (one per question)
         self.video_paths: list[str] = []
         self.audio_paths: list[str] = []
+        # Live-transcribed voice streams, used instead of audio files when set
+        self.voice_stream_ids: list[str] = []
         # Keep legacy fields for backward compatibility
         self.video_path: Optional[str] = None
         self.audio_path: Optional[str] = None
@@ -63,6 +65,7 @@ class Session:
             "updated_at": self.updated_at.isoformat(),
             "video_paths": self.video_paths,
             "audio_paths": self.audio_paths,
+            "voice_stream_ids": self.voice_stream_ids,
             "video_path": self.video_path,  # Legacy
             "audio_path": self.audio_path,  # Legacy
             "questions": self.questions,